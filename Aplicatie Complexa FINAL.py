@@ -1,109 +1,3232 @@
+import time
+PROCESS_START = time.perf_counter()  # Referință pentru timpul de pornire la rece (include importurile)
 import pandas as pd
+import numpy as np
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta
 import threading
-import time
 import random
 import os
 import math
+import sqlite3
+import tempfile
+import asyncio
+import json
+import base64
+import queue
+import bisect
+import hashlib
+import logging
+import gzip
+from array import array
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+# Diagnostice cu nivel: DEBUG pentru căile fierbinți (tick, desenare, click), INFO pentru evenimente
+log = logging.getLogger("dashboard")
+
+
+class InstrumentTimer:
+    """Context pentru Instrumentation.timer(); măsoară un singur apel"""
+    __slots__ = ('instruments', 'name', 'start_time')
+
+    def __init__(self, instruments, name):
+        self.instruments = instruments
+        self.name = name
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.instruments.record(self.name, (time.perf_counter() - self.start_time) * 1000)
+        return False
+
+
+class NullTimer:
+    """Timer-ul instrumentației dezactivate - nu măsoară nimic"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_TIMER = NullTimer()
+
+
+def timed(name, owner=None):
+    """Decorator de metodă: măsoară apelurile în timer-ul `name` al instrumentației.
+
+    Instrumentația se ia din self.instruments sau, cu owner='dashboard', din
+    self.dashboard.instruments. Dezactivată, costul este un singur test de atribut.
+    """
+    def decorate(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            instruments = (getattr(self, owner) if owner else self).instruments
+            if not instruments.enabled:
+                return method(self, *args, **kwargs)
+            with InstrumentTimer(instruments, name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class Instrumentation:
+    """Timere, contoare și indicatori cu nume pentru căile critice.
+
+    Dezactivată (implicit), timer() întoarce un context gol partajat, iar count()
+    și gauge() ies după un singur test, deci instrumentarea poate rămâne pe căile
+    de desenare. Activată, păstrează pentru fiecare timer numărul de apeluri,
+    totalul, maximul și ultimele `window` durate (pentru p50/p95); contoarele
+    au și rata pe ultimul minut. Profilarea la cerere eșantionează toate firele.
+    """
+
+    def __init__(self, enabled=False, window=256):
+        self.enabled = enabled
+        self.window = window
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.timers = {}    # nume → {'count', 'total_ms', 'max_ms', 'recent': deque}
+        self.counters = {}  # nume → {'total', 'recent': deque(momente)}
+        self.gauges = {}    # nume → ultima valoare
+        self.profiling = False
+        self.profiler = None  # cProfile activ pe firul care l-a pornit
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        log.info(f"📈 Instrumentare {'activată' if enabled else 'dezactivată'}")
+
+    def timer(self, name):
+        return InstrumentTimer(self, name) if self.enabled else NULL_TIMER
+
+    def record(self, name, duration_ms):
+        with self.lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                             'recent': deque(maxlen=self.window)}
+            timer['count'] += 1
+            timer['total_ms'] += duration_ms
+            timer['max_ms'] = max(timer['max_ms'], duration_ms)
+            timer['recent'].append(duration_ms)
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self.lock:
+            counter = self.counters.get(name)
+            if counter is None:
+                counter = self.counters[name] = {'total': 0, 'recent': deque()}
+            counter['total'] += amount
+            counter['recent'].append((now, amount))
+            while counter['recent'] and now - counter['recent'][0][0] > 60:
+                counter['recent'].popleft()
+
+    def gauge(self, name, value):
+        if not self.enabled:
+            return
+        with self.lock:  # snapshot() iterează gauges din alt fir
+            self.gauges[name] = value
+
+    def reset(self):
+        with self.lock:
+            self.timers.clear()
+            self.counters.clear()
+            self.gauges.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        """Starea curentă, serializabilă JSON (pentru panoul de statistici și API)"""
+        now = time.monotonic()
+        with self.lock:
+            timers = {}
+            for name, timer in self.timers.items():
+                recent = sorted(timer['recent'])
+                timers[name] = {
+                    'count': timer['count'],
+                    'mean_ms': timer['total_ms'] / timer['count'],
+                    'p50_ms': recent[len(recent) // 2],
+                    'p95_ms': recent[min(len(recent) - 1, int(len(recent) * 0.95))],
+                    'max_ms': timer['max_ms'],
+                    'last_ms': timer['recent'][-1],
+                }
+            counters = {name: {'total': counter['total'],
+                               'per_minute': sum(amount for moment, amount in counter['recent']
+                                                 if now - moment <= 60)}
+                        for name, counter in self.counters.items()}
+            return {'enabled': self.enabled, 'since': self.started, 'timers': timers,
+                    'counters': counters, 'gauges': dict(self.gauges)}
+
+    def format_report(self):
+        """Snapshot-ul ca text (panoul de statistici)"""
+        stats = self.snapshot()
+        lines = [f"Instrumentare: {'activă' if stats['enabled'] else 'dezactivată'} - "
+                 f"de la {datetime.fromtimestamp(stats['since']):%H:%M:%S}", "",
+                 f"{'Timer':<24}{'apeluri':>9}{'medie':>10}{'p50':>10}{'p95':>10}{'max':>10}  (ms)"]
+        for name, timer in sorted(stats['timers'].items()):
+            lines.append(f"{name:<24}{timer['count']:>9}{timer['mean_ms']:>10.2f}{timer['p50_ms']:>10.2f}"
+                         f"{timer['p95_ms']:>10.2f}{timer['max_ms']:>10.2f}")
+        lines += ["", f"{'Contor':<24}{'total':>9}{'/minut':>10}"]
+        for name, counter in sorted(stats['counters'].items()):
+            lines.append(f"{name:<24}{counter['total']:>9}{counter['per_minute']:>10}")
+        lines += ["", "Indicatori:"]
+        lines += [f"{name:<24}{value:>9}" for name, value in sorted(stats['gauges'].items())]
+        return "\n".join(lines)
+
+    def sample_profile(self, duration=5.0, interval=0.005, top=40):
+        """Profil prin eșantionare: stiva fiecărui fir la fiecare `interval` secunde.
+
+        Spre deosebire de cProfile (doar firul curent, cost pe fiecare apel), vede
+        simultan firul Tk, monitorizarea și persistența, cu cost mic și constant.
+        Returnează raportul text: funcțiile după numărul de eșantioane (proprii și cumulate).
+        """
+        import sys
+        import traceback
+        if self.profiling:
+            raise RuntimeError("O profilare este deja în curs")
+        self.profiling = True
+        try:
+            own_samples = {}
+            total_samples = {}
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            current = threading.get_ident()
+            deadline = time.perf_counter() + duration
+            samples = 0
+            while time.perf_counter() < deadline:
+                for ident, frame in sys._current_frames().items():
+                    if ident == current:
+                        continue
+                    stack = traceback.extract_stack(frame)
+                    if not stack:
+                        continue
+                    thread = thread_names.get(ident, str(ident))
+                    seen = set()
+                    for entry in stack:
+                        key = (thread, f"{os.path.basename(entry.filename)}:{entry.name}")
+                        if key not in seen:
+                            total_samples[key] = total_samples.get(key, 0) + 1
+                            seen.add(key)
+                    last = stack[-1]
+                    key = (thread, f"{os.path.basename(last.filename)}:{last.lineno} {last.name}")
+                    own_samples[key] = own_samples.get(key, 0) + 1
+                samples += 1
+                time.sleep(interval)
+        finally:
+            self.profiling = False
+
+        lines = [f"Profil prin eșantionare: {samples} eșantioane în {duration:.1f} s "
+                 f"(la {interval * 1000:.0f} ms)", "", "Timp propriu (linia curentă):"]
+        for (thread, where), count in sorted(own_samples.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"{count / samples:>7.1%}  {thread:<20} {where}")
+        lines += ["", "Timp cumulat (funcția apare în stivă):"]
+        for (thread, where), count in sorted(total_samples.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"{count / samples:>7.1%}  {thread:<20} {where}")
+        return "\n".join(lines)
+
+    def start_cprofile(self):
+        """Pornește cProfile pe firul curent (în dashboard: firul Tk - desenare, click-uri)"""
+        import cProfile
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop_cprofile(self, top=40):
+        """Oprește cProfile; returnează raportul sortat după timpul cumulat"""
+        import io
+        import pstats
+        if self.profiler is None:
+            return ""
+        self.profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats('cumulative').print_stats(top)
+        self.profiler = None
+        return output.getvalue()
+
+
+class StorageBackend:
+    """Interfață comună pentru backend-urile de stocare ale serverelor"""
+    name = 'base'
+
+    def __init__(self, path):
+        self.path = path
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Returnează un DataFrame cu toate serverele"""
+        raise NotImplementedError
+
+    def save(self, df):
+        """Scrie integral DataFrame-ul în stocare"""
+        raise NotImplementedError
+
+    def save_changes(self, old_df, new_df):
+        """Persistă modificările față de old_df; implicit rescrie tot fișierul"""
+        self.save(new_df)
+        return None
+
+    def save_marked(self, df, changes, id_index=None):
+        """Persistă celulele marcate în changes (ChangeSet); implicit rescrie tot fișierul"""
+        self.save(df)
+        return None
+
+    def journal_size(self):
+        return 0
+
+    def schema_fingerprint(self):
+        """Hash-ul schemei stocate (fără a citi datele); None dacă backend-ul nu o cunoaște"""
+        return None
+
+    def get_meta(self, key):
+        return None
+
+    def set_meta(self, key, value):
+        pass
+
+    @staticmethod
+    def atomic_write(path, write):
+        """Scrie prin write(cale_temporară) și apoi redenumește atomic peste path.
+
+        Un cititor vede fie fișierul vechi, fie pe cel nou complet, niciodată unul parțial.
+        Fișierul temporar are nume unic (două scrieri simultane nu se calcă) și este
+        în același director, ca redenumirea să rămână atomică.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                         prefix=os.path.basename(path) + '.',
+                                         suffix='.tmp' + os.path.splitext(path)[1])
+        os.close(fd)
+        try:
+            write(temp_path)
+            if os.path.exists(path):
+                import shutil
+                shutil.copymode(path, temp_path)  # mkstemp creează fișierul doar pentru proprietar
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def backup(self, backup_path):
+        """Copiază stocarea curentă într-un fișier de backup"""
+        import shutil
+        self.atomic_write(backup_path, lambda temp_path: shutil.copy2(self.path, temp_path))
+
+    def restore(self, backup_path):
+        """Înlocuiește stocarea curentă cu conținutul unui backup"""
+        import shutil
+        self.atomic_write(self.path, lambda temp_path: shutil.copy2(backup_path, temp_path))
+
+    def close(self):
+        pass
+
+
+class ChangeSet:
+    """Celulele modificate de la ultima salvare, marcate de scriitori.
+
+    Scriitorii marchează ce au atins (celule, rânduri întregi, coloane întregi,
+    inserări/ștergeri), iar salvarea jurnalizează doar acestea, fără să compare
+    tabelele. full=True înseamnă modificări nemarcate (ex. o coloană nouă) -
+    salvarea revine atunci la diff-ul complet.
+    """
+
+    def __init__(self):
+        self.cells = {}  # coloană → ID-urile modificate
+        self.rows = set()  # ID-uri cu toate coloanele modificate
+        self.columns = set()  # Coloane modificate pe toate rândurile
+        self.structure = []  # ('insert' / 'delete', ID) în ordinea în care au avut loc
+        self.full = False
+        self.marks = 0
+
+    def mark(self, ids, columns=None):
+        """Marchează celulele (ids × columns); fără columns - rândurile întregi"""
+        if columns is None:
+            self.rows.update(ids)
+        else:
+            ids = ids if isinstance(ids, (set, frozenset)) else set(ids)
+            for column in columns:
+                self.cells.setdefault(column, set()).update(ids)
+        self.marks += 1
+
+    def mark_column(self, column):
+        self.columns.add(column)
+        self.marks += 1
+
+    def mark_insert(self, server_id):
+        self.structure.append(('insert', server_id))
+        self.rows.add(server_id)
+        self.marks += 1
+
+    def mark_delete(self, server_id):
+        self.structure.append(('delete', server_id))
+        self.rows.discard(server_id)
+        self.marks += 1
+
+    def mark_all(self):
+        self.full = True
+        self.marks += 1
+
+    def merge(self, other):
+        """Adaugă marcajele unei salvări eșuate (reluate la următoarea scriere)"""
+        for column, ids in other.cells.items():
+            self.cells.setdefault(column, set()).update(ids)
+        self.rows.update(other.rows)
+        self.columns.update(other.columns)
+        self.structure[:0] = other.structure  # Operațiile vechi au avut loc primele
+        self.full = self.full or other.full
+        self.marks += 1
+
+    def column_ids(self, column):
+        """ID-urile de scris pentru o coloană care nu e marcată integral"""
+        ids = self.cells.get(column)
+        return self.rows if ids is None else ids | self.rows
+
+    def __bool__(self):
+        return bool(self.cells or self.rows or self.columns or self.structure or self.full)
+
+
+class SQLiteStorage(StorageBackend):
+    """Backend principal - fișier SQLite columnar, rapid la încărcare și salvare.
+
+    Snapshot-ul este stocat pe coloane (tabela `column_data`, un BLOB per coloană):
+    coloanele numerice și datele calendaristice (nanosecunde epoch) ca bytes
+    little-endian citite direct cu numpy, coloanele text ca listă JSON. Tabela
+    `_columns` reține ordinea și tipul fiecărei coloane din DataFrame.
+
+    Modificările curente se adaugă într-un jurnal append-only (tabela `journal`),
+    doar pentru celulele schimbate - marcate de scriitori într-un ChangeSet, cu o
+    intrare 'update' pentru coloanele care au aceleași rânduri modificate.
+    Jurnalul este re-aplicat la încărcare și compactat periodic într-un snapshot complet - sau imediat,
+    când o salvare ar schimba prea multe celule ca jurnalul să mai fie avantajos.
+    Bazele mai vechi, cu snapshot-ul pe rânduri (tabela `servers`), se citesc în
+    continuare și sunt convertite la prima compactare.
+    """
+    name = 'sqlite'
+
+    # Peste această fracțiune din celule (rânduri × coloane) schimbate, salvarea
+    # incrementală devine mai lentă decât un snapshot complet
+    SNAPSHOT_FRACTION = 0.05
+    SNAPSHOT_MIN_CHANGES = 1000
+    PACKED_DTYPES = {'float': '<f8', 'int': '<i8'}  # Coloane numerice împachetate (snapshot și intrările 'update')
+    NAT = np.iinfo('int64').min  # NaT în coloanele 'datetime' (nanosecunde)
+    # Același prag pentru celulele marcate (save_marked) - intrările 'update' grupate
+    # costă mult mai puțin per celulă decât intrările 'set' ale diff-ului
+    MARKED_SNAPSHOT_FRACTION = 0.5
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.lock = threading.RLock()
+        self.conn = None
+        self.columns = None  # Cache pentru `_columns` (se schimbă doar la snapshot/restaurare)
+        self.journal_cells = None  # Cache pentru numărul de celule din jurnal
+
+    def connect(self):
+        if self.conn is None:
+            self.columns = None
+            self.journal_cells = None
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS _columns "
+                              "(position INTEGER PRIMARY KEY, name TEXT, kind TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS journal "
+                              "(seq INTEGER PRIMARY KEY AUTOINCREMENT, op TEXT, server_id TEXT, "
+                              "col TEXT, value)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS column_data "
+                              "(position INTEGER PRIMARY KEY, data BLOB)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS _meta (key TEXT PRIMARY KEY, value TEXT)")
+        return self.conn
+
+    def exists(self):
+        if not os.path.exists(self.path):
+            return False
+        with self.lock:
+            # Schema se scrie în aceeași tranzacție cu snapshot-ul
+            return bool(self.read_columns())
+
+    @staticmethod
+    def column_kind(series):
+        """Determină tipul de stocare pentru o coloană pandas"""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return 'datetime'
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+            return 'int'
+        if pd.api.types.is_float_dtype(series):
+            return 'float'
+        return 'text'
+
+    @staticmethod
+    def to_sql_values(series, kind):
+        """Convertește o coloană în listă de valori Python acceptate de sqlite3"""
+        if kind == 'datetime':
+            missing = series.isna().to_numpy()
+            values = series.to_numpy(dtype='datetime64[ns]').astype('int64').tolist()
+            if missing.any():
+                for pos in missing.nonzero()[0]:
+                    values[pos] = None
+            return values
+        if kind == 'text':
+            return [None if not isinstance(v, str) and pd.isna(v) else v for v in series.tolist()]
+        return series.tolist()
+
+    @classmethod
+    def from_sql_values(cls, values, kind):
+        """Reconstruiește o coloană pandas din valorile citite din SQLite (listă sau array numpy)"""
+        if kind == 'datetime':
+            if not isinstance(values, np.ndarray):
+                values = np.array([cls.NAT if v is None else v for v in values], dtype='int64')
+            return pd.Series(values.astype('int64', copy=False).view('datetime64[ns]'))
+        if kind == 'float':
+            return pd.Series(values, dtype='float64')
+        if kind == 'int':
+            series = pd.Series(values)
+            return series if series.isna().any() else series.astype('int64')
+        return pd.Series(values, dtype=object)
+
+    @classmethod
+    def pack_column(cls, series, kind):
+        """Serializează o coloană pentru `column_data`: bytes little-endian sau listă JSON"""
+        if kind == 'datetime':
+            return series.to_numpy(dtype='datetime64[ns]').view('<i8').tobytes()  # NaT → NAT
+        if kind in cls.PACKED_DTYPES:
+            return series.to_numpy(dtype=cls.PACKED_DTYPES[kind]).tobytes()
+        return json.dumps(cls.to_sql_values(series, kind)).encode('utf-8')
+
+    @classmethod
+    def unpack_column(cls, data, kind):
+        """Inversul lui pack_column - array numpy (datetime: int64 ns) sau listă de valori"""
+        if kind == 'datetime':
+            return np.frombuffer(data, dtype='<i8').astype('int64')
+        if kind in cls.PACKED_DTYPES:
+            return np.frombuffer(data, dtype=cls.PACKED_DTYPES[kind]).astype(cls.PACKED_DTYPES[kind][1:])
+        return json.loads(data)
+
+    def read_columns(self):
+        conn = self.connect()
+        if self.columns is None:
+            self.columns = conn.execute("SELECT name, kind FROM _columns ORDER BY position").fetchall()
+        return self.columns
+
+    def journal_size(self):
+        """Numărul de celule din jurnal (o intrare 'update' acoperă mai multe rânduri și coloane)"""
+        with self.lock:
+            conn = self.connect()
+            if self.journal_cells is None:
+                self.journal_cells = conn.execute(
+                    "SELECT COALESCE(SUM(CASE WHEN op = 'update' THEN json_array_length(value, '$.ids') * "
+                    "(SELECT COUNT(*) FROM json_each(journal.value, '$.columns')) ELSE 1 END), 0) "
+                    "FROM journal").fetchone()[0]
+            return self.journal_cells
+
+    def schema_fingerprint(self):
+        """SHA-256 peste (nume, tip) din `_columns` - se schimbă la orice modificare de schemă"""
+        with self.lock:
+            columns = self.read_columns()
+        if not columns:
+            return None
+        return hashlib.sha256(json.dumps(columns).encode('utf-8')).hexdigest()
+
+    def get_meta(self, key):
+        with self.lock:
+            row = self.connect().execute("SELECT value FROM _meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def set_meta(self, key, value):
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO _meta (key, value) VALUES (?, ?)", (key, value))
+
+    def load(self):
+        with self.lock:
+            conn = self.connect()
+            columns = self.read_columns()
+            if not columns:
+                raise ValueError(f"Baza de date {self.path} nu conține schema serverelor")
+            blobs = [data for data, in conn.execute("SELECT data FROM column_data ORDER BY position")]
+            if len(blobs) == len(columns):
+                column_values = [self.unpack_column(data, kind) for data, (_, kind) in zip(blobs, columns)]
+            else:
+                column_values = self.read_legacy_rows(conn, columns)
+            journal = conn.execute(
+                "SELECT op, server_id, col, value FROM journal ORDER BY seq").fetchall()
+
+        data = {name: values for (name, _), values in zip(columns, column_values)}
+        if journal:
+            self.replay_journal(data, journal)
+        return pd.DataFrame({name: self.from_sql_values(data[name], kind) for name, kind in columns})
+
+    @staticmethod
+    def read_legacy_rows(conn, columns):
+        """Citește snapshot-ul din formatul vechi, pe rânduri (tabela `servers`)"""
+        names = ", ".join(f'"{name}"' for name, _ in columns)
+        rows = conn.execute(f"SELECT {names} FROM servers ORDER BY rowid").fetchall()
+        return [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+
+    def replay_journal(self, data, journal):
+        """Aplică în ordine intrările din jurnal peste coloanele snapshot-ului (valori SQL).
+
+        data: coloană → listă de valori sau array numpy (coloanele numerice din
+        `column_data`, actualizate vectorizat), modificată pe loc. Rândurile inserate se
+        adaugă la final (re-inserarea unui ID îl mută la final), cele șterse se elimină la sfârșit.
+        """
+        ids = data['ID']
+        positions = {server_id: pos for pos, server_id in enumerate(ids)}
+        deleted = set()
+
+        def missing(target):
+            # None din jurnal într-o coloană numpy: NaN (float) sau NaT (datetime)
+            return np.nan if target.dtype.kind == 'f' else self.NAT
+
+        for op, server_id, col, value in journal:
+            if op == 'update':
+                # Mai multe coloane pentru aceleași rânduri: {"ids": [...], "columns": {coloană: [...]}}
+                batch = json.loads(value)
+                rows = [positions.get(row_id) for row_id in batch['ids']]
+                found = None
+                for col, values in batch['columns'].items():
+                    target = data.get(col)
+                    if target is None:
+                        continue
+                    if isinstance(values, dict):
+                        (kind, packed), = values.items()
+                        values = np.frombuffer(base64.b64decode(packed), dtype=self.PACKED_DTYPES[kind])
+                    if isinstance(target, np.ndarray):
+                        if found is None:
+                            found = np.array([pos is not None for pos in rows], dtype=bool)
+                            found_rows = np.array([pos for pos in rows if pos is not None], dtype='int64')
+                        if not isinstance(values, np.ndarray):
+                            fill = missing(target)
+                            values = np.array([fill if v is None else v for v in values], dtype=target.dtype)
+                        target[found_rows] = values[found]
+                        continue
+                    if isinstance(values, np.ndarray):
+                        values = values.tolist()
+                    for pos, cell in zip(rows, values):
+                        if pos is not None:
+                            target[pos] = cell
+            elif op == 'set':
+                pos = positions.get(server_id)
+                if pos is not None and col in data and col != 'ID':
+                    target = data[col]
+                    if isinstance(target, np.ndarray) and value is None:
+                        value = missing(target)
+                    target[pos] = value
+            elif op == 'fill':
+                # Aceeași valoare pe toate rândurile prezente
+                if col in data and col != 'ID':
+                    target = data[col]
+                    if isinstance(target, np.ndarray):
+                        data[col] = np.full(len(ids), missing(target) if value is None else value,
+                                            dtype=target.dtype)
+                    else:
+                        data[col] = [value] * len(ids)
+            elif op == 'insert':
+                if server_id in positions:
+                    deleted.add(positions[server_id])
+                positions[server_id] = len(ids)
+                for name, values in data.items():
+                    if isinstance(values, np.ndarray):
+                        # Rar (adăugare de server) - coloana trece la listă, ca restul
+                        values = data[name] = values.tolist()
+                    values.append(server_id if name == 'ID' else None)
+            elif op == 'delete':
+                pos = positions.pop(server_id, None)
+                if pos is not None:
+                    deleted.add(pos)
+
+        if deleted:
+            keep = [pos for pos in range(len(ids)) if pos not in deleted]
+            for name in list(data):
+                values = data[name]
+                data[name] = values[keep] if isinstance(values, np.ndarray) else [values[pos] for pos in keep]
+
+    def diff(self, old_df, new_df, limit=None):
+        """Calculează lista de operații de jurnal dintre două versiuni ale DataFrame-ului.
+
+        Returnează None când diferența nu poate fi exprimată incremental
+        (schemă schimbată sau ID-uri duplicate) sau depășește `limit` operații
+        și e nevoie de un snapshot complet.
+        """
+        if old_df is None or list(old_df.columns) != list(new_df.columns):
+            return None
+        kinds = [(name, self.column_kind(new_df[name])) for name in new_df.columns]
+        if self.read_columns() != kinds:
+            return None
+        if not new_df['ID'].is_unique or not old_df['ID'].is_unique:
+            return None
+
+        changes = []
+        new_ids = new_df['ID']
+        if not old_df['ID'].equals(new_ids):
+            old_set = set(old_df['ID'].tolist())
+            new_set = set(new_ids.tolist())
+            for server_id in old_df['ID'].tolist():
+                if server_id not in new_set:
+                    changes.append(('delete', server_id, None, None))
+            added = [server_id for server_id in new_ids.tolist() if server_id not in old_set]
+            if limit is not None and len(changes) + len(added) * (len(kinds) + 1) > limit:
+                return None
+            if added:
+                changes.extend(('insert', server_id, None, None) for server_id in added)
+                added_rows = new_df[new_ids.isin(added)]
+                for name, kind in kinds:
+                    values = self.to_sql_values(added_rows[name], kind)
+                    changes.extend(('set', server_id, name, value)
+                                   for server_id, value in zip(added_rows['ID'].tolist(), values))
+            old_df = old_df.set_index('ID').reindex(new_ids.tolist())
+            old_df.insert(0, 'ID', new_ids.tolist())
+            old_df = old_df.reset_index(drop=True)
+            common = new_ids.isin(old_set).to_numpy()
+        else:
+            common = np.ones(len(new_df), dtype=bool)
+
+        ids = new_ids.to_numpy()
+        for name, kind in kinds:
+            old_col = old_df[name]
+            new_col = new_df[name].reset_index(drop=True)
+            both_missing = old_col.isna().to_numpy() & new_col.isna().to_numpy()
+            new_values = new_col.to_numpy()
+            changed = (old_col.to_numpy() != new_values) & ~both_missing & common
+            changed_count = int(changed.sum())
+            if changed_count > 1 and not both_missing.any() and (new_values == new_values[0]).all():
+                # Coloană setată uniform (ex. timestamp-ul verificării) - o singură intrare
+                changes.append(('fill', None, name, self.to_sql_values(new_col.iloc[:1], kind)[0]))
+            elif changed_count:
+                if limit is not None and len(changes) + changed_count > limit:
+                    return None  # Oprire devreme - nu are rost să convertim celulele
+                positions = changed.nonzero()[0]
+                values = self.to_sql_values(new_col.iloc[positions], kind)
+                changes.extend(('set', ids[pos], name, value) for pos, value in zip(positions, values))
+        return changes
+
+    def append_changes(self, changes, cells=None):
+        """Adaugă operațiile în jurnal într-o singură tranzacție (cells - celulele acoperite)"""
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                conn.executemany("INSERT INTO journal (op, server_id, col, value) VALUES (?, ?, ?, ?)",
+                                 changes)
+            if self.journal_cells is not None:
+                self.journal_cells += len(changes) if cells is None else cells
+
+    def write_snapshot(self, conn, df):
+        kinds = [(name, self.column_kind(df[name])) for name in df.columns]
+        blobs = [(i, self.pack_column(df[name], kind)) for i, (name, kind) in enumerate(kinds)]
+
+        if self.read_columns() != kinds:
+            # Schema s-a schimbat - rescrie `_columns`
+            conn.execute("DELETE FROM _columns")
+            conn.executemany("INSERT INTO _columns (position, name, kind) VALUES (?, ?, ?)",
+                             [(i, name, kind) for i, (name, kind) in enumerate(kinds)])
+            self.columns = None  # Recitit după commit (un rollback păstrează schema veche)
+
+        conn.execute("DELETE FROM column_data")
+        conn.executemany("INSERT INTO column_data (position, data) VALUES (?, ?)", blobs)
+        conn.execute("DROP TABLE IF EXISTS servers")  # Snapshot vechi, pe rânduri
+        # Snapshot-ul conține deja toate modificările din jurnal
+        conn.execute("DELETE FROM journal")
+        self.journal_cells = None
+
+    def save(self, df):
+        """Snapshot complet (compactare) - înlocuiește tabela și golește jurnalul"""
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                self.write_snapshot(conn, df)
+
+    def save_changes(self, old_df, new_df):
+        """Persistă doar diferențele; revine la snapshot complet dacă e necesar.
+
+        Când s-a schimbat o fracțiune mare din celule, snapshot-ul este mai ieftin
+        decât jurnalul (o intrare de jurnal costă cam cât un rând întreg de snapshot).
+        """
+        limit = max(self.SNAPSHOT_MIN_CHANGES, int(new_df.size * self.SNAPSHOT_FRACTION))
+        changes = self.diff(old_df, new_df, limit=limit)
+        if changes is None:
+            self.save(new_df)
+            return None
+        if changes:
+            self.append_changes(changes)
+        return len(changes)
+
+    def save_marked(self, df, changes, id_index=None):
+        """Jurnalizează doar celulele marcate de scriitori, fără a compara tabelele.
+
+        Decizia snapshot/jurnal se ia din numărul de celule marcate, înainte de orice
+        conversie. id_index (ID → poziție, poate fi învechit) evită indexarea coloanei ID.
+        Returnează numărul de celule jurnalizate, sau None după un snapshot.
+        """
+        kinds = [(name, self.column_kind(df[name])) for name in df.columns]
+        with self.lock:
+            schema_changed = self.read_columns() != kinds
+        if changes.full or schema_changed:
+            self.save(df)
+            return None
+
+        rows = len(df)
+        fills = {}
+        marked = {}  # coloană → ID-urile de scris (None = toate rândurile)
+        for name, kind in kinds:
+            if name not in changes.columns:
+                marked[name] = changes.column_ids(name)
+                continue
+            marked[name] = None
+            column = df[name]
+            values = column.to_numpy()
+            if rows > 1 and not column.isna().any() and (values == values[0]).all():
+                # Coloană setată uniform (ex. timestamp-ul verificării) - o singură intrare
+                fills[name] = self.to_sql_values(column.iloc[:1], kind)[0]
+        cells = len(fills) + sum(rows if ids is None else len(ids)
+                                 for name, ids in marked.items() if name not in fills)
+        if cells > max(self.SNAPSHOT_MIN_CHANGES, df.size * self.MARKED_SNAPSHOT_FRACTION):
+            self.save(df)
+            return None
+
+        # Coloanele cu aceleași rânduri marcate (ex. metricile unui tick) împart o intrare 'update'
+        groups = []  # [ID-uri marcate, [(coloană, tip)]]
+        for name, kind in kinds:
+            ids = marked[name]
+            if name in fills or ids is not None and not ids:
+                continue
+            for group in groups:
+                if group[0] is ids or (group[0] is not None and ids is not None and group[0] == ids):
+                    group[1].append((name, kind))
+                    break
+            else:
+                groups.append([ids, [(name, kind)]])
+
+        ops = [(op, server_id, None, None) for op, server_id in changes.structure]
+        ops.extend(('fill', None, name, value) for name, value in fills.items())
+        all_ids = df['ID'].to_numpy(dtype=object)
+        for ids, columns in groups:
+            if ids is None:
+                positions = np.arange(rows)
+            else:
+                positions = self.row_positions(all_ids, list(ids), id_index)
+                if not len(positions):
+                    continue
+            values = {}
+            for name, kind in columns:
+                if kind in self.PACKED_DTYPES:
+                    # Coloanele numerice - binar little-endian în base64 (fără text per valoare)
+                    packed = df[name].to_numpy()[positions].astype(self.PACKED_DTYPES[kind])
+                    values[name] = {kind: base64.b64encode(packed.tobytes()).decode('ascii')}
+                else:
+                    values[name] = self.to_sql_values(df[name].iloc[positions], kind)
+            ops.append(('update', None, None,
+                        json.dumps({'ids': all_ids[positions].tolist(), 'columns': values})))
+        if ops:
+            self.append_changes(ops, cells)
+        return cells
+
+    @staticmethod
+    def row_positions(all_ids, ids, id_index=None):
+        """Pozițiile sortate ale ID-urilor date; ID-urile care nu mai există se ignoră"""
+        if id_index is not None:
+            positions = np.fromiter((id_index.get(server_id, -1) for server_id in ids),
+                                    dtype=np.int64, count=len(ids))
+            if ((positions >= 0) & (positions < len(all_ids))).all() and \
+                    (all_ids[positions] == np.array(ids, dtype=object)).all():
+                return np.sort(positions)
+        # Index absent sau învechit (rânduri șterse/mutate) - căutare completă
+        positions = pd.Index(all_ids).get_indexer(ids)
+        return np.sort(positions[positions >= 0])
+
+    def backup(self, backup_path):
+        """Backup consistent folosind API-ul nativ SQLite (sigur și cu WAL activ)"""
+        def write(temp_path):
+            target = sqlite3.connect(temp_path)
+            try:
+                self.connect().backup(target)
+            finally:
+                target.close()
+
+        with self.lock:
+            self.atomic_write(backup_path, write)
+
+    def restore(self, backup_path):
+        """Copiază backup-ul peste baza de date deschisă, prin API-ul SQLite (sigur cu WAL)"""
+        if not os.path.exists(backup_path):
+            raise FileNotFoundError(backup_path)  # connect() ar crea o bază goală
+        source = sqlite3.connect(backup_path)
+        try:
+            with self.lock:
+                source.backup(self.connect())
+                self.columns = None
+                self.journal_cells = None
+        finally:
+            source.close()
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+class ExcelStorage(StorageBackend):
+    """Backend Excel - folosit doar pentru import/export"""
+    name = 'excel'
+
+    def load(self):
+        df = pd.read_excel(self.path)
+        if 'UltimaVerificare' in df.columns:
+            df['UltimaVerificare'] = pd.to_datetime(df['UltimaVerificare'])
+        return df
+
+    def save(self, df):
+        self.atomic_write(self.path, lambda temp_path: df.to_excel(temp_path, index=False))
+
+
+# Backend-uri disponibile pentru stocarea principală
+STORAGE_BACKENDS = {
+    'sqlite': SQLiteStorage,
+    'excel': ExcelStorage
+}
+
+
+class BackupManager:
+    """Generații de backup cu marcaj de timp și retenție orară, zilnică și săptămânală.
+
+    O generație este o copie consistentă a stocării, creată cel mult o dată pe
+    interval (verificarea este O(1), deci salvările obișnuite nu fac I/O de backup).
+    Conținutul identic cu generația anterioară nu se mai copiază: dacă versiunea
+    datelor sau hash-ul SHA-256 coincid, noua generație este un hard link către
+    fișierul existent. Manifestul JSON din director descrie toate generațiile.
+    """
+
+    # (nume, lungimea intervalului în secunde, câte generații se păstrează)
+    RETENTION = (('orar', 3600, 24), ('zilnic', 86400, 7), ('săptămânal', 7 * 86400, 4))
+
+    def __init__(self, storage, directory, interval=3600, retention=None):
+        self.storage = storage
+        self.directory = directory
+        self.interval = interval
+        self.retention = retention or self.RETENTION
+        self.lock = threading.RLock()
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        os.makedirs(directory, exist_ok=True)
+        self.generations = self.load_manifest()
+
+    def load_manifest(self):
+        """Generațiile existente, în ordine cronologică (fișierele dispărute sunt ignorate)"""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as handle:
+                generations = json.load(handle)
+        except (OSError, ValueError):
+            return []
+        return sorted((entry for entry in generations
+                       if os.path.exists(os.path.join(self.directory, entry['name']))),
+                      key=lambda entry: entry['created'])
+
+    def save_manifest(self):
+        def write(temp_path):
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                json.dump(self.generations, handle, ensure_ascii=False, indent=1)
+        StorageBackend.atomic_write(self.manifest_path, write)
+
+    def path_of(self, entry):
+        return os.path.join(self.directory, entry['name'])
+
+    @staticmethod
+    def file_digest(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as handle:
+            for block in iter(lambda: handle.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def link_or_copy(source, target):
+        """Hard link (fără copierea datelor); copie dacă sistemul de fișiere nu suportă link-uri"""
+        try:
+            os.link(source, target)
+        except OSError:
+            import shutil
+            shutil.copy2(source, target)
+
+    def maybe_backup(self, data_version=None, now=None):
+        """Apelat după fiecare salvare - creează o generație doar dacă a trecut intervalul"""
+        now = time.time() if now is None else now
+        if self.generations and now - self.generations[-1]['created'] < self.interval:
+            return None
+        return self.create(data_version, now)
+
+    def create(self, data_version=None, now=None, reason="programat", pinned=()):
+        """Creează o generație nouă; returnează intrarea din manifest (pinned nu se elimină)"""
+        now = time.time() if now is None else now
+        with self.lock:
+            stem = os.path.splitext(os.path.basename(self.storage.path))[0]
+            extension = os.path.splitext(self.storage.path)[1]
+            name = f"{stem}-{datetime.fromtimestamp(now):%Y%m%d-%H%M%S}{extension}"
+            if any(entry['name'] == name for entry in self.generations):
+                return None
+            path = os.path.join(self.directory, name)
+            latest = self.generations[-1] if self.generations else None
+
+            start_time = time.perf_counter()
+            if latest is not None and data_version is not None and latest.get('data_version') == data_version:
+                # Date neschimbate de la ultima generație - doar un link nou
+                self.link_or_copy(self.path_of(latest), path)
+                digest, deduplicated = latest['sha256'], True
+            else:
+                self.storage.backup(path)
+                digest = self.file_digest(path)
+                deduplicated = latest is not None and digest == latest['sha256']
+                if deduplicated:
+                    os.remove(path)
+                    self.link_or_copy(self.path_of(latest), path)
+
+            entry = {'name': name, 'created': now, 'sha256': digest, 'data_version': data_version,
+                     'size': os.path.getsize(path), 'reason': reason, 'deduplicated': deduplicated}
+            self.generations.append(entry)
+            removed = self.prune(pinned)
+            self.save_manifest()
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        log.info(f"🗄️ Backup {name} ({'link, conținut neschimbat' if deduplicated else 'copie nouă'}, "
+                 f"{elapsed_ms:.0f} ms)" + (f" - {removed} generații vechi eliminate" if removed else ""))
+        return entry
+
+    def prune(self, pinned=()):
+        """Păstrează cea mai recentă generație din fiecare interval al fiecărui nivel de retenție"""
+        keep = set(pinned)
+        if self.generations:
+            keep.add(self.generations[-1]['name'])
+        for _, span, count in self.retention:
+            buckets = set()
+            for entry in reversed(self.generations):
+                bucket = int(entry['created'] // span)
+                if bucket in buckets:
+                    continue
+                if len(buckets) >= count:
+                    break
+                buckets.add(bucket)
+                keep.add(entry['name'])
+
+        removed = [entry for entry in self.generations if entry['name'] not in keep]
+        for entry in removed:
+            try:
+                os.remove(self.path_of(entry))
+            except OSError as e:
+                log.warning(f"⚠️ Nu pot șterge backup-ul {entry['name']}: {e}")
+        self.generations = [entry for entry in self.generations if entry['name'] in keep]
+        return len(removed)
+
+    def find(self, name):
+        for entry in self.generations:
+            if entry['name'] == name:
+                return entry
+        raise KeyError(f"Backup-ul {name} nu există în {self.directory}")
+
+    def restore(self, name):
+        """Restaurează generația dată peste stocarea curentă (starea curentă se salvează întâi)"""
+        with self.lock:
+            entry = self.find(name)
+            self.create(reason=f"înainte de restaurarea {name}", pinned=(name,))
+            self.storage.restore(self.path_of(entry))
+        log.info(f"♻️ Restaurat din backup-ul {name}")
+        return entry
+
+
+class PersistenceWriter:
+    """Fir dedicat pentru scrierea în stocare, în afara firului Tk.
+
+    request() doar marchează că există modificări; firul apelează write(silent)
+    cel mult o dată per interval, iar cererile venite între timp se unesc într-o
+    singură scriere a ultimului snapshot. O scriere eșuată (ex. bază de date
+    blocată) nu se pierde: rămâne în așteptare și se reia cu backoff exponențial.
+    """
+
+    def __init__(self, write, interval=1.0, max_backoff=30.0, on_error=None):
+        self.write = write
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.on_error = on_error  # on_error(excepție, încercare, reluare_în_secunde)
+        self.condition = threading.Condition()
+        self.pending = False
+        self.pending_silent = True
+        self.writing = False
+        self.stopped = False
+        self.next_write = 0.0
+        self.failures = 0
+        self.stats = {'requests': 0, 'writes': 0, 'retries': 0}
+        self.thread = threading.Thread(target=self.run, name="persistence-writer", daemon=True)
+
+    def start(self):
+        if not self.thread.is_alive():
+            self.thread.start()
+
+    def request(self, silent=True):
+        """Sigur de apelat din orice fir; nu blochează"""
+        with self.condition:
+            self.pending = True
+            self.pending_silent = self.pending_silent and silent
+            self.stats['requests'] += 1
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.stopped and (not self.pending or time.monotonic() < self.next_write):
+                    # Coalescență: cererile venite până la următoarea fereastră de scriere se unesc
+                    timeout = None if not self.pending else self.next_write - time.monotonic()
+                    self.condition.wait(timeout)
+                if self.stopped:
+                    return
+                silent = self.pending_silent
+                self.pending = False
+                self.pending_silent = True
+                self.writing = True
 
-class ServerDashboard:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("🖥️ Dashboard IT Professional - Server Monitoring System")
-        self.root.geometry("1400x900")
-        self.root.configure(bg='#2c3e50')
+            try:
+                self.write(silent)
+                self.stats['writes'] += 1
+                self.failures = 0
+                delay = self.interval
+            except Exception as e:
+                self.failures += 1
+                self.stats['retries'] += 1
+                delay = min(self.max_backoff, self.interval * 2 ** (self.failures - 1))
+                with self.condition:
+                    self.pending = True
+                    self.pending_silent = self.pending_silent and silent
+                if self.on_error is not None:
+                    self.on_error(e, self.failures, delay)
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.next_write = time.monotonic() + delay
+                    self.condition.notify_all()
+
+    def stop(self, timeout=10.0):
+        """Oprește firul după scrierea în curs; returnează True dacă mai există modificări nescrise"""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+        return self.pending
+
+
+
+class SpatialGridIndex:
+    """Index spațial pe grilă uniformă - hit-test O(1) amortizat pe canvas.
+
+    Fiecare dreptunghi este înregistrat în toate celulele pe care le atinge;
+    o interogare verifică doar elementele din celula punctului.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.boxes = {}
+
+    def insert(self, key, x1, y1, x2, y2):
+        self.boxes[key] = (x1, y1, x2, y2)
+        size = self.cell_size
+        for cell_x in range(int(x1 // size), int(x2 // size) + 1):
+            for cell_y in range(int(y1 // size), int(y2 // size) + 1):
+                self.buckets.setdefault((cell_x, cell_y), []).append(key)
+
+    def query_point(self, x, y):
+        """Returnează cheia dreptunghiului care conține punctul, sau None"""
+        size = self.cell_size
+        for key in self.buckets.get((int(x // size), int(y // size)), ()):
+            x1, y1, x2, y2 = self.boxes[key]
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return key
+        return None
+
+    def __len__(self):
+        return len(self.boxes)
+
+
+class FleetOverview:
+    """Vedere globală virtualizată a flotei - un singur canvas cu zoom și pan.
+
+    Serverele sunt așezate aritmetic pe o grilă în coordonate „world”; la fiecare
+    randare se creează elemente doar pentru celulele vizibile în viewport.
+    Nivelul de detaliu depinde de zoom: card complet, punct colorat sau blocuri
+    agregate (culoarea celui mai grav server din bloc), astfel încât numărul de
+    elemente de pe canvas rămâne limitat de dimensiunea ferestrei, nu a flotei.
+    """
+
+    CELL_W = 160
+    CELL_H = 110
+    CARD_ZOOM = 0.6     # De la acest zoom în sus se desenează carduri complete
+    MIN_DOT_PX = 14     # Sub această lățime de celulă serverele se agregă în blocuri
+    MIN_ZOOM = 0.005
+    MAX_ZOOM = 2.0
+
+    # Cod de severitate → culoare (aceleași culori ca în tab-uri)
+    STATE_COLORS = {1: "#27ae60", 2: "#f39c12", 3: "#e67e22", 4: "#e74c3c"}
+
+    def __init__(self, parent, dashboard):
+        self.dashboard = dashboard
+        self.canvas = tk.Canvas(parent, bg='#2c3e50', highlightthickness=0)
+        self.zoom = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.cols = 1
+        self.selected = None
+        self.render_job = None
+        self.drag_start = None
+        self.dragged = False
+        self.needs_fit = True
+
+        self.canvas.bind("<Configure>", lambda e: self.schedule_render())
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_release)
+        self.canvas.bind("<Double-Button-1>", lambda e: self.fit())
+        self.canvas.bind("<Button-3>", self.on_right_click)
+        self.canvas.bind("<MouseWheel>", self.on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.zoom_at(e.x, e.y, 1.2))
+        self.canvas.bind("<Button-5>", lambda e: self.zoom_at(e.x, e.y, 1 / 1.2))
+
+    def viewport_size(self):
+        return max(self.canvas.winfo_width(), 1), max(self.canvas.winfo_height(), 1)
+
+    def layout_columns(self, num_servers):
+        """Numărul de coloane astfel încât grila să aibă aspectul viewport-ului"""
+        width, height = self.viewport_size()
+        aspect = (width / self.CELL_W) / max(height / self.CELL_H, 1e-6)
+        return max(1, int(math.ceil(math.sqrt(num_servers * aspect))))
+
+    def fit(self):
+        """Zoom și pan astfel încât toată flota să fie vizibilă"""
+        num_servers = len(self.dashboard.servers)
+        width, height = self.viewport_size()
+        self.cols = self.layout_columns(max(num_servers, 1))
+        rows = max(1, math.ceil(num_servers / self.cols))
+        zoom = min(width / (self.cols * self.CELL_W), height / (rows * self.CELL_H))
+        self.zoom = min(max(zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.needs_fit = False
+        self.schedule_render()
+
+    def schedule_render(self, delay=16):
+        """Coalescență: cel mult o randare per cadru, oricâte evenimente ar veni"""
+        if self.render_job is None:
+            self.render_job = self.canvas.after(delay, self.render)
+
+    def severity_codes(self, servers):
+        """Cod de severitate per server: 1 excelent, 2 bun, 3 mediu, 4 offline"""
+        performance = servers['Performance_Score'].to_numpy(dtype=float)
+        codes = np.where(performance >= 90, 1, np.where(performance >= 70, 2, 3))
+        codes[servers['Status'].to_numpy() != 'up'] = 4
+        return codes.astype(np.int8)
+
+    @timed('overview_render', owner='dashboard')
+    def render(self):
+        """Materializează doar serverele din viewport, la nivelul de detaliu potrivit"""
+        self.render_job = None
+        canvas = self.canvas
+        canvas.delete("overview")
+        if self.needs_fit and canvas.winfo_width() > 1:
+            self.fit()
+            return
 
-        # Configurare stil modern
-        self.setup_styles()
+        servers = self.dashboard.servers
+        num_servers = len(servers)
+        width, height = self.viewport_size()
+        if num_servers == 0:
+            canvas.create_text(width // 2, height // 2, text="Niciun server în flotă",
+                               font=('Segoe UI', 12), fill='#95a5a6', tags="overview")
+            return
 
-        # Fișier Excel pentru baza de date
-        self.excel_file = "server_database.xlsx"
-        self.max_servers_per_tab = 6
+        self.cols = self.layout_columns(num_servers)
+        rows = math.ceil(num_servers / self.cols)
+        zoom = self.zoom
+        cell_w = self.CELL_W * zoom
+        cell_h = self.CELL_H * zoom
+
+        # Intervalul de celule vizibile
+        col0 = max(0, int(self.offset_x // self.CELL_W))
+        col1 = min(self.cols - 1, int((self.offset_x + width / zoom) // self.CELL_W))
+        row0 = max(0, int(self.offset_y // self.CELL_H))
+        row1 = min(rows - 1, int((self.offset_y + height / zoom) // self.CELL_H))
+
+        drawn = 0
+        if col0 <= col1 and row0 <= row1:
+            if zoom >= self.CARD_ZOOM:
+                lod = "carduri"
+                drawn = self.draw_cards(servers, col0, col1, row0, row1)
+            elif cell_w >= self.MIN_DOT_PX:
+                lod = "puncte"
+                drawn = self.draw_dots(servers, col0, col1, row0, row1)
+            else:
+                lod = "blocuri"
+                drawn = self.draw_blocks(servers, rows, col0, col1, row0, row1)
+        else:
+            lod = "-"
+
+        canvas.create_rectangle(8, 8, 330, 30, fill='#34495e', outline='', tags="overview")
+        canvas.create_text(14, 19, anchor='w', tags="overview", font=('Segoe UI', 8), fill='#ecf0f1',
+                           text=f"🗺️ {num_servers} servere | zoom {zoom * 100:.0f}% | "
+                                f"{lod} | {drawn} elemente")
+
+    def cell_origin(self, col, row):
+        """Colțul stânga-sus al celulei în coordonate ecran"""
+        return ((col * self.CELL_W - self.offset_x) * self.zoom,
+                (row * self.CELL_H - self.offset_y) * self.zoom)
+
+    def visible_positions(self, num_servers, col0, col1, row0, row1):
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                pos = row * self.cols + col
+                if pos < num_servers:
+                    yield pos, col, row
+
+    def draw_cards(self, servers, col0, col1, row0, row1):
+        canvas = self.canvas
+        zoom = self.zoom
+        card_w = (self.CELL_W - 20) * zoom
+        card_h = (self.CELL_H - 20) * zoom
+        count = 0
+        for pos, col, row in self.visible_positions(len(servers), col0, col1, row0, row1):
+            server = servers.iloc[pos]
+            visual = self.dashboard.get_server_visual_state(server)
+            x, y = self.cell_origin(col, row)
+            x1, y1 = x + 10 * zoom, y + 10 * zoom
+            center_x = x1 + card_w / 2
+            canvas.create_rectangle(x1, y1, x1 + card_w, y1 + card_h, fill=visual['color'],
+                                    outline='#ecf0f1', width=1, tags="overview")
+            canvas.create_oval(x1 + card_w - 14, y1 + 6, x1 + card_w - 6, y1 + 14,
+                               fill=visual['led_color'], outline='', tags="overview")
+            canvas.create_text(center_x, y1 + card_h * 0.25, text=visual['name'],
+                               font=('Segoe UI', 9, 'bold'), fill='white', tags="overview")
+            canvas.create_text(center_x, y1 + card_h * 0.5, text=str(server.get('ID', '')),
+                               font=('Segoe UI', 8), fill='#ecf0f1', tags="overview")
+            metrics_text, metrics_font, _ = visual['metrics']
+            canvas.create_text(center_x, y1 + card_h * 0.78, text=metrics_text,
+                               font=metrics_font, fill='#ecf0f1', tags="overview")
+            if server.get('ID') == self.selected:
+                canvas.create_rectangle(x1 - 4, y1 - 4, x1 + card_w + 4, y1 + card_h + 4,
+                                        outline="#f1c40f", width=3, tags="overview")
+            count += 1
+        return count
+
+    def draw_dots(self, servers, col0, col1, row0, row1):
+        canvas = self.canvas
+        codes = self.severity_codes(servers)
+        size = max(3.0, min(self.CELL_W, self.CELL_H) * self.zoom * 0.6)
+        selected_pos = self.dashboard.get_server_position(self.selected) if self.selected else None
+        count = 0
+        for pos, col, row in self.visible_positions(len(servers), col0, col1, row0, row1):
+            x, y = self.cell_origin(col, row)
+            cx = x + self.CELL_W * self.zoom / 2
+            cy = y + self.CELL_H * self.zoom / 2
+            outline = "#f1c40f" if pos == selected_pos else ''
+            canvas.create_oval(cx - size / 2, cy - size / 2, cx + size / 2, cy + size / 2,
+                               fill=self.STATE_COLORS[codes[pos]], outline=outline,
+                               width=2, tags="overview")
+            count += 1
+        return count
+
+    def draw_blocks(self, servers, rows, col0, col1, row0, row1):
+        """Agregă blocuri de b×b servere într-un singur dreptunghi (cel mai grav status)"""
+        canvas = self.canvas
+        num_servers = len(servers)
+        block = max(1, math.ceil(self.MIN_DOT_PX / (self.CELL_W * self.zoom)))
+
+        grid = np.zeros(rows * self.cols, dtype=np.int8)
+        grid[:num_servers] = self.severity_codes(servers)
+        grid = grid.reshape(rows, self.cols)
+
+        # Aliniere la granița blocurilor, apoi padding până la multiplu de bloc
+        col0 -= col0 % block
+        row0 -= row0 % block
+        visible = grid[row0:row1 + 1, col0:col1 + 1]
+        pad_rows = -visible.shape[0] % block
+        pad_cols = -visible.shape[1] % block
+        visible = np.pad(visible, ((0, pad_rows), (0, pad_cols)))
+        block_rows = visible.shape[0] // block
+        block_cols = visible.shape[1] // block
+        worst = visible.reshape(block_rows, block, block_cols, block).max(axis=(1, 3))
+
+        block_w = self.CELL_W * self.zoom * block
+        block_h = self.CELL_H * self.zoom * block
+        count = 0
+        for block_row, block_col in zip(*np.nonzero(worst)):
+            x, y = self.cell_origin(col0 + block_col * block, row0 + block_row * block)
+            canvas.create_rectangle(x, y, x + block_w - 1, y + block_h - 1, outline='',
+                                    fill=self.STATE_COLORS[worst[block_row, block_col]],
+                                    tags="overview")
+            count += 1
+        return count
+
+    def hit_test(self, x, y):
+        """Poziția de pe ecran → ID server, calculat aritmetic din grilă"""
+        world_x = x / self.zoom + self.offset_x
+        world_y = y / self.zoom + self.offset_y
+        if world_x < 0 or world_y < 0:
+            return None
+        col = int(world_x // self.CELL_W)
+        row = int(world_y // self.CELL_H)
+        pos = row * self.cols + col
+        servers = self.dashboard.servers
+        if col >= self.cols or pos >= len(servers):
+            return None
+        return servers['ID'].iat[pos]
+
+    def zoom_at(self, x, y, factor):
+        """Zoom păstrând fix punctul de sub cursor"""
+        world_x = x / self.zoom + self.offset_x
+        world_y = y / self.zoom + self.offset_y
+        self.zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.offset_x = world_x - x / self.zoom
+        self.offset_y = world_y - y / self.zoom
+        self.schedule_render()
+
+    def on_wheel(self, event):
+        self.zoom_at(event.x, event.y, 1.2 ** (event.delta / 120))
+
+    def on_press(self, event):
+        self.drag_start = (event.x, event.y, self.offset_x, self.offset_y)
+        self.dragged = False
+
+    def on_drag(self, event):
+        if self.drag_start is None:
+            return
+        start_x, start_y, offset_x, offset_y = self.drag_start
+        dx, dy = event.x - start_x, event.y - start_y
+        if abs(dx) > 3 or abs(dy) > 3:
+            self.dragged = True
+        if self.dragged:
+            self.offset_x = offset_x - dx / self.zoom
+            self.offset_y = offset_y - dy / self.zoom
+            self.schedule_render()
+
+    def on_release(self, event):
+        if self.drag_start is not None and not self.dragged:
+            self.dashboard.select_server(self.hit_test(event.x, event.y))
+        self.drag_start = None
 
-        # Încărcare date
-        self.initialize_database()
-        self.load_data()
+    def on_right_click(self, event):
+        server_id = self.hit_test(event.x, event.y)
+        if server_id is not None:
+            self.dashboard.context_server_id = server_id
+            self.dashboard.context_menu.post(event.x_root, event.y_root)
+
+    def set_selected(self, server_id):
+        if server_id != self.selected:
+            self.selected = server_id
+            self.schedule_render()
+
+
+class FleetAggregator:
+    """Agregate incrementale pentru statisticile din header.
+
+    Păstrează sume și contoare pentru toată flota; la fiecare modificare se scade
+    contribuția veche a serverelor atinse și se adaugă cea nouă, deci costul
+    depinde de numărul de servere modificate, nu de dimensiunea flotei.
+    La schimbarea regulilor contorul „critical” cere un rebuild.
+    """
+
+    COLUMNS = ('Status', 'CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Performance_Score', 'Uptime_Hours')
+    # Ordinea coloanelor din matricea de contribuții
+    FIELDS = ('total', 'online', 'cpu_sum', 'ram_sum', 'performance_sum', 'uptime_sum', 'critical')
+
+    def __init__(self, rules):
+        self.rules = rules  # RuleSet - pragurile contorului „critical”
+        self.sums = np.zeros(len(self.FIELDS))
+        self.updates = 0
+
+    def frame_contributions(self, servers, positions=None):
+        """Matricea (n, 7) cu contribuția fiecărui server (sau doar a pozițiilor date)"""
+        values = {}
+        for col in self.COLUMNS:
+            if col in servers.columns:
+                column = servers[col].to_numpy(dtype=object if col == 'Status' else 'float64',
+                                               na_value='down' if col == 'Status' else 0.0)
+            else:
+                column = np.full(len(servers), 'down' if col == 'Status' else 0.0,
+                                 dtype=object if col == 'Status' else 'float64')
+            values[col] = column if positions is None else column[positions]
+
+        online = (values['Status'] == 'up').astype('float64')
+        critical = self.rules.critical_mask(servers, positions, values).astype('float64')
+        return np.column_stack([
+            np.ones_like(online), online,
+            values['CPU_Usage'] * online, values['RAM_Usage'] * online,
+            values['Performance_Score'] * online, values['Uptime_Hours'] * online,
+            critical
+        ])
+
+    def rebuild(self, servers):
+        """Recalculare completă (la încărcare sau după înlocuirea tabelului)"""
+        self.sums = self.frame_contributions(servers).sum(axis=0)
+        self.updates = 0
+
+    def delta(self, before, after):
+        """Diferența pentru o modificare, fără a o aplica: before/after sunt contribuțiile
+        acelorași servere (None = absent). Returnează (sume, servere atinse)."""
+        sums = np.zeros(len(self.FIELDS))
+        updates = 0
+        if before is not None:
+            sums -= before.sum(axis=0)
+            updates += len(before)
+        if after is not None:
+            sums += after.sum(axis=0)
+            updates += len(after)
+        return sums, updates
+
+    def commit(self, deltas):
+        """Aplică diferențele calculate cu delta() - sumele se înlocuiesc dintr-o dată,
+        cititorii văd fie valorile vechi, fie pe cele noi"""
+        sums = self.sums.copy()
+        for delta, updates in deltas:
+            sums += delta
+            self.updates += updates
+        self.sums = sums
+
+    def apply(self, before, after):
+        """Aplică imediat o modificare (în afara unui bloc servers_update)"""
+        self.commit([self.delta(before, after)])
+
+    def metrics(self):
+        """Metricile în formatul folosit de performance_metrics"""
+        total, online, cpu_sum, ram_sum, performance_sum, uptime_sum, critical = self.sums
+        online_count = int(round(online))
+        return {
+            'total_servers': int(round(total)),
+            'online_servers': online_count,
+            'offline_servers': int(round(total)) - online_count,
+            'avg_cpu': cpu_sum / online_count if online_count else 0,
+            'avg_ram': ram_sum / online_count if online_count else 0,
+            'avg_performance': performance_sum / online_count if online_count else 0,
+            'critical_servers': int(round(critical)),
+            'total_uptime': uptime_sum if online_count else 0
+        }
 
-        # Setare variabile
-        self.server_icons = {}
-        self.alerts = []
-        self.current_selected = None
-        self.current_tab = 0
-        self.tabs = []
-        self.context_menu = None
-        self.performance_metrics = {}
+    def compare(self, reference, tolerance=1e-6):
+        """Lista diferențelor față de metricile recalculate complet"""
+        mismatches = []
+        for key, value in self.metrics().items():
+            expected = reference.get(key, 0)
+            if abs(value - expected) > tolerance * max(1.0, abs(expected)):
+                mismatches.append(f"{key}: incremental={value:.6f} complet={expected:.6f}")
+        return mismatches
+
+
+class ProbeEngine:
+    """Verificări reale de accesibilitate (TCP connect, opțional ICMP), rulate concurent cu asyncio.
+
+    Fiecare host are un timeout propriu; porturile unui host se încearcă în paralel
+    și primul connect reușit câștigă. Un semafor limitează numărul de host-uri
+    verificate simultan, iar pornirea fiecărei verificări este decalată aleator
+    (jitter) ca să nu plece toate SYN-urile în aceeași milisecundă.
+    O adresă de forma "127.0.0.5:8080" verifică doar portul dat.
+    """
+
+    def __init__(self, ports=(22, 80, 443), timeout=1.5, concurrency=1000, jitter=2.0, use_icmp=False):
+        self.ports = tuple(ports)
+        self.timeout = timeout
+        self.jitter = jitter
+        self.use_icmp = use_icmp
+        self.concurrency = self.clamp_concurrency(concurrency)
+        self.last_run = {}
+
+    def clamp_concurrency(self, concurrency):
+        """Limitează concurența la numărul de descriptori de fișier disponibili"""
+        try:
+            import resource
+            soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        except (ImportError, ValueError, OSError):
+            return concurrency
+        sockets_per_host = len(self.ports) + (1 if self.use_icmp else 0)
+        allowed = max(1, (soft_limit - 64) // max(1, sockets_per_host))
+        if allowed < concurrency:
+            log.warning(f"⚠️ Concurență probe redusă la {allowed} (limită descriptori: {soft_limit})")
+            return allowed
+        return concurrency
+
+    @staticmethod
+    def parse_target(address):
+        """Împarte "host:port" în (host, port); pentru IPv4/IPv6 simplu portul este None"""
+        address = str(address).strip()
+        if address.count(':') == 1:
+            host, port = address.split(':')
+            if port.isdigit():
+                return host, int(port)
+        return address, None
+
+    async def tcp_probe(self, host, port):
+        """Latența connect-ului TCP în ms, sau None dacă portul nu răspunde"""
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            return None
+        latency = (time.perf_counter() - start) * 1000
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return latency
+
+    async def icmp_probe(self, host):
+        """Un singur ping prin utilitarul sistemului (nu necesită privilegii raw socket)"""
+        if os.name == 'nt':
+            command = ['ping', '-n', '1', '-w', str(int(self.timeout * 1000)), host]
+        else:
+            command = ['ping', '-c', '1', '-W', str(max(1, int(math.ceil(self.timeout)))), host]
+        start = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        except OSError:
+            return None
+        try:
+            return_code = await process.wait()
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+        return (time.perf_counter() - start) * 1000 if return_code == 0 else None
+
+    async def check_host(self, address):
+        """Primul răspuns pozitiv dintre porturi (și ICMP); celelalte verificări se anulează"""
+        host, port = self.parse_target(address)
+        probes = [self.tcp_probe(host, p) for p in ((port,) if port else self.ports)]
+        if self.use_icmp:
+            probes.append(self.icmp_probe(host))
+
+        tasks = [asyncio.ensure_future(probe) for probe in probes]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                latency = await next_done
+                if latency is not None:
+                    return latency
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def probe_host(self, address, semaphore, jitter):
+        await asyncio.sleep(random.uniform(0, jitter))
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(self.check_host(address), self.timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    async def probe_all_async(self, addresses):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        jitter = self.jitter if len(addresses) > 1 else 0  # O verificare manuală nu se amână
+        return await asyncio.gather(*(self.probe_host(address, semaphore, jitter) for address in addresses))
+
+    def probe_all(self, addresses):
+        """Verifică toate adresele; returnează lista latențelor în ms (None = inaccesibil)"""
+        start = time.perf_counter()
+        latencies = asyncio.run(self.probe_all_async(list(addresses)))
+        reachable = [latency for latency in latencies if latency is not None]
+        self.last_run = {
+            'hosts': len(latencies),
+            'reachable': len(reachable),
+            'elapsed_s': time.perf_counter() - start,
+            'median_latency_ms': float(np.median(reachable)) if reachable else None
+        }
+        return latencies
+
+
+class MetricsHistory:
+    """Istoric de metrici în memorie, cu ring buffer-e float32 preallocate.
+
+    Fiecare nivel (tier) are un tablou (servere, metrici, sloturi). Eșantioanele
+    brute ale fiecărui tick se agregă automat ca medii pe găleți de 1 min,
+    15 min și 4 h. Memoria este fixă: 32 B per slot de timp și server (8 metrici
+    float32), adică ~20 KB per server pentru cele 636 de sloturi și ~200 MB pentru
+    10k servere. Nivelul de 4 h acoperă 30 de zile.
+    """
+
+    METRICS = ('CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out',
+               'Performance_Score', 'Uptime_Hours', 'Online')
+    # (nume, pas în secunde - 0 pentru eșantioane brute, număr de sloturi)
+    TIERS = (('raw', 0, 120), ('1m', 60, 240), ('15m', 900, 96), ('4h', 4 * 3600, 180))
+
+    def __init__(self, initial_servers=64):
+        self.slots = {}  # ID server → rând în tablouri
+        self.free_slots = []
+        self.capacity = 0
+        self.order_ids = None  # Ultima ordine a ID-urilor din DataFrame și rândurile corespunzătoare
+        self.order_slots = None
+        self.tiers = {}
+        for name, step, size in self.TIERS:
+            self.tiers[name] = {
+                'step': step, 'size': size, 'head': 0, 'count': 0, 'bucket': None,
+                'times': np.full(size, np.nan),
+                'values': np.zeros((0, len(self.METRICS), size), dtype=np.float32),
+                'sum': np.zeros((0, len(self.METRICS))),
+                'samples': np.zeros(0, dtype=np.int32)
+            }
+        self.grow(initial_servers)
 
-        # Inițializare metrici pentru a evita erori
-        self.calculate_performance_metrics()
+    def grow(self, capacity):
+        """Mărește numărul de rânduri (dublare), păstrând datele existente"""
+        added = capacity - self.capacity
+        if added <= 0:
+            return
+        for tier in self.tiers.values():
+            tier['values'] = np.concatenate([
+                tier['values'],
+                np.full((added, len(self.METRICS), tier['size']), np.nan, dtype=np.float32)])
+            tier['sum'] = np.concatenate([tier['sum'], np.zeros((added, len(self.METRICS)))])
+            tier['samples'] = np.concatenate([tier['samples'], np.zeros(added, dtype=np.int32)])
+        self.free_slots.extend(range(self.capacity + added - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def allocate(self, server_id):
+        if not self.free_slots:
+            self.grow(max(64, self.capacity * 2))
+        slot = self.free_slots.pop()
+        self.slots[server_id] = slot
+        return slot
+
+    def release(self, server_id):
+        """Eliberează rândul unui server șters; istoricul lui se golește"""
+        slot = self.slots.pop(server_id, None)
+        if slot is None:
+            return
+        for tier in self.tiers.values():
+            tier['values'][slot] = np.nan
+            tier['sum'][slot] = 0
+            tier['samples'][slot] = 0
+        self.free_slots.append(slot)
+
+    def slots_for(self, ids):
+        """Rândurile pentru ID-urile în ordinea din DataFrame (cache cât timp ordinea nu se schimbă)"""
+        if (self.order_ids is not None and len(self.order_ids) == len(ids)
+                and np.array_equal(self.order_ids, ids)):
+            return self.order_slots
+
+        current = set(ids)
+        for server_id in [sid for sid in self.slots if sid not in current]:
+            self.release(server_id)
+        slots = np.array([self.slots.get(sid, -1) for sid in ids], dtype=np.int64)
+        for pos in (slots < 0).nonzero()[0]:
+            slots[pos] = self.allocate(ids[pos])
+
+        self.order_ids = ids.copy()
+        self.order_slots = slots
+        return slots
+
+    def sample_values(self, servers):
+        """Matricea (n, 8) float32 cu valorile curente din DataFrame"""
+        values = np.zeros((len(servers), len(self.METRICS)), dtype=np.float32)
+        for col_idx, metric in enumerate(self.METRICS):
+            if metric == 'Online':
+                values[:, col_idx] = servers['Status'].to_numpy() == 'up'
+            elif metric in servers.columns:
+                values[:, col_idx] = servers[metric].to_numpy(dtype='float64', na_value=np.nan)
+        return values
+
+    def record(self, timestamp, servers):
+        """Adaugă un eșantion pentru toată flota și face rollup-ul în nivelurile agregate"""
+        if len(servers) == 0:
+            return
+        slots = self.slots_for(servers['ID'].to_numpy(dtype=object))
+        values = self.sample_values(servers)
+
+        for tier in self.tiers.values():
+            if tier['step'] == 0:
+                self.write_slot(tier, timestamp, slots, values)
+                continue
+
+            bucket = int(timestamp // tier['step'])
+            if tier['bucket'] is not None and bucket != tier['bucket']:
+                self.flush_bucket(tier)
+            tier['bucket'] = bucket
+            tier['sum'][slots] += values
+            tier['samples'][slots] += 1
+
+    def write_slot(self, tier, timestamp, slots, values):
+        head = tier['head']
+        tier['values'][:, :, head] = np.nan
+        tier['values'][slots, :, head] = values
+        tier['times'][head] = timestamp
+        tier['head'] = (head + 1) % tier['size']
+        tier['count'] = min(tier['count'] + 1, tier['size'])
+
+    def flush_bucket(self, tier):
+        """Scrie media găleții curente ca un slot nou în nivel"""
+        active = (tier['samples'] > 0).nonzero()[0]
+        means = tier['sum'][active] / tier['samples'][active, None]
+        self.write_slot(tier, tier['bucket'] * tier['step'], active, means.astype(np.float32))
+        tier['sum'][:] = 0
+        tier['samples'][:] = 0
+
+    def ordered_indices(self, tier):
+        return (np.arange(tier['count']) + tier['head'] - tier['count']) % tier['size']
+
+    def pick_tier(self, start_ts):
+        """Cel mai fin nivel care mai conține date de la start_ts"""
+        for name, _, _ in self.TIERS:
+            tier = self.tiers[name]
+            if tier['count'] == tier['size'] and tier['times'][tier['head']] > start_ts:
+                continue  # Nivelul s-a rotit deja peste începutul intervalului
+            return name
+        return self.TIERS[-1][0]
+
+    def query(self, server_id, metric, start_ts=None, end_ts=None, tier=None):
+        """Returnează (timestamps, valori, nivel) pentru un server și o metrică"""
+        slot = self.slots.get(server_id)
+        start_ts = -np.inf if start_ts is None else start_ts
+        end_ts = np.inf if end_ts is None else end_ts
+        tier_name = tier or self.pick_tier(start_ts)
+        if slot is None:
+            return np.empty(0), np.empty(0, dtype=np.float32), tier_name
+
+        tier = self.tiers[tier_name]
+        indices = self.ordered_indices(tier)
+        times = tier['times'][indices]
+        values = tier['values'][slot, self.METRICS.index(metric), indices]
+        mask = (times >= start_ts) & (times <= end_ts) & ~np.isnan(values)
+        return times[mask], values[mask], tier_name
+
+    def memory_bytes(self):
+        return sum(tier['values'].nbytes + tier['sum'].nbytes + tier['times'].nbytes
+                   for tier in self.tiers.values())
+
+    def save(self, path):
+        """Persistă istoricul într-un fișier .npz (la închiderea aplicației)"""
+        # ID-urile ca unicode cu lățime fixă - fișierul se încarcă fără pickle
+        arrays = {'ids': np.array([str(server_id) for server_id in self.slots], dtype=str),
+                  'slots': np.array(list(self.slots.values()), dtype=np.int64)}
+        for name, tier in self.tiers.items():
+            arrays[f'{name}_values'] = tier['values']
+            arrays[f'{name}_times'] = tier['times']
+            arrays[f'{name}_state'] = np.array([tier['head'], tier['count']])
+        StorageBackend.atomic_write(path, lambda temp_path: np.savez(temp_path, **arrays))
+
+    @classmethod
+    def load(cls, path):
+        """Reîncarcă un istoric salvat cu save(); găleata în curs se pierde"""
+        with np.load(path, allow_pickle=False) as data:
+            capacity = data['raw_values'].shape[0]
+            history = cls(initial_servers=capacity)
+            for name, tier in history.tiers.items():
+                if f'{name}_values' not in data or data[f'{name}_values'].shape[2] != tier['size']:
+                    continue  # Configurație de niveluri schimbată - nivelul pornește gol
+                tier['values'][:] = data[f'{name}_values']
+                tier['times'][:] = data[f'{name}_times']
+                tier['head'], tier['count'] = (int(v) for v in data[f'{name}_state'])
+            for server_id, slot in zip(data['ids'].tolist(), data['slots']):
+                history.slots[server_id] = int(slot)
+        used = set(history.slots.values())
+        history.free_slots = [slot for slot in range(capacity - 1, -1, -1) if slot not in used]
+        return history
+
+
+class LogStore:
+    """Jurnal de loguri per server, append-only, în fișiere segment.
+
+    Fiecare intrare este o linie JSON {"t": timestamp, "s": ID, "m": mesaj} adăugată
+    la finalul segmentului activ. În memorie se păstrează doar indexul per server:
+    segmentul, offset-ul și timestamp-ul fiecărei intrări. Adăugarea costă o
+    scriere, iar tail/paginarea citesc doar intrările cerute. Segmentele se rotesc
+    după dimensiune, iar cele mai vechi se șterg după vârstă sau după spațiul total.
+    """
+
+    def __init__(self, directory, segment_max_bytes=4 * 1024 * 1024,
+                 retention_days=30, max_total_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.retention_days = retention_days
+        self.max_total_bytes = max_total_bytes
+        self.lock = threading.RLock()
+        self.index = {}  # ID server → {'segments': array, 'offsets': array, 'times': array}
+        self.readers = {}  # număr segment → fișier deschis pentru citire
+        self.active_segment = None
+        self.active_file = None
+        os.makedirs(directory, exist_ok=True)
+        self.open()
+
+    def segment_path(self, number):
+        return os.path.join(self.directory, f"segment-{number:06d}.log")
+
+    def segment_numbers(self):
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith("segment-") and name.endswith(".log"):
+                numbers.append(int(name[8:-4]))
+        return sorted(numbers)
+
+    def open(self):
+        """Reconstruiește indexul citind secvențial segmentele existente.
+
+        Liniile ilizibile se sar. Finalul incomplet al ultimului segment (scriere
+        întreruptă) se taie, ca adăugările următoare să înceapă pe o linie nouă.
+        """
+        numbers = self.segment_numbers()
+        for number in numbers:
+            path = self.segment_path(number)
+            with open(path, 'rb') as segment:
+                offset = 0
+                valid_end = 0
+                for line in segment:
+                    try:
+                        record = json.loads(line) if line.endswith(b"\n") else None
+                    except ValueError:
+                        record = None
+                    if isinstance(record, dict):
+                        self.index_record(record, number, offset)
+                        valid_end = offset + len(line)
+                    offset += len(line)
+            if number == numbers[-1] and valid_end < offset:
+                os.truncate(path, valid_end)
+                log.warning(f"⚠️ Segment de loguri {os.path.basename(path)}: "
+                            f"{offset - valid_end} octeți incompleți la final eliminați")
+        self.start_segment(numbers[-1] if numbers else 1)
+
+    def index_record(self, record, segment, offset):
+        server_id = record['s']
+        entry = self.index.get(server_id)
+        if 'cut' in record:
+            # Marcaj de trunchiere: se elimină intrările de la poziția (segment, offset) încolo.
+            # Poziția rămâne validă și după ce retenția șterge segmentele vechi din index
+            if entry is not None:
+                cut_segment, cut_offset = record['cut']
+                start = bisect.bisect_left(entry['segments'], cut_segment)
+                stop = bisect.bisect_right(entry['segments'], cut_segment)
+                start += bisect.bisect_left(entry['offsets'][start:stop], cut_offset)
+                for key in ('segments', 'offsets', 'times'):
+                    del entry[key][start:]
+            return
+        if 'keep' in record:
+            # Marcaj vechi, pozițional (fișiere scrise de versiunile anterioare)
+            if entry is not None:
+                for key in ('segments', 'offsets', 'times'):
+                    del entry[key][record['keep']:]
+            return
+        if entry is None:
+            entry = self.index[server_id] = {
+                'segments': array('i'), 'offsets': array('q'), 'times': array('d')}
+        entry['segments'].append(segment)
+        entry['offsets'].append(offset)
+        entry['times'].append(record['t'])
+
+    def start_segment(self, number):
+        if self.active_file:
+            self.active_file.close()
+        self.active_segment = number
+        self.active_file = open(self.segment_path(number), 'ab')
+
+    def write_record(self, record):
+        with self.lock:
+            if self.active_file.tell() >= self.segment_max_bytes:
+                self.start_segment(self.active_segment + 1)
+                self.apply_retention()
+            offset = self.active_file.tell()
+            self.active_file.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n")
+            self.active_file.flush()
+            self.index_record(record, self.active_segment, offset)
+
+    def append(self, server_id, message, timestamp=None, raw=False):
+        """Adaugă o intrare; raw=True păstrează textul exact (fără prefixul de timp la afișare)"""
+        record = {'t': timestamp if timestamp is not None else time.time(), 's': server_id, 'm': message}
+        if raw:
+            record['r'] = 1
+        self.write_record(record)
+
+    def truncate(self, server_id, keep):
+        """Păstrează doar primele `keep` intrări (marcaj în jurnal; spațiul se eliberează la retenție)"""
+        with self.lock:
+            entry = self.index.get(server_id)
+            if entry is None or keep >= len(entry['offsets']):
+                return
+            cut = [entry['segments'][keep], entry['offsets'][keep]]
+            self.write_record({'t': time.time(), 's': server_id, 'cut': cut})
+
+    def clear(self, server_id):
+        self.truncate(server_id, 0)
+
+    def count(self, server_id):
+        entry = self.index.get(server_id)
+        return len(entry['offsets']) if entry else 0
+
+    def read_entry(self, segment, offset):
+        reader = self.readers.get(segment)
+        if reader is None:
+            reader = self.readers[segment] = open(self.segment_path(segment), 'rb')
+        reader.seek(offset)
+        return json.loads(reader.readline())
+
+    def entries(self, server_id, start, stop):
+        """Intrările [start, stop) ale unui server, ca listă de înregistrări"""
+        with self.lock:
+            self.active_file.flush()
+            entry = self.index.get(server_id)
+            if entry is None:
+                return []
+            return [self.read_entry(entry['segments'][i], entry['offsets'][i])
+                    for i in range(max(0, start), min(stop, len(entry['offsets'])))]
+
+    def tail(self, server_id, limit, before=None):
+        """Ultimele `limit` intrări înaintea poziției `before`; returnează (start, înregistrări)"""
+        total = self.count(server_id)
+        stop = total if before is None else min(before, total)
+        start = max(0, stop - limit)
+        return start, self.entries(server_id, start, stop)
+
+    @staticmethod
+    def format_record(record):
+        if record.get('r'):
+            return record['m']
+        return f"[{datetime.fromtimestamp(record['t']).strftime('%Y-%m-%d %H:%M:%S')}] {record['m']}"
+
+    def apply_retention(self):
+        """Șterge segmentele mai vechi decât retenția sau peste limita de spațiu"""
+        with self.lock:
+            numbers = [n for n in self.segment_numbers() if n != self.active_segment]
+            sizes = {n: os.path.getsize(self.segment_path(n)) for n in numbers}
+            total = sum(sizes.values()) + self.active_file.tell()
+            cutoff = time.time() - self.retention_days * 86400
+
+            removed = []
+            for number in numbers:
+                too_old = os.path.getmtime(self.segment_path(number)) < cutoff
+                if not too_old and total <= self.max_total_bytes:
+                    break
+                reader = self.readers.pop(number, None)
+                if reader:
+                    reader.close()
+                os.remove(self.segment_path(number))
+                total -= sizes[number]
+                removed.append(number)
+
+            if removed:
+                self.prune_index(max(removed) + 1)
+                log.info(f"🗂️ Retenție loguri: {len(removed)} segmente șterse")
+
+    def prune_index(self, first_segment):
+        """Elimină din index intrările din segmentele șterse (mereu un prefix per server)"""
+        for server_id in list(self.index):
+            entry = self.index[server_id]
+            keep_from = bisect.bisect_left(entry['segments'], first_segment)
+            if keep_from == len(entry['segments']):
+                del self.index[server_id]
+            elif keep_from:
+                for key in ('segments', 'offsets', 'times'):
+                    del entry[key][:keep_from]
+
+    def close(self):
+        with self.lock:
+            for reader in self.readers.values():
+                reader.close()
+            self.readers = {}
+            if self.active_file:
+                self.active_file.close()
+                self.active_file = None
+
+
+class RuleSet:
+    """Reguli de prag declarative, citite dintr-un fișier JSON și compilate în măști vectorizate.
+
+    Fiecare regulă are o metrică, un operator ('>' sau '<'), pragul de declanșare
+    `raise`, pragul de revenire `clear`, durata `for_ticks` (câte tick-uri
+    consecutive trebuie să fie încălcat pragul) și severitatea. Opțional
+    `critical` este pragul folosit pentru contorul „Critical” din header.
+    Secțiunea `overrides` schimbă pragurile pentru un grup de servere, după
+    valorile oricărei coloane (listă de valori; sufixul '*' înseamnă prefix):
+
+        {"name": "cpu_critical", "metric": "CPU_Usage", "raise": 90, "clear": 85,
+         "for_ticks": 3, "severity": "critical",
+         "overrides": [{"match": {"Locatie": ["Rack A*"]}, "raise": 95, "clear": 92}]}
+
+    Fișierul este verificat după mtime și recompilat fără repornire; dacă noua
+    versiune e invalidă rămân active regulile anterioare.
+
+    Pragurile per server ale regulilor cu override-uri se calculează o singură dată
+    (comparațiile pe text sunt scumpe) și se refolosesc la fiecare tick, până când
+    motorul anunță că flota s-a schimbat (invalidate_masks) sau regulile sunt reîncărcate.
+    """
+
+    DEFAULT_RULES = (
+        {'name': 'cpu_critical', 'metric': 'CPU_Usage', 'raise': 90, 'clear': 85, 'critical': 90,
+         'severity': 'critical', 'label': '🚨 CPU CRITIC', 'short': 'CPU'},
+        {'name': 'ram_high', 'metric': 'RAM_Usage', 'raise': 85, 'clear': 80, 'critical': 90,
+         'severity': 'warning', 'label': '⚠️ RAM RIDICAT', 'short': 'RAM'},
+        {'name': 'disk_full', 'metric': 'Disk_Usage', 'raise': 90, 'clear': 87, 'critical': 90,
+         'severity': 'critical', 'label': '💾 DISK PLIN', 'short': 'Disk'},
+    )
+    SEVERITIES = ('critical', 'warning', 'info')
+    OPERATORS = {'>': np.greater, '<': np.less}
+
+    def __init__(self, path=None):
+        self.path = path
+        self.rules = self.compile(self.DEFAULT_RULES)
+        self.mtime = None
+        self.version = 0
+        self.last_error = None
+        self.streaks = {}  # regulă → (ids, contor de tick-uri consecutive peste prag)
+        self.limits = {}  # regulă → praguri per server pe toată flota (doar regulile cu override-uri)
+        self.mask_generation = 0
+        if path is not None:
+            if not os.path.exists(path):
+                self.write_defaults()
+            self.reload_if_changed()
+
+    def write_defaults(self):
+        """Scrie regulile implicite ca punct de plecare pentru editare"""
+        try:
+            with open(self.path, 'w', encoding='utf-8') as handle:
+                json.dump({'rules': [dict(rule, for_ticks=1, overrides=[]) for rule in self.DEFAULT_RULES]},
+                          handle, ensure_ascii=False, indent=2)
+            log.info(f"📐 Fișier reguli creat: {self.path}")
+        except OSError as e:
+            log.warning(f"⚠️ Nu pot crea {self.path}, folosesc regulile implicite: {e}")
+
+    def reload_if_changed(self):
+        """Recompilează regulile dacă fișierul s-a modificat; returnează True la reîncărcare"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except (OSError, TypeError):
+            return False
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime  # Și pentru o versiune invalidă - nu se reîncearcă până la următoarea salvare
+        try:
+            with open(self.path, encoding='utf-8') as handle:
+                spec = json.load(handle)
+            rules = self.compile(spec.get('rules', []) if isinstance(spec, dict) else spec)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            self.last_error = str(e)
+            log.error(f"❌ Reguli invalide în {self.path}, rămân cele anterioare: {e}")
+            return False
+        self.rules = rules
+        self.version += 1
+        self.last_error = None
+        self.invalidate_masks()
+        self.streaks = {name: streak for name, streak in self.streaks.items()
+                        if any(rule['name'] == name for rule in rules)}
+        log.info(f"📐 {len(rules)} reguli de alertă încărcate din {self.path} (versiunea {self.version})")
+        return True
+
+    @classmethod
+    def compile(cls, specs):
+        """Validează specificațiile și le transformă în reguli gata de evaluat"""
+        rules = []
+        names = set()
+        for spec in specs:
+            rule = dict(spec)
+            for field in ('name', 'metric', 'raise'):
+                if field not in rule:
+                    raise KeyError(f"regula {spec!r} nu are câmpul '{field}'")
+            if rule['name'] in names:
+                raise ValueError(f"regula '{rule['name']}' este definită de două ori")
+            names.add(rule['name'])
+            rule.setdefault('op', '>')
+            if rule['op'] not in cls.OPERATORS:
+                raise ValueError(f"operator necunoscut '{rule['op']}' în regula '{rule['name']}'")
+            rule['raise'] = float(rule['raise'])
+            rule['clear'] = float(rule.get('clear', rule['raise']))
+            if rule.get('critical') is not None:
+                rule['critical'] = float(rule['critical'])
+            rule.setdefault('critical', None)
+            rule['for_ticks'] = max(1, int(rule.get('for_ticks', 1)))
+            rule.setdefault('severity', 'warning')
+            if rule['severity'] not in cls.SEVERITIES:
+                raise ValueError(f"severitate necunoscută '{rule['severity']}' în regula '{rule['name']}'")
+            rule.setdefault('label', f"⚠️ {rule['name'].upper()}")
+            rule.setdefault('short', rule['metric'])
+            rule['compare'] = cls.OPERATORS[rule['op']]
+            rule['overrides'] = [cls.compile_override(rule, override) for override in rule.get('overrides', [])]
+            rules.append(rule)
+        return rules
+
+    @staticmethod
+    def compile_override(rule, override):
+        """Un override devine (coloană → valori exacte și prefixe, praguri înlocuite)"""
+        match = override.get('match')
+        if not isinstance(match, dict) or not match:
+            raise ValueError(f"override fără 'match' în regula '{rule['name']}'")
+        conditions = []
+        for column, wanted in match.items():
+            wanted = [str(value) for value in (wanted if isinstance(wanted, list) else [wanted])]
+            exact = [value for value in wanted if not value.endswith('*')]
+            prefixes = tuple(value[:-1] for value in wanted if value.endswith('*'))
+            conditions.append((column, exact, prefixes))
+        thresholds = {field: override[field] for field in ('raise', 'clear', 'critical') if field in override}
+        return conditions, thresholds
+
+    @staticmethod
+    def column(servers, column, positions=None):
+        values = servers[column] if column in servers.columns else pd.Series('', index=servers.index)
+        return values if positions is None else values.iloc[positions]
+
+    def invalidate_masks(self):
+        """Flota (rânduri sau coloanele potrivite de override-uri) ori regulile s-au schimbat"""
+        self.limits = {}
+        self.mask_generation += 1
+
+    def fleet_limits(self, rule, servers):
+        """Pragurile per server ale regulii pe toată flota, din cache dacă flota nu s-a schimbat"""
+        cached = self.limits.get(rule['name'])
+        if cached is not None and len(cached['raise']) == len(servers):
+            return cached
+        generation = self.mask_generation
+        limits = {}
+        for field in ('raise', 'clear', 'critical'):
+            limits[field] = np.full(len(servers), np.nan if rule[field] is None else rule[field], dtype='float64')
+        for conditions, replaced in rule['overrides']:
+            mask = np.ones(len(servers), dtype=bool)
+            for column, exact, prefixes in conditions:
+                values = self.column(servers, column).astype(str)
+                matched = values.isin(exact).to_numpy(copy=True)
+                if prefixes:
+                    matched |= values.str.startswith(prefixes).to_numpy()
+                mask &= matched
+            for field, value in replaced.items():
+                limits[field][mask] = np.nan if value is None else value
+        for values in limits.values():
+            values.flags.writeable = False  # Partajate între tick-uri și fire
+        if generation == self.mask_generation:  # Altfel a fost invalidat între timp
+            self.limits[rule['name']] = limits
+        return limits
+
+    def thresholds(self, rule, servers, positions=None):
+        """Pragurile regulii pentru fiecare rând - scalari dacă regula nu are override-uri"""
+        if not rule['overrides']:
+            return {field: rule[field] for field in ('raise', 'clear', 'critical')}
+        limits = self.fleet_limits(rule, servers)
+        if positions is None:
+            return limits
+        return {field: values[positions] for field, values in limits.items()}
+
+    def evaluate(self, servers, ids, metrics, online):
+        """Evaluează toate regulile pe toată flota.
+
+        metrics conține array-urile deja calculate în tick (restul se citesc din
+        tabel). Returnează listă de (regulă, mască declanșare, mască revenire, valori).
+        """
+        evaluations = []
+        for rule in self.rules:
+            metric = rule['metric']
+            if metric in metrics:
+                values = metrics[metric]
+            elif metric in servers.columns:
+                values = servers[metric].to_numpy(dtype='float64', na_value=0.0)
+            else:
+                continue
+            limits = self.thresholds(rule, servers)
+            compare = rule['compare']
+            breached = online & compare(values, limits['raise'])
+            # Revenire: valoarea a trecut de pragul clear în sens opus (histerezis)
+            clear_mask = ~online | compare(limits['clear'], values)
+            if rule['for_ticks'] > 1:
+                breached = self.sustained(rule, ids, breached)
+            evaluations.append((rule, breached, clear_mask, values))
+        return evaluations
+
+    def sustained(self, rule, ids, breached):
+        """Condiția trebuie să țină for_ticks tick-uri la rând; contoarele urmăresc serverele după ID"""
+        previous = self.streaks.get(rule['name'])
+        if previous is None:
+            counts = np.zeros(len(ids), dtype='int32')
+        elif len(previous[0]) == len(ids) and np.array_equal(previous[0], ids):
+            counts = previous[1]
+        else:
+            # Flota s-a schimbat - contoarele se realiniază după ID (serverele noi pornesc de la 0)
+            indexer = pd.Index(previous[0]).get_indexer(ids)
+            counts = np.where(indexer >= 0, previous[1][indexer], 0).astype('int32')
+        counts = np.where(breached, np.minimum(counts + 1, rule['for_ticks']), 0).astype('int32')
+        self.streaks[rule['name']] = (ids, counts)
+        return counts >= rule['for_ticks']
+
+    def critical_mask(self, servers, positions=None, columns=None):
+        """Serverele peste pragul `critical` al cel puțin unei reguli (contorul din header).
+
+        columns poate conține array-urile deja extrase (aliniate cu positions).
+        """
+        count = len(servers) if positions is None else len(positions)
+        critical = np.zeros(count, dtype=bool)
+        for rule in self.rules:
+            if rule['metric'] not in servers.columns:
+                continue
+            limits = self.thresholds(rule, servers, positions)
+            if limits['critical'] is None:
+                continue
+            if columns is not None and rule['metric'] in columns:
+                values = columns[rule['metric']]
+            else:
+                values = self.column(servers, rule['metric'], positions).to_numpy(dtype='float64', na_value=0.0)
+            critical |= rule['compare'](values, limits['critical'])
+        return critical
+
+
+class AlertEngine:
+    """Motor de alerte cu stare pentru pragurile de resurse.
+
+    O alertă se deschide când metrica depășește pragul `raise` și se închide doar
+    când coboară sub pragul `clear` (histerezis). Cheia de deduplicare este
+    (server, regulă): cât timp condiția rămâne activă nu se mai emite nimic.
+    Cheile care își schimbă starea prea des sunt marcate „flapping” și tăcute
+    până se liniștesc; re-deschiderile la scurt timp după o notificare și
+    serverele puse manual pe pauză sunt suprimate. Alertele active (și istoricul
+    lor, cu momentele de deschidere și închidere) se păstrează în SQLite.
+    Regulile și pragurile vin din RuleSet.
+    """
+
+    def __init__(self, db_path, flap_window=600, flap_threshold=4,
+                 suppression_window=300, history_days=30):
+        self.db_path = db_path
+        self.known_rules = None  # Numele regulilor de la ultima evaluare
+        self.flap_window = flap_window
+        self.flap_threshold = flap_threshold
+        self.suppression_window = suppression_window
+        self.history_days = history_days
+        self.lock = threading.RLock()
+        self.conn = None
+        self.active = {}  # (server_id, regulă) → {'row_id', 'opened', 'severity'}
+        self.transitions = {}  # (server_id, regulă) → deque cu momentele schimbărilor de stare
+        self.flapping = {}  # (server_id, regulă) → momentul până la care cheia e tăcută
+        self.last_notified = {}  # (server_id, regulă) → ultima notificare de deschidere
+        self.suppressed = {}  # server_id → pauză manuală până la acest moment
+        self.stats = {'opened': 0, 'cleared': 0, 'suppressed': 0}
+        self.unsaved = deque()  # Loturi nescrise (bază de date blocată), reluate la următoarea scriere
+        self.load_active()
+
+    def connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS alerts "
+                              "(id INTEGER PRIMARY KEY AUTOINCREMENT, server_id TEXT, rule TEXT, "
+                              "severity TEXT, opened_at REAL, opened_value REAL, "
+                              "cleared_at REAL, cleared_value REAL)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS alerts_active ON alerts (cleared_at)")
+        return self.conn
+
+    def load_active(self):
+        """Restaurează alertele deschise la ultima rulare - nu se re-notifică după restart"""
+        with self.lock:
+            conn = self.connect()
+            cutoff = time.time() - self.history_days * 86400
+            with conn:
+                conn.execute("DELETE FROM alerts WHERE cleared_at IS NOT NULL AND cleared_at < ?", (cutoff,))
+            rows = conn.execute("SELECT id, server_id, rule, severity, opened_at FROM alerts "
+                                "WHERE cleared_at IS NULL").fetchall()
+        for row_id, server_id, rule, severity, opened in rows:
+            self.active[(server_id, rule)] = {'row_id': row_id, 'opened': opened, 'severity': severity}
+        if rows:
+            log.info(f"🔔 {len(rows)} alerte active restaurate din {self.db_path}")
+
+    def reload(self):
+        """Re-citește alertele active după înlocuirea bazei de date (restaurare din backup)"""
+        with self.lock:
+            self.active.clear()
+            self.transitions.clear()
+            self.flapping.clear()
+            self.last_notified.clear()
+            self.unsaved.clear()  # Loturile nescrise aparțin stării dinaintea restaurării
+            self.load_active()
+
+    def clear(self):
+        """Șterge toate alertele, active și istoric (flota a fost înlocuită)"""
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                conn.execute("DELETE FROM alerts")
+            self.reload()
+
+    def suppress(self, server_id, seconds):
+        """Pauză manuală pentru toate notificările unui server (ex. mentenanță)"""
+        with self.lock:  # Apelat din UI cât timp firul de monitorizare evaluează
+            self.suppressed[server_id] = time.time() + seconds
+
+    def record_transition(self, key, now):
+        """Înregistrează o schimbare de stare; returnează True dacă cheia tocmai a devenit flapping"""
+        history = self.transitions.setdefault(key, deque(maxlen=self.flap_threshold * 2))
+        history.append(now)
+        recent = sum(1 for moment in history if now - moment <= self.flap_window)
+        if recent >= self.flap_threshold and self.flapping.get(key, 0) <= now:
+            self.flapping[key] = now + self.flap_window
+            return True
+        if key in self.flapping and self.flapping[key] > now:
+            self.flapping[key] = max(self.flapping[key], now + self.flap_window / 2)
+        return False
+
+    def is_quiet(self, key, server_id, now):
+        return self.flapping.get(key, 0) > now or self.suppressed.get(server_id, 0) > now
+
+    def evaluate(self, ids, names, evaluations, positions, now=None):
+        """Aplică rezultatele RuleSet.evaluate: listă de (regulă, declanșare, revenire, valori)"""
+        now = time.time() if now is None else now
+        alerts = []
+        with self.lock:
+            for rule, raise_mask, clear_mask, values in evaluations:
+                alerts.extend(self.process_rule(rule, raise_mask, clear_mask, ids, names, values,
+                                                positions, now))
+            rule_names = {rule['name'] for rule, _, _, _ in evaluations}
+            if rule_names != self.known_rules:
+                self.retire_rules(rule_names, now)
+                self.known_rules = rule_names
+        return alerts
+
+    def retire_rules(self, rule_names, now):
+        """Închide fără notificare alertele regulilor scoase din fișier"""
+        retired = {}
+        for key in [key for key in self.active if key[1] not in rule_names]:
+            state = self.active.pop(key)
+            retired.setdefault(key[1], []).append((state['row_id'], None, key))
+        for rule_name, cleared_rows in retired.items():
+            self.persist({'name': rule_name, 'severity': None}, [], cleared_rows, now)
+            log.info(f"📐 Regula '{rule_name}' eliminată - {len(cleared_rows)} alerte active închise")
+
+    def process_rule(self, rule, raise_mask, clear_mask, ids, names, values, positions, now=None):
+        """Aplică o regulă pe măștile calculate pentru toată flota; returnează alertele de emis.
+
+        positions este indexul ID → poziție al tabelului (verificat contra `ids`).
+        """
+        now = time.time() if now is None else now
+        rule_name = rule['name']
+        alerts = []
+        opened_rows = []
+        cleared_rows = []
+
+        # Deschideri: doar serverele peste prag care nu au deja alerta activă
+        for pos in raise_mask.nonzero()[0]:
+            server_id = ids[pos]
+            key = (server_id, rule_name)
+            if key in self.active:
+                continue  # Deduplicare - condiția era deja deschisă
+            value = float(values[pos])
+            self.active[key] = {'row_id': None, 'opened': now, 'severity': rule['severity']}
+            opened_rows.append((key, value))
+            self.stats['opened'] += 1
+
+            if self.record_transition(key, now):
+                alerts.append((f"🔁 FLAPPING: {server_id} ({names[pos]}) - {rule['label']} oscilează; "
+                               f"notificări suspendate {self.flap_window // 60} min", "warning"))
+            elif (self.is_quiet(key, server_id, now)
+                  or now - self.last_notified.get(key, float('-inf')) < self.suppression_window):
+                self.stats['suppressed'] += 1
+            else:
+                self.last_notified[key] = now
+                alerts.append((f"{rule['label']}: {server_id} ({names[pos]}) - "
+                               f"{rule['short']} la {value:.1f}%", rule['severity']))
+
+        # Închideri: doar alertele active ale regulii, verificate la poziția curentă
+        for key in [key for key in self.active if key[1] == rule_name]:
+            server_id = key[0]
+            pos = positions.get(server_id)
+            if pos is not None and (pos >= len(ids) or ids[pos] != server_id):
+                pos = None  # Server șters între timp - alerta se închide
+            if pos is not None and not clear_mask[pos]:
+                continue  # Încă în banda de histerezis sau peste prag
+            state = self.active.pop(key)
+            value = float(values[pos]) if pos is not None else None
+            cleared_rows.append((state['row_id'], value, key))
+            self.stats['cleared'] += 1
+
+            if pos is None or self.record_transition(key, now) or self.is_quiet(key, server_id, now):
+                continue
+            if self.last_notified.get(key, float('-inf')) >= state['opened']:
+                duration_min = (now - state['opened']) / 60
+                alerts.append((f"✅ {rule['short']} NORMAL: {server_id} ({names[pos]}) - "
+                               f"{rule['short']} la {value:.1f}% (activă {duration_min:.0f} min)", "success"))
+
+        if opened_rows or cleared_rows:
+            self.persist(rule, opened_rows, cleared_rows, now)
+        return alerts
+
+    def persist(self, rule, opened_rows, cleared_rows, now):
+        """Scrie deschiderile și închiderile unei reguli într-o singură tranzacție.
+
+        Dacă baza de date e blocată, lotul rămâne în așteptare și se reia la
+        următoarea scriere, în ordine.
+        """
+        with self.lock:
+            self.unsaved.append((rule, opened_rows, cleared_rows, now))
+            try:
+                while self.unsaved:
+                    self.write_batch(*self.unsaved[0])
+                    self.unsaved.popleft()
+            except sqlite3.OperationalError as e:
+                log.warning(f"⚠️ Istoric alerte amânat ({len(self.unsaved)} loturi în așteptare): {e}")
+
+    def write_batch(self, rule, opened_rows, cleared_rows, now):
+        with self.lock:
+            conn = self.connect()
+            with conn:
+                for key, value in opened_rows:
+                    cursor = conn.execute(
+                        "INSERT INTO alerts (server_id, rule, severity, opened_at, opened_value) "
+                        "VALUES (?, ?, ?, ?, ?)", (key[0], rule['name'], rule['severity'], now, value))
+                    if key in self.active:
+                        self.active[key]['row_id'] = cursor.lastrowid
+                for row_id, value, key in cleared_rows:
+                    if row_id is None:
+                        conn.execute("UPDATE alerts SET cleared_at = ?, cleared_value = ? "
+                                     "WHERE server_id = ? AND rule = ? AND cleared_at IS NULL",
+                                     (now, value, key[0], key[1]))
+                    else:
+                        conn.execute("UPDATE alerts SET cleared_at = ?, cleared_value = ? WHERE id = ?",
+                                     (now, value, row_id))
 
-        # Creare interfață
-        self.create_main_layout()
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
 
-        # Start monitorizare în background
-        self.monitor_thread = threading.Thread(target=self.monitor_servers, daemon=True)
-        self.monitor_thread.start()
 
-        print("🚀 Dashboard IT Professional inițializat cu succes")
+class UIDispatcher:
+    """Pipeline unic pentru actualizările de UI cerute din firele de lucru.
 
-    def setup_styles(self):
-        """Configurează stilurile moderne pentru interfață"""
-        try:
-            style = ttk.Style()
-            style.theme_use('clam')
+    Producătorii apelează post() din orice fir; evenimentele intră într-o coadă
+    thread-safe. Pe firul Tk, drain() rulează la un interval fix (implicit 10 Hz),
+    golește coada, grupează evenimentele pe tip și apelează fiecare handler o
+    singură dată per cadru, cu lista payload-urilor. Un cadru procesează cel mult
+    max_batch evenimente, restul rămân pentru cadrul următor.
+    """
 
-            # Configurări de culori moderne
-            style.configure('Title.TLabel',
-                           font=('Segoe UI', 16, 'bold'),
-                           foreground='#ecf0f1',
-                           background='#2c3e50')
+    def __init__(self, root, interval_ms=100, max_batch=5000, instruments=None):
+        self.root = root
+        self.instruments = instruments or Instrumentation()
+        self.interval_ms = interval_ms
+        self.max_batch = max_batch
+        self.queue = queue.SimpleQueue()
+        self.handlers = OrderedDict()  # tip eveniment → handler(payloads), în ordinea aplicării
+        self.job = None
+        self.stats = {'events': 0, 'frames': 0, 'max_frame_ms': 0.0}
+
+    def register(self, kind, handler):
+        self.handlers[kind] = handler
+
+    def post(self, kind, payload=None):
+        """Sigur de apelat din orice fir - nu atinge Tk"""
+        self.queue.put((kind, payload))
+
+    def start(self):
+        if self.job is None:
+            self.job = self.root.after(self.interval_ms, self.drain)
+
+    def stop(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    def drain(self):
+        """Un cadru: golește coada și aplică un singur pas de actualizare"""
+        self.job = None
+        try:
+            pending = {}
+            received = 0
+            while received < self.max_batch:
+                try:
+                    kind, payload = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                pending.setdefault(kind, []).append(payload)
+                received += 1
+
+            if pending:
+                start_time = time.perf_counter()
+                for kind, handler in self.handlers.items():
+                    payloads = pending.pop(kind, None)
+                    if payloads is None:
+                        continue
+                    try:
+                        handler(payloads)
+                    except Exception as e:
+                        log.error(f"❌ Eroare la actualizarea UI ({kind}): {e}")
+                for kind in pending:
+                    log.warning(f"⚠️ Eveniment UI fără handler: {kind}")
+
+                frame_ms = (time.perf_counter() - start_time) * 1000
+                self.stats['events'] += received
+                self.stats['frames'] += 1
+                self.stats['max_frame_ms'] = max(self.stats['max_frame_ms'], frame_ms)
+                if self.instruments.enabled:
+                    self.instruments.record('ui_frame', frame_ms)
+                    self.instruments.count('ui_events', received)
+            self.instruments.gauge('ui_queue_depth', self.queue.qsize())
+        finally:
+            self.job = self.root.after(self.interval_ms, self.drain)
+
+
+class FleetAPIHandler(BaseHTTPRequestHandler):
+    """Rutele HTTP ale FleetAPI (doar GET, răspunsuri JSON sau text/event-stream)"""
+    server_version = "ServerDashboardAPI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # Fără o linie de consolă per cerere (clienții fac polling des)
+
+    def do_GET(self):
+        api = self.server.api
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        api.engine.instruments.count('api_requests')
+        try:
+            if url.path == '/api/fleet':
+                self.send_versioned(query, api.fleet_body)
+            elif url.path == '/api/metrics':
+                self.send_versioned(query, api.metrics_body)
+            elif url.path.startswith('/api/servers/'):
+                server_id = unquote(url.path[len('/api/servers/'):])
+                self.send_versioned(query, lambda: api.server_body(server_id))
+            elif url.path == '/api/alerts':
+                since = int(query.get('since', ['0'])[0])
+                wait = min(float(query.get('wait', ['0'])[0]), api.MAX_WAIT)
+                alerts = api.alerts_after(since, wait)
+                self.send_body(200, json.dumps({'last': api.alert_seq, 'alerts': alerts}).encode('utf-8'))
+            elif url.path == '/api/events':
+                self.stream_events(query)
+            elif url.path == '/api/stats':
+                stats = api.engine.instruments.snapshot()
+                self.send_body(200, json.dumps(stats, default=api.json_default).encode('utf-8'))
+            else:
+                self.send_body(404, json.dumps({'error': f"Rută necunoscută: {url.path}"}).encode('utf-8'))
+        except KeyError as e:
+            self.send_body(404, json.dumps({'error': str(e.args[0])}).encode('utf-8'))
+        except ValueError as e:
+            self.send_body(400, json.dumps({'error': str(e)}).encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Clientul a închis conexiunea
+        except Exception as e:
+            log.error(f"❌ Eroare API la {url.path}: {e}")
+            self.send_body(500, json.dumps({'error': str(e)}).encode('utf-8'))
+
+    def send_body(self, status, body, etag=None, content_type='application/json; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_versioned(self, query, build):
+        """Răspuns condiționat: 304 dacă If-None-Match e versiunea curentă; cu ?wait=S așteaptă
+        întâi (long-poll) o versiune nouă"""
+        api = self.server.api
+        wait = min(float(query.get('wait', ['0'])[0]), api.MAX_WAIT)
+        known = self.headers.get('If-None-Match')
+        version = api.engine.state_version
+        if known == api.etag(version) and wait > 0:
+            version = api.engine.wait_for_change(version, wait)
+        if known == api.etag(version):
+            self.send_response(304)
+            self.send_header('ETag', known)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        version, body = build()
+        self.send_body(200, body, etag=api.etag(version))
+
+    def stream_events(self, query):
+        """Flux SSE: 'state' la fiecare versiune nouă, 'alert' (cu id = secvența) la fiecare alertă"""
+        api = self.server.api
+        engine = api.engine
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        # Last-Event-ID (reconectare) reia alertele de unde a rămas clientul
+        last_seq = int(self.headers.get('Last-Event-ID') or query.get('since', [api.alert_seq])[0])
+        version = None
+        while not api.stopping.is_set():
+            chunks = []
+            if engine.state_version != version:
+                version = engine.state_version
+                chunks.append(f"event: state\ndata: {json.dumps({'version': version, 'etag': api.etag(version)})}\n\n")
+            for alert in api.alerts_after(last_seq):
+                last_seq = alert['seq']
+                chunks.append(f"id: {last_seq}\nevent: alert\ndata: {json.dumps(alert)}\n\n")
+            # Comentariu periodic - menține conexiunea și detectează clienții plecați
+            self.wfile.write(("".join(chunks) or ": keepalive\n\n").encode('utf-8'))
+            self.wfile.flush()
+
+            with engine.state_changed:
+                engine.state_changed.wait_for(
+                    lambda: (engine.state_version != version or api.alert_seq > last_seq
+                             or api.stopping.is_set()), api.KEEPALIVE)
+
+
+class FleetAPI:
+    """API HTTP local, doar citire, peste MonitoringEngine (implicit pe 127.0.0.1).
+
+    GET /api/fleet           snapshot complet al serverelor
+    GET /api/servers/<ID>    un server și ultimele intrări din log
+    GET /api/metrics         agregatele flotei
+    GET /api/alerts?since=N  alertele cu secvența > N (?wait=S: long-poll)
+    GET /api/events          flux SSE cu schimbările de stare și alertele
+    GET /api/stats           timerele și contoarele instrumentației (vezi Instrumentation)
+
+    ETag-ul este versiunea snapshot-ului publicat; If-None-Match întoarce 304 fără
+    serializare, iar ?wait=S ține cererea până la o versiune nouă. Snapshot-ul complet
+    se serializează o singură dată per versiune, indiferent câți clienți îl cer.
+    """
+    MAX_WAIT = 60.0  # Secunde maxime pentru un long-poll
+    KEEPALIVE = 15.0  # Secunde între comentariile keepalive pe fluxul SSE
+
+    def __init__(self, engine, port=8765, host='127.0.0.1', alert_buffer=1000, log_entries=50):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.log_entries = log_entries
+        self.alerts = deque(maxlen=alert_buffer)
+        self.alert_seq = 0
+        self.fleet_cache = (None, b'')
+        self.cache_lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.httpd = None
+        self.thread = None
+        engine.subscribe(self.on_engine_event)
+
+    def etag(self, version):
+        return f'"{self.engine.state_session}-{version}"'
+
+    @staticmethod
+    def json_default(value):
+        return value.item() if hasattr(value, 'item') else str(value)
+
+    def on_engine_event(self, kind, payload):
+        """Abonat la motor: reține alertele într-un buffer circular numerotat"""
+        if kind != 'alert':
+            return
+        message, alert_type = payload
+        with self.engine.state_changed:
+            self.alert_seq += 1
+            self.alerts.append({'seq': self.alert_seq, 'time': time.time(),
+                                'message': message, 'type': alert_type})
+            self.engine.state_changed.notify_all()
+
+    def alerts_after(self, since, wait=0):
+        with self.engine.state_changed:
+            if wait > 0:
+                self.engine.state_changed.wait_for(lambda: self.alert_seq > since, wait)
+            return [alert for alert in self.alerts if alert['seq'] > since]
+
+    def fleet_body(self):
+        # Versiunea se citește înaintea snapshot-ului: corpul e cel puțin la fel de nou ca ETag-ul
+        version = self.engine.state_version
+        servers = self.engine.servers
+        with self.cache_lock:
+            if self.fleet_cache[0] == version:
+                return self.fleet_cache
+        rows = servers.to_json(orient='records', date_format='iso')
+        body = f'{{"version": {version}, "servers": {rows}}}'.encode('utf-8')
+        with self.cache_lock:
+            self.fleet_cache = (version, body)
+        return version, body
+
+    def server_body(self, server_id):
+        version = self.engine.state_version
+        servers = self.engine.servers
+        pos = self.engine.get_server_position(server_id, servers)
+        if pos is None:
+            raise KeyError(f"Serverul {server_id} nu a fost găsit")
+        row = servers.iloc[[pos]].to_json(orient='records', date_format='iso')[1:-1]
+        logs = [LogStore.format_record(record)
+                for record in self.engine.log_store.tail(server_id, self.log_entries)[1]]
+        body = f'{{"version": {version}, "server": {row}, "logs": {json.dumps(logs)}}}'
+        return version, body.encode('utf-8')
+
+    def metrics_body(self):
+        version = self.engine.state_version
+        metrics = self.engine.aggregator.metrics()
+        body = json.dumps({'version': version, 'metrics': metrics}, default=self.json_default)
+        return version, body.encode('utf-8')
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer((self.host, self.port), FleetAPIHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self
+        self.port = self.httpd.server_address[1]  # Portul real când s-a cerut 0
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        log.info(f"🌐 API local pornit pe http://{self.host}:{self.port}/api/fleet")
+
+    def stop(self):
+        if self.httpd is None:
+            return
+        self.stopping.set()
+        with self.engine.state_changed:
+            self.engine.state_changed.notify_all()  # Eliberează fluxurile SSE și long-poll-urile
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.httpd = None
+
+
+class FleetTrace:
+    """Înregistrare de metrici și status pentru redare în MonitoringEngine.
+
+    Fișier JSON Lines (comprimat gzip dacă numele se termină în .gz): prima linie este
+    antetul, fiecare linie următoare un cadru {"t": secunde de la început, "ids": [...],
+    "values": {coloană: [...]}} cu valorile serverelor modificate la acel pas. Primul
+    cadru conține de obicei toată flota, ca redarea să pornească din starea înregistrată.
+    """
+    FORMAT = "fleet-trace"
+    VERSION = 1
+    COLUMNS = ('Status', 'CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out',
+               'Uptime_Hours', 'Performance_Score')
+
+    def __init__(self, path):
+        self.path = path
+        with self.open_file(path) as handle:
+            self.header = self.parse_header(handle.readline())
+
+    @staticmethod
+    def open_file(path, mode='rt'):
+        if path.endswith('.gz'):
+            return gzip.open(path, mode, encoding='utf-8')
+        return open(path, mode, encoding='utf-8')
+
+    @classmethod
+    def parse_header(cls, line):
+        try:
+            header = json.loads(line)
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get('format') != cls.FORMAT:
+            raise ValueError("Fișierul nu este o înregistrare de flotă (fleet-trace)")
+        if header.get('version', 0) > cls.VERSION:
+            raise ValueError(f"Versiune de înregistrare nesuportată: {header['version']}")
+        return header
+
+    @classmethod
+    def header_line(cls, **meta):
+        return json.dumps({'format': cls.FORMAT, 'version': cls.VERSION, 'created': time.time(), **meta}) + "\n"
+
+    @staticmethod
+    def frame_line(offset, ids, values):
+        return json.dumps({'t': round(offset, 3), 'ids': ids, 'values': values}) + "\n"
+
+    @staticmethod
+    def encode(columns, positions):
+        """Coloană → lista valorilor rândurilor date (float-urile rotunjite la 2 zecimale)"""
+        values = {}
+        for column, data in columns.items():
+            selected = np.asarray(data)[positions]
+            if selected.dtype.kind == 'f':
+                selected = np.round(selected, 2)
+            values[column] = selected.tolist()
+        return values
+
+    def frames(self):
+        """Cadrele în ordine, ca (secunde de la început, ID-uri, coloană → valori)"""
+        with self.open_file(self.path) as handle:
+            self.parse_header(handle.readline())
+            for line in handle:
+                if line.strip():
+                    frame = json.loads(line)
+                    yield frame['t'], frame['ids'], frame['values']
+
+
+class TraceRecorder:
+    """Înregistrează evoluția flotei unui MonitoringEngine într-un FleetTrace.
+
+    Abonat la motor: după fiecare pas cu schimbări ('view') compară snapshot-ul publicat
+    cu cel înregistrat anterior și scrie doar rândurile modificate. Primul cadru, și orice
+    cadru după adăugarea/ștergerea de servere, conține toată flota.
+    """
+
+    def __init__(self, engine, path):
+        self.engine = engine
+        self.path = path
+        self.lock = threading.Lock()
+        self.handle = FleetTrace.open_file(path, 'wt')
+        self.handle.write(FleetTrace.header_line(source='record', servers=len(engine.servers)))
+        self.started = time.monotonic()
+        self.previous = None  # (ID-uri, coloană → valori) la ultimul cadru
+        self.frames = 0
+        engine.subscribe(self.on_engine_event)
+        self.record()
+
+    def on_engine_event(self, kind, payload):
+        if kind == 'view':
+            self.record()
+
+    def record(self):
+        servers = self.engine.servers
+        ids = servers['ID'].to_numpy(dtype=object)
+        columns = {column: servers[column].to_numpy() for column in FleetTrace.COLUMNS if column in servers.columns}
+        with self.lock:
+            if self.handle is None:
+                return
+            if (self.previous is None or len(self.previous[0]) != len(ids)
+                    or (self.previous[0] != ids).any() or self.previous[1].keys() != columns.keys()):
+                changed = np.arange(len(ids))
+            else:
+                mask = np.zeros(len(ids), dtype=bool)
+                for column, data in columns.items():
+                    old = self.previous[1][column]
+                    mask |= ~((data == old) | (pd.isna(data) & pd.isna(old)))
+                changed = mask.nonzero()[0]
+            self.previous = (ids, columns)
+            if len(changed):
+                self.handle.write(FleetTrace.frame_line(time.monotonic() - self.started, ids[changed].tolist(),
+                                                        FleetTrace.encode(columns, changed)))
+                self.frames += 1
+
+    def close(self):
+        self.engine.unsubscribe(self.on_engine_event)
+        with self.lock:
+            if self.handle is not None:
+                self.handle.close()
+                self.handle = None
+        log.info(f"⏺️ Înregistrare salvată în {self.path} ({self.frames} cadre)")
+
+
+class FleetGenerator:
+    """Flote sintetice realiste și înregistrări cu furtuni de avarii, reproductibile după seed.
+
+    Serverele sunt așezate ierarhic: centru de date → rând → rack → slot. IP-ul
+    (10.dc.rack.slot) și Locatie ("DC1 / Rack B07") derivă din poziție, deci override-urile
+    de reguli pot ținti un DC sau un rând prin prefix ("DC2 / Rack C*"). Rolul serverului
+    alege distribuțiile: CPU, RAM și disc din distribuții beta, trafic lognormal, uptime
+    exponențial. Câteva servere pornesc căzute, iar câteva rack-uri pornesc fierbinți.
+    """
+    # Rol → (pondere, beta CPU, beta RAM, beta disc, media logaritmică a traficului)
+    ROLES = {
+        'Web Server': (0.30, (4, 5), (3, 4), (2, 5), 7.2),
+        'Database Server': (0.15, (5, 4), (8, 3), (5, 3), 7.5),
+        'File Server': (0.10, (2, 8), (3, 6), (7, 2), 7.8),
+        'Mail Server': (0.08, (2, 6), (3, 5), (4, 4), 6.5),
+        'Backup Server': (0.07, (2, 9), (2, 6), (8, 2), 6.0),
+        'Cache Server': (0.10, (3, 6), (9, 2), (1.5, 8), 7.6),
+        'Compute Node': (0.20, (7, 3), (5, 4), (2, 6), 6.8),
+    }
+    SERVERS_PER_RACK = 40
+    RACKS_PER_ROW = 10
+    ROWS_PER_DC = 8
+    DOWN_RATE = 0.02       # Servere căzute la generare, independent
+    HOT_RACK_RATE = 0.03   # Rack-uri cu CPU ridicat (răcire slabă)
+    BACKGROUND_FAILURE = 0.002  # Căderi independente per pas în înregistrări, în afara furtunilor
+    BACKGROUND_RECOVERY = 0.1
+    STORMS = ('rack_power', 'load_spike', 'dc_partition', 'flapping')
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+    def scaled_beta(self, shape, low, high, count):
+        return low + self.rng.beta(*shape, count) * (high - low)
+
+    def generate(self, num_servers):
+        """DataFrame cu num_servers servere, cu schema bazei de date (MonitoringEngine.REQUIRED_COLUMNS)"""
+        rng = self.rng
+        slots = np.arange(num_servers)
+        racks_per_dc = self.RACKS_PER_ROW * self.ROWS_PER_DC
+        global_rack = slots // self.SERVERS_PER_RACK
+        dc, rack = np.divmod(global_rack, racks_per_dc)
+        slot = slots % self.SERVERS_PER_RACK
+
+        role_names = list(self.ROLES)
+        weights = np.array([spec[0] for spec in self.ROLES.values()])
+        roles = rng.choice(len(role_names), num_servers, p=weights / weights.sum())
+        cpu, ram, disk, traffic = (np.zeros(num_servers) for _ in range(4))
+        for index, (_, cpu_shape, ram_shape, disk_shape, log_traffic) in enumerate(self.ROLES.values()):
+            members = roles == index
+            count = int(members.sum())
+            cpu[members] = self.scaled_beta(cpu_shape, 5, 98, count)
+            ram[members] = self.scaled_beta(ram_shape, 10, 95, count)
+            disk[members] = self.scaled_beta(disk_shape, 20, 99, count)
+            traffic[members] = log_traffic
+
+        hot_racks = rng.random(int(global_rack[-1]) + 1 if num_servers else 0) < self.HOT_RACK_RATE
+        hot = hot_racks[global_rack]
+        cpu[hot] = np.clip(cpu[hot] + rng.uniform(15, 30, int(hot.sum())), 5, 98)
+
+        online = rng.random(num_servers) >= self.DOWN_RATE
+        network_in = np.clip(rng.lognormal(traffic, 0.6), 100, 50000).astype('int64')
+        network_out = np.clip(rng.lognormal(traffic - 0.2, 0.6), 100, 50000).astype('int64')
+        performance = np.clip(100 - (cpu + ram + disk) / 3 * 0.5, 0, 100)
+
+        return pd.DataFrame({
+            'ID': [f"SRV-{i + 1:05d}" for i in slots],
+            'Nume': [f"{role_names[role]} {i + 1}" for i, role in zip(slots, roles)],
+            'IP': [f"10.{d % 256}.{r}.{s + 1}" for d, r, s in zip(dc, rack, slot)],
+            'Locatie': [f"DC{d + 1} / Rack {chr(65 + r // self.RACKS_PER_ROW)}{r % self.RACKS_PER_ROW + 1:02d}"
+                        for d, r in zip(dc, rack)],
+            'Status': np.where(online, 'up', 'down').astype(object),
+            'CPU_Usage': np.where(online, np.round(cpu, 1), 0.0),
+            'RAM_Usage': np.where(online, np.round(ram, 1), 0.0),
+            'Disk_Usage': np.round(disk, 1),
+            'Network_In': np.where(online, network_in, 0),
+            'Network_Out': np.where(online, network_out, 0),
+            'Uptime_Hours': np.where(online, np.round(rng.exponential(720, num_servers), 1), 0.0),
+            'Performance_Score': np.where(online, np.round(performance, 1), 0.0),
+            'UltimaVerificare': pd.Timestamp(datetime.now()) - pd.to_timedelta(
+                rng.integers(0, 900, num_servers), unit='s'),
+        })
+
+    def storm_trace(self, servers, path, duration=900.0, tick=15.0, scenarios=STORMS):
+        """Scrie în path o înregistrare pentru flota dată, cu un cadru la fiecare `tick` secunde.
+
+        Între furtuni metricile evoluează ca în tick-ul de monitorizare (mers aleator),
+        cu căderi rare; furtunile pornesc la fracțiuni fixe din durată:
+            rack_power    20%     un rack întreg cade, serverele revin eșalonat
+            load_spike    35%     CPU-ul serverelor web crește cu 35-55 de puncte timp de 4 pași
+            dc_partition  55%     30% din serverele unui centru de date cad deodată, revin după 3 pași
+            flapping      70-85%  câteva servere cad și revin la fiecare pas
+        Returnează rezumatul: cadre, rânduri scrise, căderi.
+        """
+        rng = self.rng
+        num_servers = len(servers)
+        steps = max(1, int(duration // tick))
+        ids = servers['ID'].to_numpy(dtype=object)
+        locations = servers['Locatie'].astype(str).to_numpy(dtype=object)
+        names = servers['Nume'].astype(str)
+        online = servers['Status'].to_numpy(dtype=object, na_value='down') == 'up'
+        metrics = {column: servers[column].to_numpy(dtype='float64', na_value=0.0).copy()
+                   for column in FleetTrace.COLUMNS[1:]}
+
+        def columns():
+            values = {'Status': np.where(online, 'up', 'down').astype(object)}
+            values.update(metrics)
+            values['Network_In'] = metrics['Network_In'].astype('int64')
+            values['Network_Out'] = metrics['Network_Out'].astype('int64')
+            return values
+
+        def at(fraction):
+            return min(steps, max(1, int(round(steps * fraction))))
+
+        # Ținte alese o dată, din seed: pașii la care serverele sunt forțate jos/sus
+        forced_down = {}
+        forced_up = {}
+        spike = (0, 0, np.zeros(num_servers, dtype=bool))
+        if num_servers and 'rack_power' in scenarios:
+            racks = pd.unique(locations)
+            members = (locations == racks[rng.integers(len(racks))]).nonzero()[0]
+            forced_down.setdefault(at(0.20), []).append(members)
+            returns = at(0.20) + 2 + rng.integers(0, max(1, steps // 10), len(members))
+            for step in np.unique(returns):
+                forced_up.setdefault(int(step), []).append(members[returns == step])
+        if num_servers and 'load_spike' in scenarios:
+            web = names.str.startswith('Web').to_numpy()
+            spike = (at(0.35), at(0.35) + 4, web if web.any() else rng.random(num_servers) < 0.2)
+        if num_servers and 'dc_partition' in scenarios:
+            datacenters = np.array([location.split(' / ')[0] for location in locations], dtype=object)
+            target = datacenters[rng.integers(num_servers)]
+            members = ((datacenters == target) & (rng.random(num_servers) < 0.3)).nonzero()[0]
+            forced_down.setdefault(at(0.55), []).append(members)
+            forced_up.setdefault(at(0.55) + 3, []).append(members)
+        if num_servers and 'flapping' in scenarios:
+            flappers = rng.choice(num_servers, size=min(num_servers, max(3, num_servers // 500)), replace=False)
+            for step in range(at(0.70), at(0.85)):
+                (forced_down if (step - at(0.70)) % 2 == 0 else forced_up).setdefault(step, []).append(flappers)
+        spike_boost = rng.uniform(35, 55, int(spike[2].sum()))
+
+        frames = rows = outages = 0
+        with FleetTrace.open_file(path, 'wt') as handle:
+            handle.write(FleetTrace.header_line(source='storm', seed=self.seed, servers=num_servers,
+                                                duration=steps * tick, tick=tick, scenarios=list(scenarios)))
+            handle.write(FleetTrace.frame_line(0.0, ids.tolist(), FleetTrace.encode(columns(), slice(None))))
+            frames, rows = 1, num_servers
+            for step in range(1, steps + 1):
+                previous = {column: data.copy() for column, data in columns().items()}
+                cpu, ram, disk = metrics['CPU_Usage'], metrics['RAM_Usage'], metrics['Disk_Usage']
+
+                # Mers aleator, ca în simulate_monitoring_tick
+                changing = online & (rng.random(num_servers) < 0.3)
+                count = int(changing.sum())
+                cpu[changing] = np.clip(cpu[changing] + rng.uniform(-5, 5, count), 5, 98)
+                ram[changing] = np.clip(ram[changing] + rng.uniform(-3, 3, count), 10, 95)
+                disk[changing] = np.clip(disk[changing] + rng.uniform(-1, 1, count), 20, 99)
+                metrics['Uptime_Hours'][changing] += tick / 3600
+                metrics['Network_In'][changing] = rng.integers(100, 3001, count)
+                metrics['Network_Out'][changing] = rng.integers(100, 2501, count)
+                if step in (spike[0], spike[1]):
+                    boost = spike_boost if step == spike[0] else -spike_boost
+                    cpu[spike[2]] = np.clip(cpu[spike[2]] + boost, 5, 98)
+                    changing |= spike[2] & online
+                metrics['Performance_Score'][changing] = np.clip(
+                    100 - (cpu[changing] + ram[changing] + disk[changing]) / 3 * 0.5, 0, 100)
+
+                going_down = online & (rng.random(num_servers) < self.BACKGROUND_FAILURE)
+                recovering = ~online & (rng.random(num_servers) < self.BACKGROUND_RECOVERY)
+                for members in forced_down.get(step, ()):
+                    going_down[members] = online[members]
+                    recovering[members] = False
+                for members in forced_up.get(step, ()):
+                    recovering[members] = ~online[members]
+                    going_down[members] = False
+
+                for column in ('CPU_Usage', 'RAM_Usage', 'Network_In', 'Network_Out', 'Performance_Score'):
+                    metrics[column][going_down] = 0
+                count = int(recovering.sum())
+                cpu[recovering] = rng.uniform(10, 40, count)
+                ram[recovering] = rng.uniform(20, 60, count)
+                metrics['Network_In'][recovering] = rng.integers(100, 1001, count)
+                metrics['Network_Out'][recovering] = rng.integers(100, 801, count)
+                metrics['Performance_Score'][recovering] = rng.uniform(70, 95, count)
+                metrics['Uptime_Hours'][recovering] = 0
+                online[going_down] = False
+                online[recovering] = True
+                outages += int(going_down.sum())
+
+                current = columns()
+                changed = np.zeros(num_servers, dtype=bool)
+                for column, data in current.items():
+                    changed |= data != previous[column]
+                positions = changed.nonzero()[0]
+                if len(positions):
+                    handle.write(FleetTrace.frame_line(step * tick, ids[positions].tolist(),
+                                                       FleetTrace.encode(current, positions)))
+                    frames += 1
+                    rows += len(positions)
+        return {'frames': frames, 'rows': rows, 'outages': outages}
+
+
+class MonitoringEngine:
+    """Motorul de monitorizare, fără interfață grafică (nu are nevoie de tk.Tk).
+
+    Deține tabelul de servere, persistența, backup-urile, regulile de alertă, probele,
+    istoricul și logurile, plus bucla de monitorizare. Poate rula singur ca daemon
+    (--headless) sau sub ServerDashboard, care doar se abonează la evenimentele lui.
+
+    Evenimentele publicate sunt perechi (tip, payload): 'alert' (mesaj, tip_alertă),
+    'stats', 'details' (ID server sau None = oricare) și 'view'. Abonații sunt apelați
+    pe firul motorului, deci trebuie doar să pună evenimentul într-o coadă.
+    """
+    DB_FILE = "server_database.sqlite"
+    BACKUP_DIR = "backups"
+    HISTORY_FILE = "metrics_history.npz"
+    LOGS_DIR = "server_logs"
+    # Coloanele obligatorii și valorile implicite (UltimaVerificare primește momentul reparării)
+    REQUIRED_COLUMNS = {
+        'ID': 'SRV-000',
+        'Nume': 'Unknown Server',
+        'IP': '0.0.0.0',
+        'Locatie': 'Unknown',
+        'Status': 'down',
+        'CPU_Usage': 0.0,
+        'RAM_Usage': 0.0,
+        'Disk_Usage': 0.0,
+        'Network_In': 0,
+        'Network_Out': 0,
+        'Uptime_Hours': 0.0,
+        'Performance_Score': 0.0,
+        'UltimaVerificare': None
+    }
+
+    def __init__(self, monitor_interval=15.0, api_port=None, instrument=False,
+                 replay=None, replay_speed=1.0, record_trace=None):
+        # Bază de date principală (SQLite); Excel rămâne doar pentru import/export
+        self.db_file = self.DB_FILE
+        self.excel_file = "server_database.xlsx"
+        self.storage_backend = 'sqlite'
+        self.storage = STORAGE_BACKENDS[self.storage_backend](self.db_file)
+        # Scrierile în baza de date rulează pe un fir separat (pornit de start())
+        self.persistence = PersistenceWriter(self.write_servers, interval=1.0,
+                                             on_error=self.report_persistence_error)
+        self.persistence_lock = threading.Lock()  # O singură scriere/restaurare la un moment dat
+        self.backup_dir = self.BACKUP_DIR
+        self.backups = BackupManager(self.storage, self.backup_dir)
+        self.rules_file = "alert_rules.json"
+        self.rule_set = RuleSet(self.rules_file)  # Praguri de alertă, reîncărcate la modificarea fișierului
+        self.alert_engine = AlertEngine(self.db_file)
+        self.last_saved_servers = None  # Ultima versiune persistată (pentru jurnalul de modificări)
+        self.changes = ChangeSet()  # Celulele modificate de la ultima salvare (sub state_lock)
+        self.id_index = {}  # ID server → poziție rând în self.servers
+        # self.servers este un snapshot imutabil: scrierile fac o copie și o publică atomic
+        # (servers_update); cititorii folosesc referința curentă fără lock
+        self.state_lock = threading.RLock()  # Serializează doar scriitorii între ei
+        self.state_version = 0
+        self.state_session = f"{os.getpid()}-{int(time.time())}"  # Face versiunile unice între rulări
+        self.state_changed = threading.Condition()  # Notificat la fiecare snapshot publicat
+        self.journal_compact_threshold = 5000  # Celule în jurnal înainte de compactare
+        self.startup_timings = {}
+        self.aggregator = FleetAggregator(self.rule_set)  # Statistici header actualizate incremental
+        self.pending_aggregate = None  # Diferențe de agregate ale blocului servers_update curent
+        self.verify_aggregates = False  # True: verifică agregatele față de o recalculare completă
+        self.probe_engine = ProbeEngine()
+        self.real_probes = False  # True: statusul vine din probe TCP/ICMP reale pe coloana IP
+        self.monitor_interval = monitor_interval  # Secunde între două tick-uri de monitorizare
+        self.monitor_thread = None
+        self.stopping = threading.Event()
+        self.subscribers = []
+        # Redarea unei înregistrări (FleetTrace) înlocuiește simularea pe firul de monitorizare
+        self.replay = FleetTrace(replay) if replay else None
+        self.replay_speed = replay_speed  # 10 = de zece ori mai repede; 0 = fără așteptare între cadre
+        self.replay_summary = None
+        self.instruments = Instrumentation(enabled=instrument)  # Timere/contoare pe căile critice
+        self.api = FleetAPI(self, api_port) if api_port is not None else None  # API HTTP local (opțional)
+        self.history_file = self.HISTORY_FILE
+        self.logs_dir = self.LOGS_DIR
+        self.log_store = LogStore(self.logs_dir)
+        self.log_export_entries = 100  # Intrări per server în coloana Loguri la export Excel
+        self.performance_metrics = {}
+        self.rng = np.random.default_rng()
 
-            style.configure('Header.TLabel',
-                           font=('Segoe UI', 12, 'bold'),
-                           foreground='#3498db',
-                           background='#34495e')
+        # Încărcare date - o singură citire; importul/crearea predau direct DataFrame-ul scris
+        stage_start = time.perf_counter()
+        self.load_data(self.initialize_database())
+        self.startup_timings['load_data'] = (time.perf_counter() - stage_start) * 1000
+        self.metrics_history = self.load_metrics_history()
 
-            style.configure('Info.TLabel',
-                           font=('Segoe UI', 10),
-                           foreground='#ecf0f1',
-                           background='#34495e')
+        # Inițializare metrici pentru a evita erori
+        self.calculate_performance_metrics()
+        self.recorder = TraceRecorder(self, record_trace) if record_trace else None
 
-            style.configure('Modern.TFrame',
-                           background='#34495e',
-                           borderwidth=1,
-                           relief='solid')
+    def subscribe(self, callback):
+        """Abonează callback(tip, payload) la evenimentele motorului"""
+        self.subscribers.append(callback)
+        return callback
 
-            style.configure('Card.TFrame',
-                           background='#34495e',
-                           borderwidth=2,
-                           relief='raised')
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
 
-            # Configurare scrollbar mai gros
-            style.configure('Custom.Vertical.TScrollbar',
-                           gripcount=0,
-                           background='#34495e',
-                           darkcolor='#2c3e50',
-                           lightcolor='#5a6c7d',
-                           troughcolor='#2c3e50',
-                           borderwidth=2,
-                           arrowcolor='#ecf0f1',
-                           width=20)  # Mai gros
-
-        except Exception as e:
-            print(f"⚠️ Warning: Nu s-au putut configura stilurile: {e}")
+    def publish(self, kind, payload=None):
+        self.instruments.count(f"events.{kind}")
+        for callback in list(self.subscribers):
+            try:
+                callback(kind, payload)
+            except Exception as e:
+                log.warning(f"⚠️ Abonat eșuat pentru evenimentul {kind}: {e}")
+
+    def report_error(self, title, message):
+        """Eroare care necesită atenția operatorului (în dashboard devine dialog)"""
+        log.error(f"❌ {title}: {message}")
+
+    def start(self):
+        """Pornește firul de persistență și bucla de monitorizare"""
+        self.persistence.start()
+        if self.api is not None:
+            self.api.start()
+        self.monitor_thread = threading.Thread(
+            target=self.monitor_servers if self.replay is None else self.replay_servers, daemon=True)
+        self.monitor_thread.start()
 
     def initialize_database(self):
-        """Creează sau actualizează fișierul Excel cu structura completă"""
-        if not os.path.exists(self.excel_file):
-            print(f"📁 Creez fișierul {self.excel_file} cu structură avansată...")
-            self.create_new_excel()
-        else:
-            print(f"🔄 Verific și actualizez structura Excel-ului existent...")
-            self.update_existing_excel()
-
-    def create_new_excel(self):
-        """Creează un fișier Excel nou cu structura completă"""
+        """Creează sau importă baza de date principală (SQLite) dacă nu există.
+
+        Returnează DataFrame-ul scris la import/creare (ca load_data să nu recitească baza),
+        sau None când baza există deja.
+        """
+        if self.storage.exists():
+            log.info(f"🔄 Baza de date {self.db_file} găsită - structura se verifică la încărcare")
+            return None
+        if os.path.exists(self.excel_file):
+            log.info(f"📥 Import inițial din {self.excel_file} în {self.db_file}...")
+            return self.import_from_excel(self.excel_file)
+        log.info(f"📁 Creez baza de date {self.db_file} cu structură avansată...")
+        return self.create_new_database()
+
+    def create_new_database(self):
+        """Creează baza de date nouă cu structura completă și servere demonstrative"""
         default_data = {
             'ID': ['SRV-001', 'SRV-002', 'SRV-003', 'SRV-004', 'SRV-005'],
             'Nume': ['Web Server', 'Database Server', 'File Server', 'Mail Server', 'Backup Server'],
@@ -127,173 +3250,373 @@ class ServerDashboard:
             ]
         }
         df = pd.DataFrame(default_data)
-        df.to_excel(self.excel_file, index=False)
-        print(f"✅ Fișierul {self.excel_file} creat cu structură completă")
-
-    def update_existing_excel(self):
-        """Actualizează Excel-ul existent cu coloanele noi"""
-        try:
-            # Încarcă Excel-ul existent
-            existing_df = pd.read_excel(self.excel_file)
-            print(f"📊 Excel existent încărcat cu {len(existing_df)} servere")
-
-            # Lista coloanelor necesare cu valorile default
-            required_columns = {
-                'ID': 'SRV-000',
-                'Nume': 'Unknown Server',
-                'IP': '0.0.0.0',
-                'Locatie': 'Unknown',
-                'Status': 'down',
-                'CPU_Usage': 0.0,
-                'RAM_Usage': 0.0,
-                'Disk_Usage': 0.0,
-                'Network_In': 0,
-                'Network_Out': 0,
-                'Uptime_Hours': 0.0,
-                'Performance_Score': 0.0,
-                'UltimaVerificare': datetime.now(),
-                'Loguri': 'No logs available'
-            }
-
-            # Verifică și adaugă coloanele lipsă
-            columns_added = []
-            for col, default_value in required_columns.items():
-                if col not in existing_df.columns:
-                    if col == 'UltimaVerificare':
-                        existing_df[col] = [datetime.now()] * len(existing_df)
-                    elif col in ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Uptime_Hours', 'Performance_Score']:
-                        # Pentru servere existente, generează valori realiste
-                        if col == 'CPU_Usage':
-                            existing_df[col] = [random.uniform(10, 80) if status == 'up' else 0
-                                              for status in existing_df.get('Status', ['down'] * len(existing_df))]
-                        elif col == 'RAM_Usage':
-                            existing_df[col] = [random.uniform(20, 70) if status == 'up' else 0
-                                              for status in existing_df.get('Status', ['down'] * len(existing_df))]
-                        elif col == 'Disk_Usage':
-                            existing_df[col] = [random.uniform(30, 90) if status == 'up' else 0
-                                              for status in existing_df.get('Status', ['down'] * len(existing_df))]
-                        elif col == 'Uptime_Hours':
-                            existing_df[col] = [random.uniform(1, 2000) if status == 'up' else 0
-                                              for status in existing_df.get('Status', ['down'] * len(existing_df))]
-                        elif col == 'Performance_Score':
-                            existing_df[col] = [random.uniform(60, 95) if status == 'up' else 0
-                                              for status in existing_df.get('Status', ['down'] * len(existing_df))]
-                    elif col in ['Network_In', 'Network_Out']:
-                        existing_df[col] = [random.randint(100, 2000) if status == 'up' else 0
+        self.migrate_logs_column(df)
+        self.storage.save(df)
+        log.info(f"✅ Baza de date {self.db_file} creată cu structură completă")
+        return df
+
+    def repair_schema(self, existing_df):
+        """Adaugă coloanele lipsă în DataFrame; returnează lista coloanelor adăugate"""
+        # Verifică și adaugă coloanele lipsă
+        columns_added = []
+        for col, default_value in self.REQUIRED_COLUMNS.items():
+            if col not in existing_df.columns:
+                if col == 'UltimaVerificare':
+                    existing_df[col] = [datetime.now()] * len(existing_df)
+                elif col in ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Uptime_Hours', 'Performance_Score']:
+                    # Pentru servere existente, generează valori realiste
+                    if col == 'CPU_Usage':
+                        existing_df[col] = [random.uniform(10, 80) if status == 'up' else 0
                                           for status in existing_df.get('Status', ['down'] * len(existing_df))]
-                    else:
-                        existing_df[col] = [default_value] * len(existing_df)
-
-                    columns_added.append(col)
-                    print(f"  ➕ Adăugat coloana: {col}")
-
-            if columns_added:
-                # Salvează Excel-ul actualizat
-                existing_df.to_excel(self.excel_file, index=False)
-                print(f"✅ Excel actualizat cu {len(columns_added)} coloane noi")
-            else:
-                print("✅ Excel-ul are deja structura completă")
-
-        except Exception as e:
-            print(f"❌ Eroare la actualizarea Excel-ului: {e}")
-            print("🔄 Creez structură nouă...")
-            self.create_new_excel()
-
-    def load_data(self):
-        """Încarcă datele din fișierul Excel cu gestionarea erorilor"""
+                    elif col == 'RAM_Usage':
+                        existing_df[col] = [random.uniform(20, 70) if status == 'up' else 0
+                                          for status in existing_df.get('Status', ['down'] * len(existing_df))]
+                    elif col == 'Disk_Usage':
+                        existing_df[col] = [random.uniform(30, 90) if status == 'up' else 0
+                                          for status in existing_df.get('Status', ['down'] * len(existing_df))]
+                    elif col == 'Uptime_Hours':
+                        existing_df[col] = [random.uniform(1, 2000) if status == 'up' else 0
+                                          for status in existing_df.get('Status', ['down'] * len(existing_df))]
+                    elif col == 'Performance_Score':
+                        existing_df[col] = [random.uniform(60, 95) if status == 'up' else 0
+                                          for status in existing_df.get('Status', ['down'] * len(existing_df))]
+                elif col in ['Network_In', 'Network_Out']:
+                    existing_df[col] = [random.randint(100, 2000) if status == 'up' else 0
+                                      for status in existing_df.get('Status', ['down'] * len(existing_df))]
+                else:
+                    existing_df[col] = [default_value] * len(existing_df)
+
+                columns_added.append(col)
+                log.info(f"  ➕ Adăugat coloana: {col}")
+
+        return columns_added
+
+    def import_from_excel(self, excel_path):
+        """Importă serverele dintr-un fișier Excel în baza de date principală"""
+        existing_df = ExcelStorage(excel_path).load()
+        log.info(f"📊 Excel încărcat cu {len(existing_df)} servere")
+
+        columns_added = self.repair_schema(existing_df)
+        if columns_added:
+            log.info(f"✅ Structură completată cu {len(columns_added)} coloane noi")
+        self.migrate_logs_column(existing_df)
+
+        self.storage.save(existing_df)
+        log.info(f"✅ {len(existing_df)} servere importate în {self.db_file}")
+        return existing_df
+
+    def export_to_excel(self, excel_path=None):
+        """Exportă serverele curente într-un fișier Excel"""
+        excel_path = excel_path or self.excel_file
+        export_df = self.servers.copy()
+        # Compatibilitate cu Excel-urile vechi: ultimele intrări de log într-o coloană text
+        export_df['Loguri'] = [
+            "\n".join(LogStore.format_record(record)
+                      for record in self.log_store.tail(server_id, self.log_export_entries)[1])
+            for server_id in export_df['ID']
+        ]
+        ExcelStorage(excel_path).save(export_df)
+        log.info(f"📤 {len(self.servers)} servere exportate în {excel_path}")
+
+    def schema_token(self):
+        """Amprenta schemei validate: schema stocată + coloanele cerute de versiunea curentă"""
+        stored = self.storage.schema_fingerprint()
+        if stored is None:
+            return None
+        required = ",".join(self.REQUIRED_COLUMNS)
+        return hashlib.sha256(f"{stored}|{required}".encode('utf-8')).hexdigest()
+
+    def load_data(self, servers=None):
+        """Încarcă datele din baza de date principală cu gestionarea erorilor.
+
+        servers: DataFrame deja scris în bază (import/creare) - evită o a doua citire.
+        Verificarea și repararea schemei se fac doar dacă amprenta schemei din bază
+        diferă de cea salvată la ultima validare.
+        """
         try:
-            print(f"📊 Încărcare date din {self.excel_file}...")
-            self.servers = pd.read_excel(self.excel_file)
+            start_time = time.perf_counter()
+            token = self.schema_token()
+            schema_current = token is not None and token == self.storage.get_meta('schema_validated')
+            if servers is None:
+                log.info(f"📊 Încărcare date din {self.db_file}...")
+                servers = self.storage.load()
 
             # Conversie datetime pentru coloana UltimaVerificare
-            if 'UltimaVerificare' in self.servers.columns:
-                self.servers['UltimaVerificare'] = pd.to_datetime(self.servers['UltimaVerificare'])
-
-            print(f"✅ Date încărcate cu succes - {len(self.servers)} servere")
+            if 'UltimaVerificare' in servers.columns:
+                servers['UltimaVerificare'] = pd.to_datetime(servers['UltimaVerificare'])
 
-            # Verifică dacă toate coloanele necesare există
-            required_cols = ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Performance_Score']
-            missing_cols = [col for col in required_cols if col not in self.servers.columns]
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self.startup_timings['db_read'] = elapsed_ms
+            log.info(f"✅ Date încărcate cu succes - {len(servers)} servere ({elapsed_ms:.1f} ms)")
 
-            if missing_cols:
-                print(f"⚠️ Coloane lipsă detectate: {missing_cols}")
-                print("🔄 Re-inițializez baza de date...")
-                self.update_existing_excel()
-                # Reîncarcă după actualizare
-                self.servers = pd.read_excel(self.excel_file)
-                self.servers['UltimaVerificare'] = pd.to_datetime(self.servers['UltimaVerificare'])
-                print("✅ Date reîncărcate cu structura completă")
+            stage_start = time.perf_counter()
+            if schema_current:
+                log.info("✅ Schemă neschimbată de la ultima validare - verificarea structurii omisă")
+            else:
+                # Migrare în memorie; baza se rescrie doar dacă structura chiar s-a schimbat
+                columns_added = self.repair_schema(servers)
+                logs_migrated = self.migrate_logs_column(servers)
+                if columns_added or logs_migrated:
+                    if columns_added:
+                        log.warning(f"⚠️ Coloane lipsă completate: {columns_added}")
+                    self.storage.save(servers)
+                    log.info("✅ Structura completă salvată în baza de date")
+                self.storage.set_meta('schema_validated', self.schema_token())
+            self.startup_timings['schema_check'] = (time.perf_counter() - stage_start) * 1000
+
+            with self.state_lock:
+                self.publish_servers(servers)
+                self.last_saved_servers = self.servers.copy()
+                self.changes = ChangeSet()
+                self.rebuild_id_index()
+                self.aggregator.rebuild(self.servers)
 
         except Exception as e:
-            print(f"❌ Eroare critică la încărcarea datelor: {str(e)}")
-            print("🔄 Creez bază de date nouă...")
-            self.create_new_excel()
+            log.error(f"❌ Eroare critică la încărcarea datelor: {str(e)}")
+            if os.path.exists(self.storage.path):
+                # Baza există, dar nu poate fi citită - nu se suprascrie (ar însemna pierderea datelor)
+                generations = self.backups.generations
+                hint = (f"Ultimul backup: {generations[-1]['name']} (restaurare cu --restore NUME)"
+                        if generations else "Nu există backup-uri în " + os.path.abspath(self.backup_dir))
+                self.report_error("Eroare Fatală",
+                                  f"Baza de date {self.db_file} nu a putut fi citită:\n{str(e)}\n\n"
+                                  f"Fișierul a rămas neatins. {hint}\n\nAplicația se va închide.")
+                exit(1)
+            log.info("🔄 Creez bază de date nouă...")
             try:
-                self.servers = pd.read_excel(self.excel_file)
-                self.servers['UltimaVerificare'] = pd.to_datetime(self.servers['UltimaVerificare'])
-                print("✅ Bază de date nouă creată și încărcată")
+                servers = self.create_new_database()
+                with self.state_lock:
+                    self.publish_servers(servers)
+                    self.last_saved_servers = self.servers.copy()
+                    self.changes = ChangeSet()
+                    self.rebuild_id_index()
+                    self.aggregator.rebuild(self.servers)
+                log.info("✅ Bază de date nouă creată și încărcată")
             except Exception as e2:
-                print(f"❌ Eroare fatală: {str(e2)}")
-                messagebox.showerror("Eroare Fatală",
-                                   f"Nu s-a putut crea baza de date:\n{str(e2)}\n\nAplicația se va închide.")
+                self.report_error("Eroare Fatală",
+                                  f"Nu s-a putut crea baza de date:\n{str(e2)}\n\nAplicația se va închide.")
                 exit(1)
 
+    def rebuild_id_index(self):
+        """Reconstruiește indexul ID → poziție rând (după încărcare, adăugare sau ștergere)"""
+        self.id_index = {server_id: pos for pos, server_id in enumerate(self.servers['ID'].tolist())}
+        self.rule_set.invalidate_masks()  # Pragurile override-urilor sunt aliniate pe poziții
+
+    def get_server_position(self, server_id, servers=None):
+        """Returnează poziția rândului pentru un ID în O(1), sau None dacă serverul nu există.
+
+        servers fixează snapshot-ul în care se caută (implicit cel curent).
+        """
+        servers = self.servers if servers is None else servers
+        pos = self.id_index.get(server_id)
+        if pos is not None and pos < len(servers) and servers['ID'].iat[pos] == server_id:
+            return pos
+
+        # Index învechit (DataFrame înlocuit) - reconstruire o singură dată
+        self.rebuild_id_index()
+        pos = self.id_index.get(server_id)
+        if pos is not None and pos < len(servers) and servers['ID'].iat[pos] == server_id:
+            return pos
+        return None
+
+    def touch_server(self, server_id):
+        """Marchează momentul ultimei verificări pentru un server"""
+        with self.servers_update() as servers:
+            pos = self.get_server_position(server_id, servers)
+            if pos is not None:
+                servers.at[pos, 'UltimaVerificare'] = datetime.now()
+                self.changes.mark([server_id], ['UltimaVerificare'])
+
+    @contextmanager
+    def servers_update(self):
+        """Scriere copy-on-write în tabelul de servere.
+
+        Blocul modifică o copie, publicată atomic la ieșire; cititorii care țin
+        referința veche văd în continuare un snapshot consistent. La excepție
+        snapshot-ul curent rămâne neatins.
+
+        Blocul marchează în self.changes celulele atinse, ca salvarea să le jurnalizeze
+        doar pe ele; un bloc fără marcaje forțează compararea întregului tabel.
+        """
+        with self.state_lock:
+            marks = self.changes.marks
+            outer, self.pending_aggregate = self.pending_aggregate, []
+            try:
+                servers = self.servers.copy()
+                yield servers
+                unmarked = self.changes.marks == marks
+                if unmarked:
+                    self.changes.mark_all()
+                self.publish_servers(servers, self.pending_aggregate)
+            finally:
+                self.pending_aggregate = outer
+            if unmarked:
+                self.rule_set.invalidate_masks()  # Scriere nemarcată - orice coloană poate fi schimbată
+
+    def publish_servers(self, servers, aggregate=()):
+        """Înlocuiește snapshot-ul curent și trezește cititorii care așteaptă o versiune nouă.
+
+        aggregate - diferențele de agregate (FleetAggregator.delta) ale modificării,
+        aplicate sub același lock cu publicarea.
+        """
+        with self.state_lock:
+            self.servers = servers
+            if aggregate:
+                self.aggregator.commit(aggregate)
+            self.state_version += 1
+        with self.state_changed:
+            self.state_changed.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        """Blochează până când versiunea stării diferă de version (sau expiră timeout); o returnează"""
+        with self.state_changed:
+            self.state_changed.wait_for(lambda: self.state_version != version, timeout)
+        return self.state_version
+
+    def require_server_position(self, server_id, servers=None):
+        """Ca get_server_position, dar ridică KeyError dacă serverul nu există"""
+        pos = self.get_server_position(server_id, servers)
+        if pos is None:
+            raise KeyError(f"Serverul {server_id} nu a fost găsit")
+        return pos
+
     def save_data(self, silent=False):
-        """Salvează datele în fișierul Excel cu auto-backup și gestionare erori"""
-        try:
-            # Verifică dacă fișierul este în uz (deschis în Excel)
-            def is_file_in_use(filepath):
-                try:
-                    # Încearcă să deschidă fișierul pentru scriere
-                    with open(filepath, 'r+b'):
-                        pass
-                    return False
-                except (IOError, OSError):
-                    return True
+        """Cere salvarea snapshot-ului curent - scrierea are loc pe firul de persistență.
+
+        Cererile apropiate (tick-uri, editări succesive) se unesc într-o singură scriere.
+        """
+        self.persistence.request(silent)
+
+        # Metrici din agregatorul incremental (fără scanarea tabelului)
+        self.refresh_performance_metrics()
+        return True
+
+    def write_servers(self, silent=True):
+        """Salvează în jurnal doar celulele modificate de la ultima salvare (firul de persistență)"""
+        start_time = time.perf_counter()
+
+        with self.persistence_lock:
+            # Salvare incrementală: doar celulele marcate de scriitori de la ultima salvare.
+            # Snapshot-ul curent nu se mai modifică - poate fi reținut fără copie
+            with self.state_lock:
+                data_version = f"{self.state_session}:{self.state_version}"
+                servers = self.servers
+                changes, self.changes = self.changes, ChangeSet()
+            try:
+                if changes.full:
+                    # Modificări nemarcate - diferențele față de ultima versiune persistată
+                    saved_cells = self.storage.save_changes(self.last_saved_servers, servers)
+                else:
+                    saved_cells = self.storage.save_marked(servers, changes, self.id_index)
+            except Exception:
+                with self.state_lock:
+                    self.changes.merge(changes)  # Reluate la următoarea încercare
+                raise
+            self.last_saved_servers = servers
+
+            # Compactare periodică a jurnalului într-un snapshot complet
+            # (cel puțin cât tabela însăși, ca rescrierea să fie amortizată)
+            if self.storage.journal_size() > max(self.journal_compact_threshold, servers.size):
+                self.compact_storage()
+
+            # Generație de backup doar când intervalul a expirat (altfel fără I/O)
+            self.backups.maybe_backup(data_version)
+
+        if self.instruments.enabled:
+            self.instruments.record('save', (time.perf_counter() - start_time) * 1000)
+            self.instruments.count('saved_cells', servers.size if saved_cells is None else saved_cells)
+        if not silent:
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            saved_text = "snapshot complet" if saved_cells is None else f"{saved_cells} celule modificate"
+            log.info(f"💾 Date salvate cu succes în {self.db_file} - {saved_text} ({elapsed_ms:.1f} ms)")
+
+    def report_persistence_error(self, error, attempt, retry_in):
+        """Salvare eșuată - datele rămân în memorie și scrierea se reia automat"""
+        if isinstance(error, sqlite3.OperationalError):
+            log.warning(f"⚠️ Bază de date blocată (încercarea {attempt}) - reîncerc în {retry_in:.0f} s: {error}")
+        else:
+            log.error(f"❌ Eroare la salvarea datelor (încercarea {attempt}) - reîncerc în {retry_in:.0f} s: {error}")
+        if attempt == 1:
+            self.publish('alert', (f"💾 Salvare amânată: {error} - datele sunt păstrate în memorie, "
+                                   f"reîncercare automată", "warning"))
 
-            # Verifică dacă Excel-ul este deschis
-            if os.path.exists(self.excel_file) and is_file_in_use(self.excel_file):
-                if not silent:
-                    # Afișează mesaj informativ doar pentru salvări manuale
-                    messagebox.showwarning("Fișier în uz",
-                        f"Fișierul {self.excel_file} este deschis în Excel.\n\n"
-                        f"✅ Datele sunt păstrate în memorie.\n"
-                        f"💡 Închideți Excel pentru a salva pe disk.\n\n"
-                        f"Aplicația va încerca din nou automat.")
-
-                print(f"⚠️ Fișier în uz: {self.excel_file} - salvare amânată")
-                return False  # Returnează False pentru a indica eșecul salvării
-
-            # Backup precedent
-            if os.path.exists(self.excel_file):
-                backup_file = f"{self.excel_file}.backup"
-                import shutil
-                shutil.copy2(self.excel_file, backup_file)
+    def compact_storage(self):
+        """Compactează jurnalul într-un snapshot complet (o singură tranzacție SQLite).
 
-            # Salvare principală
-            self.servers.to_excel(self.excel_file, index=False)
+        Backup-urile sunt gestionate separat de BackupManager, pe generații.
+        """
+        start_time = time.perf_counter()
 
-            if not silent:
-                print("💾 Date salvate cu succes în Excel")
+        with self.state_lock:
+            servers = self.servers
+            changes, self.changes = self.changes, ChangeSet()
+        try:
+            self.storage.save(servers)
+        except Exception:
+            with self.state_lock:
+                self.changes.merge(changes)
+            raise
+        self.last_saved_servers = servers
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        log.info(f"🗜️ Jurnal compactat în {self.db_file} ({elapsed_ms:.1f} ms)")
+
+    def shutdown(self):
+        """La închidere: salvează modificările rămase, compactează jurnalul și persistă istoricul"""
+        try:
+            self.stopping.set()
+            if self.api is not None:
+                self.api.stop()
+            if self.monitor_thread is not None:
+                self.monitor_thread.join(timeout=30)  # Tick-ul în curs se termină înainte de scriere
+            if self.recorder is not None:
+                self.recorder.close()
+            self.persistence.stop()
+            self.write_servers(silent=True)  # Ultima scriere, sincron
+            if self.storage.journal_size() > 0:
+                self.compact_storage()
+            self.storage.close()
+            self.metrics_history.save(self.history_file)
+            self.log_store.close()
+            self.alert_engine.close()
+        except Exception as e:
+            log.error(f"❌ Eroare la închiderea bazei de date: {e}")
+
+    def refresh_performance_metrics(self):
+        """Publică metricile din agregatorul incremental; în modul verificare le compară
+        cu o recalculare completă și reconstruiește agregatorul la diferențe"""
+        aggregated = self.aggregator.metrics()
+        if not self.verify_aggregates:
+            self.performance_metrics = aggregated
+            return
 
-            # Recalculare metrici
+        with self.state_lock:  # Tabelul și sumele comparate trebuie să fie din aceeași versiune
             self.calculate_performance_metrics()
-            return True  # Returnează True pentru succes
-
-        except PermissionError as e:
-            if not silent:
-                print(f"⚠️ Fișier blocat - salvare amânată: {str(e)}")
-            else:
-                print(f"⚠️ [Silent] Fișier blocat: {str(e)}")
-            return False
-
-        except Exception as e:
-            if not silent:
-                messagebox.showerror("Eroare", f"Eroare la salvarea datelor: {str(e)}")
-                print(f"❌ Eroare la salvarea datelor: {str(e)}")
-            else:
-                print(f"❌ [Silent] Eroare la salvarea datelor: {str(e)}")
-            return False
+            mismatches = self.aggregator.compare(self.performance_metrics)
+            if mismatches:
+                self.aggregator.rebuild(self.servers)
+        if mismatches:
+            log.warning(f"⚠️ Agregate incrementale divergente după {self.aggregator.updates} actualizări: "
+                        f"{'; '.join(mismatches)}")
+        else:
+            log.info(f"✅ Agregate incrementale verificate ({self.aggregator.updates} actualizări)")
+
+    def snapshot_row_aggregate(self, server_idx, servers=None):
+        """Contribuția curentă a unui server la agregate (înainte/după o modificare)"""
+        return self.aggregator.frame_contributions(self.servers if servers is None else servers, [server_idx])
+
+    def update_row_aggregate(self, server_idx, before, servers=None):
+        """Aplică în agregator diferența pentru un server modificat"""
+        self.stage_aggregate(before, self.snapshot_row_aggregate(server_idx, servers))
+
+    def stage_aggregate(self, before, after):
+        """Diferența de agregate a unei modificări; într-un bloc servers_update se aplică
+        abia la publicarea copiei, împreună cu ea (la excepție se renunță la ea)"""
+        delta = self.aggregator.delta(before, after)
+        if self.pending_aggregate is None:
+            self.aggregator.commit([delta])
+        else:
+            self.pending_aggregate.append(delta)
 
     def calculate_performance_metrics(self):
         """Calculează metrici avansate de performanță cu verificări de siguranță"""
@@ -314,31 +3637,27 @@ class ServerDashboard:
 
             # Verifică dacă coloanele necesare există
             required_columns = ['Status', 'CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Performance_Score', 'Uptime_Hours']
-            for col in required_columns:
-                if col not in self.servers.columns:
-                    print(f"⚠️ Coloana {col} lipsește, folosesc valori default")
-                    if col == 'Status':
-                        self.servers[col] = 'down'
-                    elif col in ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Performance_Score', 'Uptime_Hours']:
-                        self.servers[col] = 0.0
-
-            # Filtrează servere online/offline
-            online_servers = self.servers[self.servers['Status'] == 'up']
-            offline_servers = self.servers[self.servers['Status'] == 'down']
+            missing_columns = [col for col in required_columns if col not in self.servers.columns]
+            if missing_columns:
+                with self.servers_update() as servers:
+                    for col in missing_columns:
+                        log.warning(f"⚠️ Coloana {col} lipsește, folosesc valori default")
+                        servers[col] = 'down' if col == 'Status' else 0.0
+
+            # Filtrează servere online/offline (pe un singur snapshot)
+            servers = self.servers
+            online_servers = servers[servers['Status'] == 'up']
+            offline_servers = servers[servers['Status'] == 'down']
 
             # Calculare metrici
             self.performance_metrics = {
-                'total_servers': len(self.servers),
+                'total_servers': len(servers),
                 'online_servers': len(online_servers),
                 'offline_servers': len(offline_servers),
                 'avg_cpu': online_servers['CPU_Usage'].mean() if len(online_servers) > 0 else 0,
                 'avg_ram': online_servers['RAM_Usage'].mean() if len(online_servers) > 0 else 0,
                 'avg_performance': online_servers['Performance_Score'].mean() if len(online_servers) > 0 else 0,
-                'critical_servers': len(self.servers[
-                    (self.servers['CPU_Usage'] > 90) |
-                    (self.servers['RAM_Usage'] > 90) |
-                    (self.servers['Disk_Usage'] > 90)
-                ]),
+                'critical_servers': int(self.rule_set.critical_mask(servers).sum()),
                 'total_uptime': online_servers['Uptime_Hours'].sum() if len(online_servers) > 0 else 0
             }
 
@@ -347,10 +3666,11 @@ class ServerDashboard:
                 if pd.isna(value):
                     self.performance_metrics[key] = 0
 
-            print(f"📊 Metrici calculate: {self.performance_metrics['online_servers']}/{self.performance_metrics['total_servers']} servere online")
+            log.debug("📊 Metrici calculate: %d/%d servere online",
+                      self.performance_metrics['online_servers'], self.performance_metrics['total_servers'])
 
         except Exception as e:
-            print(f"❌ Eroare la calcularea metricilor: {str(e)}")
+            log.error(f"❌ Eroare la calcularea metricilor: {str(e)}")
             # Metrici default în caz de eroare
             self.performance_metrics = {
                 'total_servers': 0,
@@ -363,6 +3683,498 @@ class ServerDashboard:
                 'total_uptime': 0
             }
 
+    @classmethod
+    def archive_fleet_stores(cls, stamp):
+        """După înlocuirea flotei (--generate) istoricul de metrici, logurile și alertele vechi
+        nu mai aparțin serverelor cu aceleași ID-uri. Istoricul și logurile se mută în
+        directorul de backup-uri (sufixul stamp), alertele se șterg - rămân în backup-ul
+        bazei de date. Returnează căile arhivate."""
+        archived = []
+        for path in (cls.HISTORY_FILE, cls.LOGS_DIR):
+            if os.path.exists(path):
+                os.makedirs(cls.BACKUP_DIR, exist_ok=True)
+                root, extension = os.path.splitext(os.path.basename(path))
+                target = os.path.join(cls.BACKUP_DIR, f"{root}-{stamp}{extension}")
+                os.replace(path, target)
+                archived.append(target)
+        alerts = AlertEngine(cls.DB_FILE)
+        try:
+            alerts.clear()
+        finally:
+            alerts.close()
+        return archived
+
+    def load_metrics_history(self):
+        """Reîncarcă istoricul salvat la ultima închidere, sau pornește unul gol"""
+        if os.path.exists(self.history_file):
+            try:
+                history = MetricsHistory.load(self.history_file)
+                log.info(f"📈 Istoric metrici încărcat: {len(history.slots)} servere "
+                         f"({history.memory_bytes() / 1024 / 1024:.1f} MB)")
+                return history
+            except Exception as e:
+                log.warning(f"⚠️ Istoric metrici ilizibil, pornesc cu istoric gol: {e}")
+        return MetricsHistory(initial_servers=max(64, len(self.servers)))
+
+    def add_log(self, server_id, message):
+        """Adaugă o intrare în jurnalul de loguri al serverului"""
+        self.log_store.append(server_id, message)
+
+    def migrate_logs_column(self, df):
+        """Mută coloana Loguri (dacă există) în jurnalul de loguri; returnează True dacă a fost eliminată"""
+        if 'Loguri' not in df.columns:
+            return False
+
+        migrated = 0
+        times = df['UltimaVerificare'] if 'UltimaVerificare' in df.columns else pd.Series(pd.NaT, index=df.index)
+        for server_id, logs, checked in zip(df['ID'], df['Loguri'], times):
+            if pd.isna(logs) or not str(logs).strip() or self.log_store.count(server_id):
+                continue
+            timestamp = checked.timestamp() if pd.notna(checked) else time.time()
+            self.log_store.append(server_id, str(logs).strip(), timestamp=timestamp, raw=True)
+            migrated += 1
+
+        df.drop(columns=['Loguri'], inplace=True)
+        log.info(f"📜 Coloana Loguri mutată în {self.logs_dir} ({migrated} servere)")
+        return True
+
+    def run_probes(self):
+        """Verifică toate serverele cu ProbeEngine; returnează masca serverelor accesibile"""
+        latencies = self.probe_engine.probe_all(self.servers['IP'].tolist())
+        stats = self.probe_engine.last_run
+        median = stats['median_latency_ms']
+        log.debug("📡 Probe: %d/%d accesibile în %.1f s (latență mediană %s ms)",
+                  stats['reachable'], stats['hosts'], stats['elapsed_s'],
+                  "-" if median is None else f"{median:.1f}")
+        return np.array([latency is not None for latency in latencies], dtype=bool)
+
+    # Coloanele scrise de un tick pentru serverele atinse (UltimaVerificare - pe toată flota)
+    TICK_COLUMNS = ('Status', 'CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Uptime_Hours',
+                    'Performance_Score', 'Network_In', 'Network_Out')
+
+    def simulate_monitoring_tick(self, reachable=None):
+        """Simulează un pas de monitorizare pentru toată flota, vectorizat cu NumPy.
+
+        Dacă reachable (masca din run_probes) este dat, tranzițiile de status vin din
+        probele reale; metricile de resurse rămân simulate.
+        Returnează (changes_made, alerts), unde alerts este o listă de (mesaj, tip).
+        """
+        # Tick-ul lucrează pe o copie publicată atomic la final; UI-ul citește snapshot-ul
+        # anterior fără lock până la swap
+        with self.servers_update() as servers:
+            num_servers = len(servers)
+            if num_servers == 0:
+                return False, []
+
+            # Verifică dacă coloanele există, dacă nu le creează
+            required_cols = ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out', 'Performance_Score', 'Uptime_Hours']
+            for col in required_cols:
+                if col not in servers.columns:
+                    servers[col] = 0.0
+
+            rng = self.rng
+            status = servers['Status'].to_numpy(dtype=object, na_value='down').copy()
+            cpu = servers['CPU_Usage'].to_numpy(dtype='float64', na_value=20.0).copy()
+            ram = servers['RAM_Usage'].to_numpy(dtype='float64', na_value=30.0).copy()
+            disk = servers['Disk_Usage'].to_numpy(dtype='float64', na_value=50.0).copy()
+            uptime = servers['Uptime_Hours'].to_numpy(dtype='float64', na_value=0.0).copy()
+            performance = servers['Performance_Score'].to_numpy(dtype='float64', na_value=0.0).copy()
+            network_in = servers['Network_In'].to_numpy(dtype='float64', na_value=0.0).astype('int64')
+            network_out = servers['Network_Out'].to_numpy(dtype='float64', na_value=0.0).astype('int64')
+
+            online = status == 'up'
+            changing = online & (rng.random(num_servers) < 0.3)      # 30% șansă de schimbare
+            if reachable is None:
+                going_down = online & (rng.random(num_servers) < 0.01)   # Mică șansă de cădere (1%)
+                recovering = ~online & (rng.random(num_servers) < 0.05)  # Mică șansă de recuperare (5%)
+            else:
+                reachable = np.asarray(reachable, dtype=bool)
+                if len(reachable) != num_servers:
+                    # Flota s-a schimbat în timpul probelor - statusul rămâne până la tick-ul următor
+                    reachable = online
+                going_down = online & ~reachable
+                recovering = ~online & reachable
+
+            # Schimbări graduale pentru realism (random walk cu limite)
+            count = int(changing.sum())
+            if count:
+                cpu[changing] = np.clip(cpu[changing] + rng.uniform(-5, 5, count), 5, 98)
+                ram[changing] = np.clip(ram[changing] + rng.uniform(-3, 3, count), 10, 95)
+                disk[changing] = np.clip(disk[changing] + rng.uniform(-1, 1, count), 20, 99)
+                uptime[changing] += 0.167  # +10 minute
+                performance[changing] = np.clip(
+                    100 - ((cpu[changing] + ram[changing] + disk[changing]) / 3 * 0.5), 0, 100)
+                network_in[changing] = rng.integers(100, 3001, count)
+                network_out[changing] = rng.integers(100, 2501, count)
+
+            # Identificare servere pentru mesajele de alertă
+            ids = servers['ID'].to_numpy(dtype=object)
+            names = servers['Nume'].to_numpy(dtype=object, na_value='Unknown') if 'Nume' in servers.columns \
+                else np.full(num_servers, 'Unknown', dtype=object)
+            alerts = []
+
+            # Servere căzute - reset metrici
+            for metric in (cpu, ram, network_in, network_out, performance):
+                metric[going_down] = 0
+            status[going_down] = 'down'
+
+            # Servere recuperate - restore metrici
+            count = int(recovering.sum())
+            if count:
+                cpu[recovering] = rng.uniform(10, 40, count)
+                ram[recovering] = rng.uniform(20, 60, count)
+                network_in[recovering] = rng.integers(100, 1001, count)
+                network_out[recovering] = rng.integers(100, 801, count)
+                performance[recovering] = rng.uniform(70, 95, count)
+                uptime[recovering] = 0  # Reset uptime
+                status[recovering] = 'up'
+
+            # Contribuția la agregate a serverelor atinse, înainte de scriere
+            touched = (changing | going_down | recovering).nonzero()[0]
+            self.changes.mark(ids[touched].tolist(), self.TICK_COLUMNS)
+            self.changes.mark_column('UltimaVerificare')
+            aggregate_before = self.aggregator.frame_contributions(servers, touched)
+
+            # Scriere înapoi pe coloane întregi
+            servers['Status'] = status
+            servers['CPU_Usage'] = cpu
+            servers['RAM_Usage'] = ram
+            servers['Disk_Usage'] = disk
+            servers['Uptime_Hours'] = uptime
+            servers['Performance_Score'] = performance
+            servers['Network_In'] = network_in
+            servers['Network_Out'] = network_out
+
+            self.stage_aggregate(aggregate_before, self.aggregator.frame_contributions(servers, touched))
+
+            # Actualizare timestamp verificare
+            servers['UltimaVerificare'] = pd.Timestamp(datetime.now())
+
+        alerts.extend(self.tick_alerts(
+            servers, ids, names, {'CPU_Usage': cpu, 'RAM_Usage': ram, 'Disk_Usage': disk,
+                                  'Performance_Score': performance, 'Uptime_Hours': uptime},
+            status == 'up', going_down, recovering))
+
+        changes_made = bool(changing.any() or going_down.any() or recovering.any())
+        return changes_made, alerts
+
+    def tick_alerts(self, servers, ids, names, metrics, online, going_down, recovering, now=None):
+        """Alertele unui pas: praguri (RuleSet + AlertEngine) și schimbările de status.
+
+        now este momentul pasului pentru ferestrele de flapping/suprimare (implicit ceasul real).
+        """
+        # Alerte de prag - reguli compilate (RuleSet) + motor cu stare (histerezis, deduplicare, flapping)
+        evaluations = self.rule_set.evaluate(servers, ids, metrics, online)
+        alerts = self.alert_engine.evaluate(ids, names, evaluations, self.id_index, now)
+
+        # Alerte de schimbare a statusului
+        for pos in going_down.nonzero()[0]:
+            alerts.append((f"🚨 SERVER DOWN: {ids[pos]} ({names[pos]}) - A căzut neașteptat!", "critical"))
+        for pos in recovering.nonzero()[0]:
+            alerts.append((f"✅ RECUPERARE: {ids[pos]} ({names[pos]}) - Server revenit online!", "success"))
+        return alerts
+
+    def monitor_servers(self):
+        """Monitor continuu pentru servere - rulează în background până la shutdown()"""
+        while not self.stopping.is_set():
+            try:
+                log.debug("🔍 Monitorizare servere în curs...")
+
+                if self.rule_set.reload_if_changed():
+                    with self.state_lock:
+                        self.aggregator.rebuild(self.servers)
+                    self.publish('alert', (
+                        f"📐 Reguli de alertă reîncărcate ({len(self.rule_set.rules)} reguli)", "info"))
+                    self.publish('stats')
+
+                with self.instruments.timer('monitor_tick'):
+                    reachable = self.run_probes() if self.real_probes else None
+                    changes_made, alerts = self.simulate_monitoring_tick(reachable)
+                    self.metrics_history.record(time.time(), self.servers)
+
+                for alert in alerts:
+                    self.publish('alert', alert)
+
+                # Salvare (pe firul de persistență) și notificarea abonaților dacă au fost schimbări
+                if changes_made:
+                    self.save_data(silent=True)
+                    self.publish('stats')
+                    self.publish('details')  # Serverul selectat, oricare ar fi
+                    self.publish('view')
+
+                # Așteptare între verificări (implicit 15 secunde)
+                self.stopping.wait(self.monitor_interval)
+
+            except Exception as e:
+                log.error(f"❌ Eroare în monitorizare: {str(e)}")
+                self.stopping.wait(max(30, self.monitor_interval))  # Așteptare mai lungă în caz de eroare
+
+    def apply_trace_frame(self, ids, values, now=None):
+        """Aplică un cadru înregistrat: valorile date pentru serverele date, restul flotei rămâne.
+
+        ID-urile care nu mai există în flotă se ignoră. Returnează (rânduri aplicate, alerte),
+        cu alertele evaluate ca într-un tick de monitorizare.
+        """
+        columns = [column for column in FleetTrace.COLUMNS if column in values]
+        with self.servers_update() as servers:
+            frame_ids = np.asarray(ids, dtype=object)
+            server_ids = servers['ID'].to_numpy(dtype=object)
+            positions = np.array([self.id_index.get(server_id, -1) for server_id in ids], dtype=np.int64)
+            known = (positions >= 0) & (positions < len(servers))
+            if (server_ids[positions[known]] != frame_ids[known]).any():
+                # Index învechit - reconstruire o singură dată
+                self.rebuild_id_index()
+                positions = np.array([self.id_index.get(server_id, -1) for server_id in ids], dtype=np.int64)
+                known = positions >= 0
+            frame_rows = known.nonzero()[0]
+            positions = positions[known]
+            if not len(positions):
+                return 0, []
+
+            was_online = servers['Status'].to_numpy(dtype=object, na_value='down') == 'up'
+            aggregate_before = self.aggregator.frame_contributions(servers, positions)
+            for column in columns:
+                data = servers[column].to_numpy(copy=True)
+                data[positions] = np.asarray(values[column])[frame_rows]
+                servers[column] = data
+            self.stage_aggregate(aggregate_before, self.aggregator.frame_contributions(servers, positions))
+            servers.iloc[positions, servers.columns.get_loc('UltimaVerificare')] = pd.Timestamp(datetime.now())
+            self.changes.mark(server_ids[positions].tolist(), columns + ['UltimaVerificare'])
+
+        status = servers['Status'].to_numpy(dtype=object, na_value='down')
+        online = status == 'up'
+        names = servers['Nume'].to_numpy(dtype=object, na_value='Unknown') if 'Nume' in servers.columns \
+            else np.full(len(servers), 'Unknown', dtype=object)
+        metrics = {column: servers[column].to_numpy(dtype='float64', na_value=0.0)
+                   for column in ('CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Performance_Score', 'Uptime_Hours')}
+        alerts = self.tick_alerts(servers, servers['ID'].to_numpy(dtype=object), names, metrics, online,
+                                  was_online & ~online, ~was_online & online, now)
+        return len(positions), alerts
+
+    def replay_servers(self):
+        """Redă înregistrarea self.replay în locul simulării - rulează pe firul de monitorizare.
+
+        Cadrul de la secunda t se aplică la t / replay_speed după pornire (viteza 0: imediat).
+        Alertele primesc momentul virtual al cadrului, deci histerezisul, flapping-ul și
+        suprimarea dau aceleași alerte la orice viteză. La final se publică un rezumat
+        (și în self.replay_summary); flota rămâne în starea ultimului cadru.
+        """
+        speed = self.replay_speed
+        clock_base = time.time()
+        start = time.monotonic()
+        frames = rows = ignored = 0
+        alert_counts = {}
+        max_lag = 0.0
+        pace = f"la {speed:g}x" if speed > 0 else "fără așteptare între cadre"
+        log.info(f"▶️ Redare {self.replay.path} {pace} ({self.replay.header.get('servers', '?')} servere)")
+        try:
+            for offset, ids, values in self.replay.frames():
+                if speed > 0:
+                    delay = start + offset / speed - time.monotonic()
+                    if delay > 0:
+                        self.stopping.wait(delay)
+                    else:
+                        max_lag = max(max_lag, -delay)
+                if self.stopping.is_set():
+                    break
+
+                with self.instruments.timer('replay_frame'):
+                    applied, alerts = self.apply_trace_frame(ids, values, now=clock_base + offset)
+                    self.metrics_history.record(time.time(), self.servers)
+                frames += 1
+                rows += applied
+                ignored += len(ids) - applied
+                self.instruments.count('replay_rows', applied)
+
+                for alert in alerts:
+                    alert_counts[alert[1]] = alert_counts.get(alert[1], 0) + 1
+                    self.publish('alert', alert)
+                if applied:
+                    self.save_data(silent=True)
+                    self.publish('stats')
+                    self.publish('details')
+                    self.publish('view')
+        except Exception as e:
+            log.error(f"❌ Eroare la redarea înregistrării {self.replay.path}: {e}")
+            self.publish('alert', (f"❌ Redare întreruptă: {e}", "critical"))
+
+        elapsed = time.monotonic() - start
+        self.replay_summary = {'frames': frames, 'rows': rows, 'ignored': ignored, 'alerts': alert_counts,
+                               'elapsed_s': elapsed, 'max_lag_s': max_lag}
+        by_type = ", ".join(f"{alert_type}: {count}" for alert_type, count in sorted(alert_counts.items()))
+        summary = (f"⏹️ Redare terminată: {frames} cadre, {rows} rânduri, {sum(alert_counts.values())} alerte"
+                   f"{f' ({by_type})' if by_type else ''} în {elapsed:.1f} s - "
+                   f"{frames / max(elapsed, 1e-9):.0f} cadre/s, întârziere maximă {max_lag * 1000:.0f} ms")
+        if ignored:
+            summary += f", {ignored} rânduri cu ID-uri necunoscute ignorate"
+        log.info(summary)
+        self.publish('alert', (summary, "info"))
+
+
+class ServerDashboard(MonitoringEngine):
+    """Interfața Tk peste MonitoringEngine - primește evenimentele motorului prin UIDispatcher"""
+
+    def __init__(self, root, **engine_options):
+        self.root = root
+        self.root.title("🖥️ Dashboard IT Professional - Server Monitoring System")
+        self.root.geometry("1400x900")
+        self.root.configure(bg='#2c3e50')
+
+        # Configurare stil modern
+        self.setup_styles()
+
+        self.max_servers_per_tab = 6
+        self.overview_auto_threshold = 60  # Peste acest număr de servere se pornește în vederea globală
+        self.max_live_tab_canvases = 8  # Canvas-uri de tab păstrate în memorie (LRU)
+        self.tab_canvas_idle_seconds = 300  # Canvas-ul unui tab ascuns de atât timp se eliberează
+        self.live_tab_canvases = OrderedDict()  # tab_idx → momentul ultimei afișări
+        self.log_tail_entries = 200  # Intrări afișate în panoul de detalii (paginare la cerere)
+        self.log_edit_entries = 500  # Intrări încărcate în fereastra de editare
+        self.log_view = {'server_id': None, 'start': 0, 'count': 0}
+        self.history_ranges = {"1h": 3600, "6h": 6 * 3600, "24h": 24 * 3600,
+                               "7 zile": 7 * 24 * 3600, "30 zile": 30 * 24 * 3600}
+        startup_start = time.perf_counter()
+
+        # Date, persistență, reguli și istoric - motorul nu depinde de Tk
+        super().__init__(**engine_options)
+
+        # Setare variabile
+        self.server_icons = {}
+        self.alerts = deque(maxlen=200)  # Ring buffer - ultimele 200 de alerte
+        self.pending_alerts = deque()  # Alerte încă neafișate (golite o dată per cadru)
+        self.alert_flush_job = None
+        self.alert_bell_interval = 5.0  # Secunde minime între două sunete de alertă
+        self.alert_flash_interval = 2.0  # Secunde minime între două flash-uri
+        self.last_alert_bell = float('-inf')
+        self.last_alert_flash = float('-inf')
+        self.alert_colors = {
+            'critical': {'fg': '#e74c3c', 'selectbackground': '#c0392b'},
+            'warning': {'fg': '#f39c12', 'selectbackground': '#e67e22'},
+            'success': {'fg': '#27ae60', 'selectbackground': '#229954'},
+            'info': {'fg': '#3498db', 'selectbackground': '#2980b9'}
+        }
+        self.current_selected = None
+        self.backup_list_refresh = None  # Reîmprospătarea listei din fereastra de backup-uri deschisă
+        self.current_tab = 0
+        self.tabs = []
+        self.context_menu = None
+        self.tooltip = None  # Tooltip de hover activ (tab, server, ID-uri canvas)
+        self.view_mode = 'tabs'  # 'tabs' sau 'overview' (canvas global virtualizat)
+        self.overview = None
+        self.tabs_stale = True  # Tab-urile trebuie (re)create la următoarea afișare
+
+        # Creare interfață
+        stage_start = time.perf_counter()
+        self.create_main_layout()
+        self.startup_timings['create_main_layout'] = (time.perf_counter() - stage_start) * 1000
+        self.startup_timings['total'] = (time.perf_counter() - startup_start) * 1000
+        self.startup_timings['cold_start'] = (time.perf_counter() - PROCESS_START) * 1000
+        self.print_startup_report()
+
+        # Pipeline UI unic: firele de lucru publică evenimente, firul Tk le aplică la 10 Hz
+        self.ui_dispatcher = UIDispatcher(self.root, interval_ms=100, instruments=self.instruments)
+        self.register_ui_handlers()
+        self.ui_dispatcher.start()
+        self.subscribe(self.ui_dispatcher.post)
+
+        # Start persistență și monitorizare în background
+        self.start()
+
+        log.info("🚀 Dashboard IT Professional inițializat cu succes")
+
+    def register_ui_handlers(self):
+        """Handler-ele dispatcher-ului UI, în ordinea în care se aplică într-un cadru"""
+        dispatcher = self.ui_dispatcher
+        dispatcher.register('save', lambda silent_flags: self.save_data(silent=all(silent_flags)))
+        dispatcher.register('stats', self.apply_stats_update)
+        dispatcher.register('details', self.apply_details_update)
+        dispatcher.register('view', lambda _: self.redraw_current_view())
+        dispatcher.register('alert', self.apply_alert_events)
+        dispatcher.register('backup', self.apply_backup_events)
+
+    def apply_stats_update(self, _):
+        self.refresh_performance_metrics()
+        self.update_header_stats()
+
+    def apply_details_update(self, server_ids):
+        """Reîmprospătează panoul de detalii o dată, dacă serverul selectat e printre cele anunțate"""
+        selected = self.current_selected
+        if selected is None or (None not in server_ids and selected not in server_ids):
+            return
+        if self.get_server_position(selected) is not None:
+            self.show_server_details(selected)
+
+    def apply_alert_events(self, alerts):
+        for message, alert_type in alerts:
+            self.add_alert(message, alert_type)
+
+    def apply_backup_events(self, entries):
+        """Backup-uri manuale terminate în fundal: alertă și lista din fereastra deschisă"""
+        for entry in entries:
+            self.add_alert(f"🗄️ BACKUP: {entry['name']} creat", "success")
+        if self.backup_list_refresh is not None:
+            self.backup_list_refresh()
+
+    def report_error(self, title, message):
+        super().report_error(title, message)
+        messagebox.showerror(title, message)
+
+    def shutdown(self):
+        self.ui_dispatcher.stop()
+        super().shutdown()
+
+    def print_startup_report(self):
+        """Afișează timpii etapelor de pornire"""
+        log.info(f"⏱️ Raport pornire ({len(self.servers)} servere, vedere: {self.view_mode}):")
+        for stage, duration in self.startup_timings.items():
+            log.info(f"   • {stage}: {duration:.1f} ms")
+
+    def setup_styles(self):
+        """Configurează stilurile moderne pentru interfață"""
+        try:
+            style = ttk.Style()
+            style.theme_use('clam')
+
+            # Configurări de culori moderne
+            style.configure('Title.TLabel',
+                           font=('Segoe UI', 16, 'bold'),
+                           foreground='#ecf0f1',
+                           background='#2c3e50')
+
+            style.configure('Header.TLabel',
+                           font=('Segoe UI', 12, 'bold'),
+                           foreground='#3498db',
+                           background='#34495e')
+
+            style.configure('Info.TLabel',
+                           font=('Segoe UI', 10),
+                           foreground='#ecf0f1',
+                           background='#34495e')
+
+            style.configure('Modern.TFrame',
+                           background='#34495e',
+                           borderwidth=1,
+                           relief='solid')
+
+            style.configure('Card.TFrame',
+                           background='#34495e',
+                           borderwidth=2,
+                           relief='raised')
+
+            # Configurare scrollbar mai gros
+            style.configure('Custom.Vertical.TScrollbar',
+                           gripcount=0,
+                           background='#34495e',
+                           darkcolor='#2c3e50',
+                           lightcolor='#5a6c7d',
+                           troughcolor='#2c3e50',
+                           borderwidth=2,
+                           arrowcolor='#ecf0f1',
+                           width=20)  # Mai gros
+
+        except Exception as e:
+            log.warning(f"⚠️ Warning: Nu s-au putut configura stilurile: {e}")
+
     def create_main_layout(self):
         """Creează layout-ul principal cu orientare verticală"""
         # Frame principal
@@ -465,7 +4277,7 @@ class ServerDashboard:
                     else:
                         var.set("0")
         except Exception as e:
-            print(f"❌ Eroare la actualizarea statisticilor: {e}")
+            log.error(f"❌ Eroare la actualizarea statisticilor: {e}")
             # Setează valori default în caz de eroare
             for var in self.stat_vars.values():
                 if var == self.stat_vars['cpu_avg'] or var == self.stat_vars['performance']:
@@ -495,30 +4307,124 @@ class ServerDashboard:
                  font=('Segoe UI', 9), bg='#3498db', fg='white',
                  relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
 
-        # Notebook pentru tab-uri
-        self.notebook = ttk.Notebook(parent)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.hover_tooltips = tk.BooleanVar(value=True)
+        tk.Checkbutton(btn_frame, text="💬 Tooltip", variable=self.hover_tooltips,
+                      command=self.hide_tooltip, font=('Segoe UI', 9), fg='#ecf0f1', bg='#34495e',
+                      selectcolor='#2c3e50', activebackground='#34495e').pack(side=tk.LEFT, padx=2)
+
+        self.view_button = tk.Button(btn_frame, text="🗺️ Vedere Globală", command=self.toggle_topology_view,
+                                     font=('Segoe UI', 9), bg='#2980b9', fg='white',
+                                     relief='flat', padx=10)
+        self.view_button.pack(side=tk.LEFT, padx=2)
+
+        self.real_probes_var = tk.BooleanVar(value=self.real_probes)
+        tk.Checkbutton(btn_frame, text="📡 Probe reale", variable=self.real_probes_var,
+                      command=self.toggle_real_probes, font=('Segoe UI', 9), fg='#ecf0f1', bg='#34495e',
+                      selectcolor='#2c3e50', activebackground='#34495e').pack(side=tk.LEFT, padx=2)
+
+        tk.Button(btn_frame, text="📥 Import Excel", command=self.import_excel,
+                 font=('Segoe UI', 9), bg='#8e44ad', fg='white',
+                 relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(btn_frame, text="📤 Export Excel", command=self.export_excel,
+                 font=('Segoe UI', 9), bg='#16a085', fg='white',
+                 relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(btn_frame, text="🗄️ Backup-uri", command=self.show_backups,
+                 font=('Segoe UI', 9), bg='#7f8c8d', fg='white',
+                 relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+
+        tk.Button(btn_frame, text="📈 Statistici", command=self.show_statistics,
+                 font=('Segoe UI', 9), bg='#d35400', fg='white',
+                 relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
 
-        # Creare tab-uri inițiale
-        self.create_tabs()
+        # Notebook pentru tab-uri și vederea globală (doar una este afișată)
+        self.notebook = ttk.Notebook(parent)
+        self.overview_frame = tk.Frame(parent, bg='#34495e')
+        self.overview = FleetOverview(self.overview_frame, self)
+        self.overview.canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Bind pentru schimbarea tab-ului
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
+        # Flotele mari pornesc direct în vederea globală - tab-urile se creează doar la cerere
+        if len(self.servers) > self.overview_auto_threshold:
+            log.info(f"🗺️ {len(self.servers)} servere - pornire în vederea globală")
+            self.show_topology_view('overview')
+        else:
+            self.show_topology_view('tabs')
+
+    def show_topology_view(self, mode):
+        """Comută între tab-urile paginate și vederea globală virtualizată"""
+        self.hide_tooltip()
+        self.view_mode = mode
+        if mode == 'overview':
+            self.notebook.pack_forget()
+            self.overview_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+            self.view_button.config(text="📑 Vedere Tab-uri")
+            self.overview.set_selected(self.current_selected)
+            self.overview.schedule_render()
+        else:
+            self.overview_frame.pack_forget()
+            self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+            self.view_button.config(text="🗺️ Vedere Globală")
+            if self.tabs_stale:
+                self.create_tabs()
+            else:
+                self.draw_tab_topology(self.current_tab)
+
+    def toggle_real_probes(self):
+        """Comută între statusul simulat și probele reale (citit de thread-ul de monitorizare)"""
+        self.real_probes = self.real_probes_var.get()
+        ports = ", ".join(str(port) for port in self.probe_engine.ports)
+        log.info(f"📡 Probe reale {'activate' if self.real_probes else 'dezactivate'} (porturi TCP: {ports})")
+
+    def toggle_topology_view(self):
+        """Handler pentru butonul de comutare a vederii"""
+        self.show_topology_view('tabs' if self.view_mode == 'overview' else 'overview')
+
+    def redraw_current_view(self):
+        """Redesenează doar vederea activă (tab-ul curent sau vederea globală)"""
+        if self.view_mode == 'overview':
+            self.overview.schedule_render()
+        else:
+            self.draw_tab_topology(self.current_tab)
+        self.evict_tab_canvases()  # La fiecare pas - și pentru tab-urile rămase ascunse
+
+    def select_server(self, server_id):
+        """Selectează un server (sau deselectează pentru None) și afișează detaliile"""
+        if server_id is None:
+            self.current_selected = None
+            self.clear_server_details()
+            return
+        log.debug("🖱️ Server selectat: %s", server_id)
+        self.current_selected = server_id
+        self.show_server_details(server_id)
+        self.highlight_selected_server(server_id)
+
     def create_tabs(self):
         """Creează tab-urile cu maxim 6 servere fiecare - Layout VERTICAL (2x3)"""
+        start_time = time.perf_counter()
+
         # Șterge tab-urile existente
         for tab in self.tabs:
+            if tab.get('redraw_job'):
+                self.root.after_cancel(tab['redraw_job'])
             self.notebook.forget(tab['frame'])
+            tab['frame'].destroy()
         self.tabs = []
+        self.live_tab_canvases.clear()
+        self.server_icons = {}
+        self.tooltip = None
+        self.tabs_stale = False
 
         # Calculează numărul de tab-uri necesare
         num_servers = len(self.servers)
         num_tabs = max(1, (num_servers + self.max_servers_per_tab - 1) // self.max_servers_per_tab)
 
-        print(f"📋 Creez {num_tabs} tab-uri pentru {num_servers} servere")
+        log.debug("📋 Creez %d tab-uri pentru %d servere", num_tabs, num_servers)
 
-        # Creează tab-urile
+        # Creează tab-urile ca placeholder-e; canvas-ul se construiește la prima afișare
         for tab_idx in range(num_tabs):
             tab_frame = tk.Frame(self.notebook, bg='#34495e')
             tab_name = f"Rețea {tab_idx + 1}"
@@ -527,24 +4433,75 @@ class ServerDashboard:
             # Determină serverele pentru acest tab
             start_idx = tab_idx * self.max_servers_per_tab
             end_idx = min(start_idx + self.max_servers_per_tab, num_servers)
-            tab_servers = self.servers.iloc[start_idx:end_idx]
 
-            print(f"  📊 Tab {tab_idx + 1}: servere {start_idx}-{end_idx-1}")
-
-            # Salvare informații tab
+            # Salvare informații tab (serverele se citesc live din self.servers la desenare)
             self.tabs.append({
                 'frame': tab_frame,
-                'servers': tab_servers,
-                'canvas': None
+                'start': start_idx,
+                'end': end_idx,
+                'canvas': None,
+                'scene': None,
+                'hit_index': None,
+                'redraw_job': None
             })
 
-            # Creează canvas pentru topologie
+        placeholders_ms = (time.perf_counter() - start_time) * 1000
+
+        # Selectează primul tab - singurul materializat la pornire
+        self.notebook.select(0)
+        self.current_tab = 0
+        canvas_start = time.perf_counter()
+        self.activate_tab(0)
+        canvas_ms = (time.perf_counter() - canvas_start) * 1000
+
+        # Raport: costul eager ar fi fost un canvas (plus desenare programată) pentru fiecare tab
+        eager_estimate_ms = placeholders_ms + canvas_ms * num_tabs
+        self.startup_timings['create_tabs'] = placeholders_ms + canvas_ms
+        log.info(f"⏱️ create_tabs: {num_tabs} placeholder-e în {placeholders_ms:.1f} ms + "
+                 f"1 canvas în {canvas_ms:.1f} ms (eager estimat: {eager_estimate_ms:.1f} ms, "
+                 f"economie ~{eager_estimate_ms - placeholders_ms - canvas_ms:.1f} ms)")
+
+    def activate_tab(self, tab_idx):
+        """Materializează canvas-ul unui tab la prima afișare și actualizează LRU-ul"""
+        if tab_idx >= len(self.tabs):
+            return
+
+        if self.tabs[tab_idx]['canvas'] is None:
             self.create_tab_canvas(tab_idx)
 
-        # Selectează primul tab
-        if self.tabs:
-            self.notebook.select(0)
-            self.current_tab = 0
+        self.live_tab_canvases[tab_idx] = time.time()
+        self.live_tab_canvases.move_to_end(tab_idx)
+        self.evict_tab_canvases()
+
+    def evict_tab_canvases(self):
+        """Eliberează canvas-urile tab-urilor nevizitate de cel mai mult timp (LRU), peste
+        max_live_tab_canvases, și pe cele ascunse de mai mult de tab_canvas_idle_seconds"""
+        now = time.time()
+        if self.current_tab in self.live_tab_canvases:
+            self.live_tab_canvases[self.current_tab] = now  # Încă afișat (ultimul în ordinea LRU)
+        for tab_idx, last_shown in list(self.live_tab_canvases.items()):
+            if tab_idx == self.current_tab:
+                continue
+            if (len(self.live_tab_canvases) <= self.max_live_tab_canvases
+                    and now - last_shown <= self.tab_canvas_idle_seconds):
+                break  # Ordinea e după ultima afișare - restul sunt mai recente
+            del self.live_tab_canvases[tab_idx]
+            self.release_tab_canvas(tab_idx)
+            log.debug("♻️ Canvas eliberat pentru tab %d (ascuns de %.0fs)", tab_idx + 1, time.time() - last_shown)
+
+    def release_tab_canvas(self, tab_idx):
+        """Distruge canvas-ul unui tab; tab-ul redevine placeholder"""
+        tab = self.tabs[tab_idx]
+        if tab.get('redraw_job'):
+            self.root.after_cancel(tab['redraw_job'])
+        if tab['canvas'] is not None:
+            tab['canvas'].destroy()
+        tab.update({'canvas': None, 'scene': None, 'hit_index': None, 'redraw_job': None})
+
+        if self.tooltip and self.tooltip['tab_idx'] == tab_idx:
+            self.tooltip = None
+        for server_id in [sid for sid, info in self.server_icons.items() if info['tab_idx'] == tab_idx]:
+            del self.server_icons[server_id]
 
     def create_tab_canvas(self, tab_idx):
         """Creează canvas-ul pentru un tab specific cu layout VERTICAL (2x3)"""
@@ -564,34 +4521,136 @@ class ServerDashboard:
         # Bind evenimente
         canvas.bind("<Button-1>", self.on_server_click)
         canvas.bind("<Button-3>", self.on_right_click)  # Click dreapta
-        canvas.bind("<Configure>", lambda e: self.draw_tab_topology(tab_idx))
+        canvas.bind("<Configure>", lambda e: self.schedule_tab_redraw(tab_idx))
+        canvas.bind("<Motion>", lambda e: self.on_canvas_motion(e, tab_idx))
+        canvas.bind("<Leave>", self.hide_tooltip)
 
         # Desenare inițială după o scurtă întârziere
         self.root.after(100, lambda: self.draw_tab_topology(tab_idx))
 
-    def draw_tab_topology(self, tab_idx):
-        """Desenează topologia pentru un tab specific - Layout VERTICAL (2x3)"""
+    def get_tab_servers(self, tab_idx):
+        """Returnează serverele (date curente) afișate într-un tab"""
+        tab = self.tabs[tab_idx]
+        return self.servers.iloc[tab['start']:tab['end']]
+
+    def schedule_tab_redraw(self, tab_idx, delay=150):
+        """Debounce pentru evenimentele <Configure> - un singur redraw după redimensionare"""
+        if tab_idx >= len(self.tabs):
+            return
+        tab = self.tabs[tab_idx]
+        if tab.get('redraw_job'):
+            self.root.after_cancel(tab['redraw_job'])
+
+        def redraw():
+            tab['redraw_job'] = None
+            self.draw_tab_topology(tab_idx)
+
+        tab['redraw_job'] = self.root.after(delay, redraw)
+
+    def get_server_visual_state(self, server):
+        """Calculează atributele vizuale care se pot schimba la un tick de monitorizare"""
+        status = server.get('Status', 'down')
+        performance = server.get('Performance_Score', 0)
+
+        # Culori în funcție de status și performanță
+        if status == 'up':
+            if performance >= 90:
+                color = "#27ae60"  # Verde - Excelent
+            elif performance >= 70:
+                color = "#f39c12"  # Portocaliu - Bun
+            else:
+                color = "#e67e22"  # Portocaliu închis - Mediu
+        else:
+            color = "#e74c3c"  # Roșu - Offline
+
+        led_color = "#27ae60" if status == 'up' else "#e74c3c"
+
+        nume = str(server.get('Nume', 'Unknown'))
+        display_name = nume[:12] + ("..." if len(nume) > 12 else "")
+
+        # Metrici rapide (doar pentru servere online)
+        if status == 'up':
+            cpu_usage = server.get('CPU_Usage', 0)
+            ram_usage = server.get('RAM_Usage', 0)
+            metrics = (f"CPU: {cpu_usage:.0f}% | RAM: {ram_usage:.0f}%", ('Segoe UI', 7), "#95a5a6")
+        else:
+            metrics = ("❌ OFFLINE", ('Segoe UI', 8, 'bold'), "#e74c3c")
+
+        return {'color': color, 'led_color': led_color, 'name': display_name, 'metrics': metrics}
+
+    @timed('draw_tab')
+    def draw_tab_topology(self, tab_idx, force=False):
+        """Desenează topologia pentru un tab specific - Layout VERTICAL (2x3).
+
+        Păstrează ID-urile elementelor de pe canvas pentru fiecare server (scene graph).
+        Reconstrucția completă are loc doar la schimbarea dimensiunii sau a serverelor
+        din tab; altfel se actualizează prin itemconfig doar serverele modificate.
+        """
         if tab_idx >= len(self.tabs):
             return
 
         tab = self.tabs[tab_idx]
         canvas = tab['canvas']
-        servers = tab['servers']
 
         if canvas is None:
             return
 
-        canvas.delete("all")
-        self.server_icons = {}
+        servers = self.get_tab_servers(tab_idx).head(6)  # Maxim 6 servere per tab
 
         # Obține dimensiunile canvas-ului
-        canvas.update_idletasks()
         canvas_width = canvas.winfo_width()
         canvas_height = canvas.winfo_height()
 
         if canvas_width < 50 or canvas_height < 50:
             return
 
+        layout_key = (canvas_width, canvas_height, tuple(servers['ID'].tolist()))
+        scene = tab.get('scene')
+
+        if force or scene is None or scene['layout_key'] != layout_key:
+            self.build_tab_scene(tab_idx, servers, layout_key)
+            return
+
+        # Actualizare incrementală - doar serverele cu valori schimbate
+        updated = 0
+        for _, server in servers.iterrows():
+            items = scene['items'][server['ID']]
+            state = self.get_server_visual_state(server)
+            previous = items['state']
+            if state == previous:
+                continue
+
+            if state['color'] != previous['color']:
+                canvas.itemconfig(items['body'], fill=state['color'])
+            if state['led_color'] != previous['led_color']:
+                canvas.itemconfig(items['led'], fill=state['led_color'])
+            if state['name'] != previous['name']:
+                canvas.itemconfig(items['name'], text=state['name'])
+            if state['metrics'] != previous['metrics']:
+                text, font, fill = state['metrics']
+                canvas.itemconfig(items['metrics'], text=text, font=font, fill=fill)
+
+            items['state'] = state
+            updated += 1
+
+        if updated:
+            self.refresh_tooltip(tab_idx)
+            log.debug("🔁 Topologie actualizată pentru tab %d: %d servere modificate", tab_idx + 1, updated)
+
+    def build_tab_scene(self, tab_idx, servers, layout_key):
+        """Reconstruiește complet elementele canvas-ului pentru un tab"""
+        tab = self.tabs[tab_idx]
+        canvas = tab['canvas']
+        canvas_width, canvas_height, _ = layout_key
+
+        canvas.delete("all")
+        if self.tooltip and self.tooltip['tab_idx'] == tab_idx:
+            self.tooltip = None
+
+        # Elimină pozițiile vechi ale acestui tab
+        for server_id in [sid for sid, info in self.server_icons.items() if info['tab_idx'] == tab_idx]:
+            del self.server_icons[server_id]
+
         # Layout GRID VERTICAL: 2 coloane x 3 rânduri (maxim 6 servere)
         cols = 2
         rows = 3
@@ -605,56 +4664,33 @@ class ServerDashboard:
 
         # Desenare conexiuni între servere (linii conectoare)
         server_positions = []
-        for idx, (_, server) in enumerate(servers.iterrows()):
-            if idx >= 6:  # Maxim 6 servere per tab
-                break
-
+        for idx in range(len(servers)):
             row = idx // cols
             col = idx % cols
 
             center_x = start_x + col * cell_width + cell_width / 2
             center_y = start_y + row * cell_height + cell_height / 2
-            server_positions.append((center_x, center_y, server))
+            server_positions.append((center_x, center_y))
 
         # Desenare linii de conectare
         for i in range(len(server_positions) - 1):
-            x1, y1, _ = server_positions[i]
-            x2, y2, _ = server_positions[i + 1]
+            x1, y1 = server_positions[i]
+            x2, y2 = server_positions[i + 1]
 
             canvas.create_line(x1, y1, x2, y2,
                              fill="#7f8c8d", width=2, dash=(5, 5))
 
         # Desenare servere
+        scene_items = {}
+        hit_index = SpatialGridIndex(cell_size=max(32, int(min(cell_width, cell_height) / 2)))
         for idx, (_, server) in enumerate(servers.iterrows()):
-            if idx >= 6:  # Maxim 6 servere per tab
-                break
-
-            row = idx // cols
-            col = idx % cols
-
-            # Calculare poziție
-            x = start_x + col * cell_width
-            y = start_y + row * cell_height
-            center_x = x + cell_width / 2
-            center_y = y + cell_height / 2
+            center_x, center_y = server_positions[idx]
 
             # Dimensiuni server
             server_width = min(cell_width * 0.7, 120)
             server_height = min(cell_height * 0.6, 80)
 
-            # Culori în funcție de status și performanță
-            status = server.get('Status', 'down')
-            performance = server.get('Performance_Score', 0)
-
-            if status == 'up':
-                if performance >= 90:
-                    color = "#27ae60"  # Verde - Excelent
-                elif performance >= 70:
-                    color = "#f39c12"  # Portocaliu - Bun
-                else:
-                    color = "#e67e22"  # Portocaliu închis - Mediu
-            else:
-                color = "#e74c3c"  # Roșu - Offline
+            state = self.get_server_visual_state(server)
 
             # Desenare server (dreptunghi cu colțuri rotunjite)
             x1 = center_x - server_width/2
@@ -665,7 +4701,7 @@ class ServerDashboard:
             # Corp server
             server_id = canvas.create_rectangle(
                 x1, y1, x2, y2,
-                fill=color, outline="#2c3e50", width=3,
+                fill=state['color'], outline="#2c3e50", width=3,
                 tags=("server", server['ID'])
             )
 
@@ -679,19 +4715,16 @@ class ServerDashboard:
 
             # LED status indicator
             led_size = 6
-            led_color = "#27ae60" if status == 'up' else "#e74c3c"
-            canvas.create_oval(
+            led_id = canvas.create_oval(
                 center_x - led_size/2, center_y - icon_size - led_size - 5,
                 center_x + led_size/2, center_y - icon_size + 5,
-                fill=led_color, outline="#ecf0f1"
+                fill=state['led_color'], outline="#ecf0f1"
             )
 
             # Nume server
-            nume = server.get('Nume', 'Unknown')
-            display_name = nume[:12] + ("..." if len(nume) > 12 else "")
-            canvas.create_text(
+            name_id = canvas.create_text(
                 center_x, center_y + 10,
-                text=display_name,
+                text=state['name'],
                 font=('Segoe UI', 9, 'bold'),
                 fill="#ecf0f1"
             )
@@ -704,38 +4737,42 @@ class ServerDashboard:
                 fill="#bdc3c7"
             )
 
-            # Metrici rapide (doar pentru servere online)
-            if status == 'up':
-                cpu_usage = server.get('CPU_Usage', 0)
-                ram_usage = server.get('RAM_Usage', 0)
-                metrics_text = f"CPU: {cpu_usage:.0f}% | RAM: {ram_usage:.0f}%"
-                canvas.create_text(
-                    center_x, y2 + 15,
-                    text=metrics_text,
-                    font=('Segoe UI', 7),
-                    fill="#95a5a6"
-                )
-            else:
-                canvas.create_text(
-                    center_x, y2 + 15,
-                    text="❌ OFFLINE",
-                    font=('Segoe UI', 8, 'bold'),
-                    fill="#e74c3c"
-                )
+            # Metrici rapide (sau OFFLINE)
+            metrics_text, metrics_font, metrics_fill = state['metrics']
+            metrics_id = canvas.create_text(
+                center_x, y2 + 15,
+                text=metrics_text,
+                font=metrics_font,
+                fill=metrics_fill
+            )
+
+            scene_items[server['ID']] = {
+                'body': server_id, 'led': led_id, 'name': name_id,
+                'metrics': metrics_id, 'state': state
+            }
 
             # Memorare poziție pentru click
             self.server_icons[server['ID']] = {
                 'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2,
                 'tab_idx': tab_idx, 'canvas_id': server_id
             }
+            hit_index.insert(server['ID'], x1, y1, x2, y2)
 
-        print(f"✅ Topologie desenată pentru tab {tab_idx + 1}: {len(server_positions)} servere")
+        tab['scene'] = {'layout_key': layout_key, 'items': scene_items}
+        tab['hit_index'] = hit_index
+
+        # Refacere highlight pentru serverul selectat
+        if self.current_selected in scene_items:
+            self.highlight_selected_server(self.current_selected)
+
+        log.debug("✅ Topologie desenată pentru tab %d: %d servere", tab_idx + 1, len(server_positions))
 
     def create_context_menu(self):
         """Creează meniul contextual pentru click dreapta"""
         self.context_menu = tk.Menu(self.root, tearoff=0)
         self.context_menu.add_command(label="📊 Detalii Server", command=self.show_context_details)
         self.context_menu.add_command(label="🔄 Restart Server", command=self.restart_context_server)
+        self.context_menu.add_command(label="🔕 Suspendă alerte (1h)", command=self.suppress_context_alerts)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="✏️ Editare Proprietăți", command=self.edit_context_server)
         self.context_menu.add_command(label="🗑️ Ștergere Server", command=self.delete_context_server)
@@ -744,26 +4781,19 @@ class ServerDashboard:
 
     def on_right_click(self, event):
         """Handle pentru click dreapta pe server"""
-        canvas = self.tabs[self.current_tab]['canvas']
-        x, y = event.x, event.y
-
         # Găsește serverul clickat
-        for server_id, info in self.server_icons.items():
-            if (info['tab_idx'] == self.current_tab and
-                info['x1'] <= x <= info['x2'] and
-                info['y1'] <= y <= info['y2']):
-
-                self.context_server_id = server_id
-                self.context_menu.post(event.x_root, event.y_root)
-                print(f"🖱️ Context menu pentru server: {server_id}")
-                return
+        server_id = self.hit_test(self.current_tab, event.x, event.y)
+        if server_id is not None:
+            self.context_server_id = server_id
+            self.context_menu.post(event.x_root, event.y_root)
+            log.debug("🖱️ Context menu pentru server: %s", server_id)
 
 # Găsește funcția show_context_details() și înlocuiește-o:
 
     def show_context_details(self):
         """Afișează detaliile serverului din context menu"""
         if self.context_server_id:
-            print(f"🖱️ Context menu: Afișare detalii pentru {self.context_server_id}")
+            log.debug("🖱️ Context menu: Afișare detalii pentru %s", self.context_server_id)
 
             # Setează serverul ca selectat
             self.current_selected = self.context_server_id
@@ -788,9 +4818,9 @@ class ServerDashboard:
             except:
                 pass
 
-            print(f"✅ Context menu: Detalii afișate pentru {self.context_server_id}")
+            log.debug("✅ Context menu: Detalii afișate pentru %s", self.context_server_id)
         else:
-            print("⚠️ Context menu: Nu există server selectat în context")
+            log.warning("⚠️ Context menu: Nu există server selectat în context")
             messagebox.showwarning("Avertisment", "Nu s-a putut identifica serverul selectat.")
 
     def restart_context_server(self):
@@ -798,6 +4828,12 @@ class ServerDashboard:
         if self.context_server_id:
             self.simulate_server_restart(self.context_server_id)
 
+    def suppress_context_alerts(self):
+        """Suspendă notificările de prag pentru serverul din context menu (ex. mentenanță)"""
+        if self.context_server_id:
+            self.alert_engine.suppress(self.context_server_id, 3600)
+            self.add_alert(f"🔕 ALERTE SUSPENDATE: {self.context_server_id} - 1 oră", "info")
+
     def edit_context_server(self):
         """Editare server din context menu"""
         if self.context_server_id:
@@ -886,6 +4922,7 @@ class ServerDashboard:
         # Creare secțiuni de conținut
         self.create_info_section(self.scrollable_frame)
         self.create_metrics_section(self.scrollable_frame)
+        self.create_history_section(self.scrollable_frame)
         self.create_controls_section(self.scrollable_frame)
         self.create_logs_section(self.scrollable_frame)
         self.create_alerts_section(self.scrollable_frame)
@@ -985,6 +5022,64 @@ class ServerDashboard:
             tk.Label(frame, textvariable=var, font=('Segoe UI', 9),
                     fg='#ecf0f1', bg='#34495e', width=10, anchor='w').pack(side=tk.LEFT)
 
+    def create_history_section(self, parent):
+        """Secțiunea cu sparkline-ul istoricului de metrici"""
+        history_frame = tk.LabelFrame(parent, text="📈 Istoric Metrici",
+                                     bg='#34495e', fg='#ecf0f1',
+                                     font=('Segoe UI', 10, 'bold'), bd=2)
+        history_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        top_frame = tk.Frame(history_frame, bg='#34495e')
+        top_frame.pack(fill=tk.X, pady=(3, 0))
+
+        # Legendă
+        for label, color in [("CPU", "#e74c3c"), ("RAM", "#3498db"), ("Performance", "#27ae60")]:
+            tk.Label(top_frame, text=f"━ {label}", font=('Segoe UI', 8, 'bold'),
+                    fg=color, bg='#34495e').pack(side=tk.LEFT, padx=(0, 8))
+
+        self.history_range = tk.StringVar(value="1h")
+        range_combo = ttk.Combobox(top_frame, textvariable=self.history_range, width=8, state='readonly',
+                                   values=list(self.history_ranges.keys()))
+        range_combo.pack(side=tk.RIGHT)
+        range_combo.bind("<<ComboboxSelected>>", lambda e: self.draw_history(self.current_selected))
+
+        self.history_canvas = tk.Canvas(history_frame, height=90, bg='#2c3e50', highlightthickness=0)
+        self.history_canvas.pack(fill=tk.X, padx=5, pady=5)
+
+    def draw_history(self, server_id):
+        """Desenează sparkline-ul pentru intervalul ales, din nivelul potrivit al istoricului"""
+        canvas = self.history_canvas
+        canvas.delete("all")
+        if not server_id:
+            return
+
+        width = max(canvas.winfo_width(), 200)
+        height = int(canvas.cget('height'))
+        now = time.time()
+        start_ts = now - self.history_ranges[self.history_range.get()]
+
+        query_start = time.perf_counter()
+        series = [(self.metrics_history.query(server_id, metric, start_ts, now), color)
+                  for metric, color in [('CPU_Usage', "#e74c3c"), ('RAM_Usage', "#3498db"),
+                                        ('Performance_Score', "#27ae60")]]
+        query_ms = (time.perf_counter() - query_start) * 1000
+
+        points_count = 0
+        tier_name = '-'
+        for (times, values, tier_name), color in series:
+            points_count = max(points_count, len(times))
+            if len(times) < 2:
+                continue
+            xs = (times - start_ts) / (now - start_ts) * width
+            ys = height - 5 - np.clip(values, 0, 100) / 100 * (height - 10)
+            canvas.create_line(*np.column_stack([xs, ys]).ravel().tolist(), fill=color, width=1.5)
+
+        if points_count < 2:
+            canvas.create_text(width // 2, height // 2, text="Istoric insuficient pentru acest interval",
+                               font=('Segoe UI', 8), fill='#95a5a6')
+        canvas.create_text(4, 4, anchor='nw', font=('Segoe UI', 7), fill='#95a5a6',
+                           text=f"{tier_name} · {points_count} puncte · {query_ms:.2f} ms")
+
     def create_controls_section(self, parent):
         """Secțiunea pentru controale server"""
         controls_frame = tk.LabelFrame(parent, text="🎛️ Controale Server",
@@ -1045,10 +5140,49 @@ class ServerDashboard:
                  font=('Segoe UI', 8), bg='#3498db', fg='white',
                  relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
 
+        self.older_logs_button = tk.Button(log_btn_frame, text="⬆️ Mai vechi", command=self.load_older_logs,
+                                           font=('Segoe UI', 8), bg='#7f8c8d', fg='white',
+                                           relief='flat', padx=10, state=tk.DISABLED)
+        self.older_logs_button.pack(side=tk.LEFT, padx=2)
+
         tk.Button(log_btn_frame, text="🗑️ Clear Logs", command=self.clear_logs,
                  font=('Segoe UI', 8), bg='#e74c3c', fg='white',
                  relief='flat', padx=10).pack(side=tk.RIGHT, padx=2)
 
+    def show_server_logs(self, server_id, force=False):
+        """Afișează ultimele intrări din jurnal; nu redesenează dacă nu au apărut intrări noi"""
+        count = self.log_store.count(server_id)
+        view = self.log_view
+        if not force and view['server_id'] == server_id and view['count'] == count:
+            return
+
+        start, records = self.log_store.tail(server_id, self.log_tail_entries)
+        self.log_view = {'server_id': server_id, 'start': start, 'count': count}
+
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.delete(1.0, tk.END)
+        if records:
+            self.log_text.insert(tk.END, "\n".join(LogStore.format_record(record) for record in records))
+        else:
+            self.log_text.insert(tk.END, "No logs available")
+        self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
+        self.older_logs_button.config(state=tk.NORMAL if start > 0 else tk.DISABLED)
+
+    def load_older_logs(self):
+        """Încarcă pagina anterioară de loguri deasupra celor afișate"""
+        view = self.log_view
+        if not view['server_id'] or view['start'] == 0:
+            return
+
+        start, records = self.log_store.tail(view['server_id'], self.log_tail_entries, before=view['start'])
+        view['start'] = start
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert("1.0", "\n".join(LogStore.format_record(record) for record in records) + "\n")
+        self.log_text.see("1.0")
+        self.log_text.config(state=tk.DISABLED)
+        self.older_logs_button.config(state=tk.NORMAL if start > 0 else tk.DISABLED)
+
     def create_alerts_section(self, parent):
         """Secțiunea pentru alerte"""
         alerts_frame = tk.LabelFrame(parent, text="🚨 System Alerts",
@@ -1081,44 +5215,121 @@ class ServerDashboard:
             selected = self.notebook.index(self.notebook.select())
             if 0 <= selected < len(self.tabs):
                 self.current_tab = selected
-                print(f"📑 Tab schimbat la {selected + 1}")
+                self.activate_tab(selected)
+                log.debug("📑 Tab schimbat la %d", selected + 1)
 
                 # Clear selecția curentă
                 self.current_selected = None
                 self.clear_server_details()
         except Exception as e:
-            print(f"❌ Eroare la schimbarea tab-ului: {e}")
+            log.error(f"❌ Eroare la schimbarea tab-ului: {e}")
 
     def on_server_click(self, event):
         """Handle pentru click pe server"""
         try:
-            canvas = self.tabs[self.current_tab]['canvas']
-            x, y = event.x, event.y
-
             # Găsește serverul clickat
-            for server_id, info in self.server_icons.items():
-                if (info['tab_idx'] == self.current_tab and
-                    info['x1'] <= x <= info['x2'] and
-                    info['y1'] <= y <= info['y2']):
-
-                    print(f"🖱️ Server selectat: {server_id}")
-                    self.current_selected = server_id
-                    self.show_server_details(server_id)
-
-                    # Highlight visual
-                    self.highlight_selected_server(server_id)
-                    return
+            server_id = self.hit_test(self.current_tab, event.x, event.y)
+            if server_id is not None:
+                log.debug("🖱️ Server selectat: %s", server_id)
+                self.current_selected = server_id
+                self.show_server_details(server_id)
+
+                # Highlight visual
+                self.highlight_selected_server(server_id)
+                return
 
             # Click pe zonă fără server
-            print("🖱️ Click pe zonă fără server")
+            log.debug("🖱️ Click pe zonă fără server")
             self.current_selected = None
             self.clear_server_details()
         except Exception as e:
-            print(f"❌ Eroare la click server: {e}")
+            log.error(f"❌ Eroare la click server: {e}")
+
+    def hit_test(self, tab_idx, x, y):
+        """Găsește serverul de sub cursor folosind indexul spațial al tab-ului"""
+        if tab_idx >= len(self.tabs):
+            return None
+        hit_index = self.tabs[tab_idx].get('hit_index')
+        if hit_index is None:
+            return None
+        return hit_index.query_point(x, y)
+
+    def on_canvas_motion(self, event, tab_idx):
+        """Tooltip la hover cu metricile live ale serverului de sub cursor"""
+        if not self.hover_tooltips.get():
+            return
+
+        server_id = self.hit_test(tab_idx, event.x, event.y)
+        if server_id is None:
+            self.hide_tooltip()
+            return
+
+        tooltip = self.tooltip
+        if tooltip and tooltip['tab_idx'] == tab_idx and tooltip['server_id'] == server_id:
+            # Același server - doar repoziționare
+            self.position_tooltip(event.x, event.y)
+            return
+
+        self.hide_tooltip()
+        canvas = self.tabs[tab_idx]['canvas']
+        text_id = canvas.create_text(0, 0, text=self.get_tooltip_text(server_id), anchor='nw',
+                                     font=('Consolas', 8), fill="#ecf0f1", tags="tooltip")
+        bg_id = canvas.create_rectangle(0, 0, 0, 0, fill="#1a252f", outline="#3498db", tags="tooltip")
+        canvas.tag_lower(bg_id, text_id)
+        self.tooltip = {'tab_idx': tab_idx, 'server_id': server_id, 'text_id': text_id, 'bg_id': bg_id}
+        self.position_tooltip(event.x, event.y)
+
+    def get_tooltip_text(self, server_id):
+        """Textul tooltip-ului - citit live din DataFrame prin indexul de ID-uri"""
+        server_pos = self.get_server_position(server_id)
+        if server_pos is None:
+            return server_id
+        server = self.servers.iloc[server_pos]
+        status = "🟢 ONLINE" if server.get('Status') == 'up' else "🔴 OFFLINE"
+        return (f"{server_id} - {server.get('Nume', 'Unknown')}\n"
+                f"{status}\n"
+                f"CPU:  {server.get('CPU_Usage', 0):5.1f}%\n"
+                f"RAM:  {server.get('RAM_Usage', 0):5.1f}%\n"
+                f"Disk: {server.get('Disk_Usage', 0):5.1f}%\n"
+                f"Perf: {server.get('Performance_Score', 0):5.0f}%")
+
+    def position_tooltip(self, x, y):
+        """Mută tooltip-ul lângă cursor, fără să iasă din canvas"""
+        tooltip = self.tooltip
+        canvas = self.tabs[tooltip['tab_idx']]['canvas']
+        canvas.coords(tooltip['text_id'], x + 16, y + 12)
+        x1, y1, x2, y2 = canvas.bbox(tooltip['text_id'])
+
+        # Dacă depășește marginea, mută tooltip-ul în stânga/sus cursorului
+        dx = -(x2 - x1) - 32 if x2 + 4 > canvas.winfo_width() else 0
+        dy = -(y2 - y1) - 24 if y2 + 4 > canvas.winfo_height() else 0
+        if dx or dy:
+            canvas.move(tooltip['text_id'], dx, dy)
+            x1, y1, x2, y2 = x1 + dx, y1 + dy, x2 + dx, y2 + dy
+        canvas.coords(tooltip['bg_id'], x1 - 4, y1 - 3, x2 + 4, y2 + 3)
+        canvas.tag_raise("tooltip")
+
+    def refresh_tooltip(self, tab_idx):
+        """Actualizează textul tooltip-ului vizibil după un tick de monitorizare"""
+        tooltip = self.tooltip
+        if tooltip and tooltip['tab_idx'] == tab_idx:
+            canvas = self.tabs[tab_idx]['canvas']
+            canvas.itemconfig(tooltip['text_id'], text=self.get_tooltip_text(tooltip['server_id']))
+
+    def hide_tooltip(self, event=None):
+        """Ascunde tooltip-ul de hover"""
+        tooltip = self.tooltip
+        if tooltip:
+            if tooltip['tab_idx'] < len(self.tabs) and self.tabs[tooltip['tab_idx']]['canvas']:
+                self.tabs[tooltip['tab_idx']]['canvas'].delete("tooltip")
+            self.tooltip = None
 
     def highlight_selected_server(self, server_id):
         """Evidențiază serverul selectat"""
         try:
+            if self.overview:
+                self.overview.set_selected(server_id)
+
             if server_id in self.server_icons:
                 info = self.server_icons[server_id]
                 canvas = self.tabs[info['tab_idx']]['canvas']
@@ -1133,18 +5344,20 @@ class ServerDashboard:
                     outline="#f1c40f", width=3, tags="highlight"
                 )
         except Exception as e:
-            print(f"❌ Eroare la highlight server: {e}")
+            log.error(f"❌ Eroare la highlight server: {e}")
 
+    @timed('details')
     def show_server_details(self, server_id):
         """Afișează detaliile unui server cu verificări de siguranță"""
         try:
-            server = self.servers[self.servers['ID'] == server_id]
-            if server.empty:
-                print(f"⚠️ Serverul {server_id} nu a fost găsit")
+            servers = self.servers  # Un singur snapshot pentru tot panoul
+            server_pos = self.get_server_position(server_id, servers)
+            if server_pos is None:
+                log.warning(f"⚠️ Serverul {server_id} nu a fost găsit")
                 return
 
-            server = server.iloc[0]
-            print(f"📊 Afișare detalii pentru {server_id}")
+            server = servers.iloc[server_pos]
+            log.debug("📊 Afișare detalii pentru %s", server_id)
 
             # Actualizare informații de bază
             self.info_vars['id'].set(server['ID'])
@@ -1201,21 +5414,19 @@ class ServerDashboard:
                 self.metrics_vars['network_in'].set("0 KB/s")
                 self.metrics_vars['network_out'].set("0 KB/s")
 
-            # Actualizare loguri
-            logs = server.get('Loguri', 'No logs available')
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(tk.END, logs)
-            self.log_text.config(state=tk.DISABLED)
+            self.draw_history(server_id)
+
+            # Actualizare loguri (doar coada jurnalului, și doar dacă s-a schimbat)
+            self.show_server_logs(server_id)
 
         except Exception as e:
-            print(f"❌ Eroare la afișarea detaliilor: {e}")
+            log.error(f"❌ Eroare la afișarea detaliilor: {e}")
             messagebox.showerror("Eroare", f"Eroare la afișarea detaliilor serverului: {str(e)}")
 
     def clear_server_details(self):
         """Șterge detaliile serverului"""
         try:
-            print("🧹 Clear detalii server")
+            log.debug("🧹 Clear detalii server")
 
             # Clear informații
             self.info_vars['id'].set("Selectați un server")
@@ -1235,17 +5446,22 @@ class ServerDashboard:
             self.log_text.config(state=tk.NORMAL)
             self.log_text.delete(1.0, tk.END)
             self.log_text.config(state=tk.DISABLED)
+            self.log_view = {'server_id': None, 'start': 0, 'count': 0}
+            self.older_logs_button.config(state=tk.DISABLED)
+            self.draw_history(None)
 
             # Remove highlight
+            if self.overview:
+                self.overview.set_selected(None)
             for tab in self.tabs:
                 if tab['canvas']:
                     tab['canvas'].delete("highlight")
         except Exception as e:
-            print(f"❌ Eroare la clear detalii: {e}")
+            log.error(f"❌ Eroare la clear detalii: {e}")
 
     def generate_server_id(self):
         """Generează un ID unic pentru server"""
-        existing_ids = set(self.servers['ID'].tolist())
+        existing_ids = self.id_index
 
         # Încercă cu format SRV-XXX
         for i in range(1, 1000):
@@ -1261,7 +5477,7 @@ class ServerDashboard:
 
     def generate_server_id(self):
         """Generează un ID unic pentru server"""
-        existing_ids = set(self.servers['ID'].tolist())
+        existing_ids = self.id_index
 
         # Încercă cu format SRV-XXX
         for i in range(1, 1000):
@@ -1276,7 +5492,7 @@ class ServerDashboard:
     def add_server(self):
         """Adaugă un server nou cu interfață completă"""
         try:
-            print("➕ Deschid fereastra pentru adăugare server")
+            log.info("➕ Deschid fereastra pentru adăugare server")
 
             # Fereastră modală pentru adăugare server
             add_win = tk.Toplevel(self.root)
@@ -1317,7 +5533,7 @@ class ServerDashboard:
                         messagebox.showerror("Eroare", "ID-ul serverului este obligatoriu!", parent=add_win)
                         return
 
-                    if server_id in self.servers['ID'].values:
+                    if self.get_server_position(server_id) is not None:
                         messagebox.showerror("Eroare", f"ID-ul {server_id} există deja!", parent=add_win)
                         return
 
@@ -1338,7 +5554,7 @@ class ServerDashboard:
                     if not locatie:
                         locatie = "Unknown"
 
-                    print(f"➕ Adaug server nou: {server_id} - {nume}")
+                    log.info(f"➕ Adaug server nou: {server_id} - {nume}")
 
                     # Pregătire date pentru noul server
                     new_server_data = {
@@ -1376,25 +5592,27 @@ class ServerDashboard:
                     # Generare loguri inițiale
                     if auto_logs.get():
                         if status == 'up':
-                            initial_logs = f"""[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Server creat și adăugat în sistem
-[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Configurare inițială completă
-[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Servicii de bază activate
-[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sistem operațional funcțional
-[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Monitorizare activată"""
+                            initial_logs = ["Server creat și adăugat în sistem", "Configurare inițială completă",
+                                            "Servicii de bază activate", "Sistem operațional funcțional",
+                                            "Monitorizare activată"]
                         else:
-                            initial_logs = f"""[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Server creat în sistem
-[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Status: Offline
-[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Așteptare pornire sistem"""
+                            initial_logs = ["Server creat în sistem", "Status: Offline", "Așteptare pornire sistem"]
                     else:
-                        initial_logs = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Server adăugat în sistem"
-
-                    new_server_data['Loguri'] = initial_logs
+                        initial_logs = ["Server adăugat în sistem"]
 
                     # Adăugare în DataFrame
                     new_server_df = pd.DataFrame([new_server_data])
-                    self.servers = pd.concat([self.servers, new_server_df], ignore_index=True)
+                    with self.state_lock:
+                        servers = pd.concat([self.servers, new_server_df], ignore_index=True)
+                        added = self.aggregator.delta(None, self.snapshot_row_aggregate(len(servers) - 1, servers))
+                        self.publish_servers(servers, [added])
+                        self.changes.mark_insert(server_id)
+                        self.id_index[server_id] = len(self.servers) - 1
+                        self.rule_set.invalidate_masks()  # Rând nou - pragurile se recalculează
+                    for message in initial_logs:
+                        self.add_log(server_id, message)
 
-                    # Salvare în Excel
+                    # Salvare în baza de date
                     self.save_data()
                     self.refresh_topology()
 
@@ -1407,10 +5625,10 @@ class ServerDashboard:
                     # Mesaj succes
                     messagebox.showinfo("Succes", f"Serverul {server_id} ({nume}) a fost adăugat cu succes!\n\nStatusul inițial: {'Online' if status == 'up' else 'Offline'}", parent=self.root)
 
-                    print(f"✅ Server adăugat cu succes: {server_id}")
+                    log.info(f"✅ Server adăugat cu succes: {server_id}")
 
                 except Exception as e:
-                    print(f"❌ Eroare la adăugarea serverului: {e}")
+                    log.error(f"❌ Eroare la adăugarea serverului: {e}")
                     messagebox.showerror("Eroare", f"Eroare la adăugarea serverului:\n{str(e)}", parent=add_win)
 
             # Header CARE ESTE ȘI BUTON DE SALVARE
@@ -1540,7 +5758,7 @@ class ServerDashboard:
             add_win.bind('<Return>', on_enter)
 
         except Exception as e:
-            print(f"❌ Eroare la deschiderea ferestrei de adăugare: {e}")
+            log.error(f"❌ Eroare la deschiderea ferestrei de adăugare: {e}")
             messagebox.showerror("Eroare", f"Eroare la deschiderea ferestrei de adăugare server: {str(e)}")
 
 
@@ -1558,15 +5776,14 @@ class ServerDashboard:
         """Editează proprietățile unui server specific"""
         try:
             # Găsește serverul în DataFrame
-            server_row = self.servers[self.servers['ID'] == server_id]
-            if server_row.empty:
+            server_idx = self.get_server_position(server_id)
+            if server_idx is None:
                 messagebox.showerror("Eroare", f"Serverul {server_id} nu a fost găsit!")
                 return
 
-            server = server_row.iloc[0]
-            server_idx = server_row.index[0]
+            server = self.servers.iloc[server_idx]
 
-            print(f"✏️ Editare proprietăți pentru {server_id}")
+            log.info(f"✏️ Editare proprietăți pentru {server_id}")
 
             # Fereastră modală pentru editare
             edit_win = tk.Toplevel(self.root)
@@ -1618,7 +5835,7 @@ class ServerDashboard:
                     if not locatie:
                         locatie = "Unknown"
 
-                    print(f"💾 Salvez modificări pentru {server_id}")
+                    log.info(f"💾 Salvez modificări pentru {server_id}")
 
                     # Detectează modificări
                     changes = []
@@ -1636,51 +5853,56 @@ class ServerDashboard:
                         return
 
                     # Actualizare date
-                    self.servers.at[server_idx, 'Nume'] = nume
-                    self.servers.at[server_idx, 'IP'] = ip
-                    self.servers.at[server_idx, 'Locatie'] = locatie
-
-                    # Schimbare status
-                    old_status = server.get('Status')
-                    if old_status != status:
-                        self.servers.at[server_idx, 'Status'] = status
-
-                        # Dacă serverul a devenit online, generează metrici
-                        if status == 'up' and old_status == 'down':
-                            self.servers.at[server_idx, 'CPU_Usage'] = random.uniform(10, 50)
-                            self.servers.at[server_idx, 'RAM_Usage'] = random.uniform(20, 60)
-                            self.servers.at[server_idx, 'Disk_Usage'] = random.uniform(30, 70)
-                            self.servers.at[server_idx, 'Network_In'] = random.randint(100, 1500)
-                            self.servers.at[server_idx, 'Network_Out'] = random.randint(100, 1500)
-                            self.servers.at[server_idx, 'Performance_Score'] = random.uniform(70, 95)
-                            self.servers.at[server_idx, 'Uptime_Hours'] = 0
-                        elif status == 'down':
-                            # Server offline - resetează metrici
-                            for metric in ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out', 'Performance_Score', 'Uptime_Hours']:
-                                if metric in self.servers.columns:
-                                    self.servers.at[server_idx, metric] = 0
-
-                    # Reset metrici dacă solicitat
-                    if reset_metrics.get() and status == 'up':
-                        self.servers.at[server_idx, 'CPU_Usage'] = random.uniform(10, 30)
-                        self.servers.at[server_idx, 'RAM_Usage'] = random.uniform(15, 40)
-                        self.servers.at[server_idx, 'Disk_Usage'] = random.uniform(20, 50)
-                        self.servers.at[server_idx, 'Network_In'] = random.randint(100, 1000)
-                        self.servers.at[server_idx, 'Network_Out'] = random.randint(100, 1000)
-                        self.servers.at[server_idx, 'Performance_Score'] = random.uniform(80, 98)
-                        self.servers.at[server_idx, 'Uptime_Hours'] = 0
-                        changes.append("Metrici resetate")
-
-                    # Update timestamp
-                    self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+                    with self.servers_update() as servers:
+                        # Poziția se recalculează - tabelul se poate schimba cât timp fereastra e deschisă
+                        server_idx = self.require_server_position(server_id, servers)
+                        aggregate_before = self.snapshot_row_aggregate(server_idx, servers)
+                        self.changes.mark([server_id])
+                        servers.at[server_idx, 'Nume'] = nume
+                        servers.at[server_idx, 'IP'] = ip
+                        servers.at[server_idx, 'Locatie'] = locatie
+
+                        # Schimbare status
+                        old_status = server.get('Status')
+                        if old_status != status:
+                            servers.at[server_idx, 'Status'] = status
+
+                            # Dacă serverul a devenit online, generează metrici
+                            if status == 'up' and old_status == 'down':
+                                servers.at[server_idx, 'CPU_Usage'] = random.uniform(10, 50)
+                                servers.at[server_idx, 'RAM_Usage'] = random.uniform(20, 60)
+                                servers.at[server_idx, 'Disk_Usage'] = random.uniform(30, 70)
+                                servers.at[server_idx, 'Network_In'] = random.randint(100, 1500)
+                                servers.at[server_idx, 'Network_Out'] = random.randint(100, 1500)
+                                servers.at[server_idx, 'Performance_Score'] = random.uniform(70, 95)
+                                servers.at[server_idx, 'Uptime_Hours'] = 0
+                            elif status == 'down':
+                                # Server offline - resetează metrici
+                                for metric in ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out', 'Performance_Score', 'Uptime_Hours']:
+                                    if metric in servers.columns:
+                                        servers.at[server_idx, metric] = 0
+
+                        # Reset metrici dacă solicitat
+                        if reset_metrics.get() and status == 'up':
+                            servers.at[server_idx, 'CPU_Usage'] = random.uniform(10, 30)
+                            servers.at[server_idx, 'RAM_Usage'] = random.uniform(15, 40)
+                            servers.at[server_idx, 'Disk_Usage'] = random.uniform(20, 50)
+                            servers.at[server_idx, 'Network_In'] = random.randint(100, 1000)
+                            servers.at[server_idx, 'Network_Out'] = random.randint(100, 1000)
+                            servers.at[server_idx, 'Performance_Score'] = random.uniform(80, 98)
+                            servers.at[server_idx, 'Uptime_Hours'] = 0
+                            changes.append("Metrici resetate")
+
+                        # Update timestamp
+                        servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+                        self.update_row_aggregate(server_idx, aggregate_before, servers)
+                    self.rule_set.invalidate_masks()  # Override-urile pot potrivi Nume/IP/Locatie
 
                     # Update logs cu modificările
-                    if 'Loguri' in self.servers.columns:
-                        current_logs = self.servers.at[server_idx, 'Loguri']
-                        change_log = f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Proprietăți modificate manual"
-                        for change in changes:
-                            change_log += f"\n  - {change}"
-                        self.servers.at[server_idx, 'Loguri'] = current_logs + change_log
+                    change_log = "Proprietăți modificate manual"
+                    for change in changes:
+                        change_log += f"\n  - {change}"
+                    self.add_log(server_id, change_log)
 
                     # Salvare și actualizare
                     self.save_data()
@@ -1703,10 +5925,10 @@ class ServerDashboard:
                                       "\n".join(f"• {change}" for change in changes),
                                       parent=self.root)
 
-                    print(f"✅ Server modificat cu succes: {server_id}")
+                    log.info(f"✅ Server modificat cu succes: {server_id}")
 
                 except Exception as e:
-                    print(f"❌ Eroare la salvarea modificărilor: {e}")
+                    log.error(f"❌ Eroare la salvarea modificărilor: {e}")
                     messagebox.showerror("Eroare", f"Eroare la salvarea modificărilor:\n{str(e)}", parent=edit_win)
 
             # Header CARE ESTE ȘI BUTON DE SALVARE
@@ -1881,7 +6103,7 @@ class ServerDashboard:
             edit_win.bind('<Return>', on_enter)
 
         except Exception as e:
-            print(f"❌ Eroare la editarea serverului: {e}")
+            log.error(f"❌ Eroare la editarea serverului: {e}")
             messagebox.showerror("Eroare", f"Eroare la editarea serverului: {str(e)}")
 
     def run_performance_test(self):
@@ -1892,20 +6114,19 @@ class ServerDashboard:
 
         try:
             # Găsește serverul în DataFrame
-            server_row = self.servers[self.servers['ID'] == self.current_selected]
-            if server_row.empty:
+            server_idx = self.get_server_position(self.current_selected)
+            if server_idx is None:
                 messagebox.showerror("Eroare", f"Serverul {self.current_selected} nu a fost găsit!")
                 return
 
-            server = server_row.iloc[0]
-            server_idx = server_row.index[0]
+            server = self.servers.iloc[server_idx]
 
             # Verifică dacă serverul este online
             if server.get('Status') != 'up':
                 messagebox.showwarning("Avertisment", f"Nu se poate testa performanța serverului {self.current_selected} - serverul este offline!")
                 return
 
-            print(f"📊 Inițiez test de performanță pentru {self.current_selected}")
+            log.info(f"📊 Inițiez test de performanță pentru {self.current_selected}")
 
             # Fereastră pentru testul de performanță
             test_win = tk.Toplevel(self.root)
@@ -2096,23 +6317,25 @@ class ServerDashboard:
 
                         # Update server performance in database
                         new_performance = min(100, max(0, overall_score + random.uniform(-5, 5)))
-                        self.servers.at[server_idx, 'Performance_Score'] = new_performance
-                        self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+                        with self.servers_update() as servers:
+                            test_idx = self.require_server_position(server['ID'], servers)
+                            aggregate_before = self.snapshot_row_aggregate(test_idx, servers)
+                            servers.at[test_idx, 'Performance_Score'] = new_performance
+                            servers.at[test_idx, 'UltimaVerificare'] = datetime.now()
+                            self.changes.mark([server['ID']], ['Performance_Score', 'UltimaVerificare'])
+                            self.update_row_aggregate(test_idx, aggregate_before, servers)
 
                         # Add test log
-                        if 'Loguri' in self.servers.columns:
-                            current_logs = self.servers.at[server_idx, 'Loguri']
-                            test_log = f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test performanță completat - Scor: {overall_score:.1f}/100"
-                            self.servers.at[server_idx, 'Loguri'] = current_logs + test_log
+                        self.add_log(server['ID'], f"Test performanță completat - Scor: {overall_score:.1f}/100")
 
-                        # Save and refresh
-                        self.save_data()
-                        if self.current_selected == self.current_selected:
-                            self.show_server_details(self.current_selected)
-                        self.draw_tab_topology(self.current_tab)
+                        # Save and refresh (pe firul Tk, prin dispatcher)
+                        self.ui_dispatcher.post('save', False)
+                        self.ui_dispatcher.post('stats')
+                        self.ui_dispatcher.post('details', server['ID'])
+                        self.ui_dispatcher.post('view')
 
                         # Alert
-                        self.add_alert(f"📊 TEST PERFORMANȚĂ: {self.current_selected} - Scor: {overall_score:.1f}/100 ({rating.split()[1]})", "info")
+                        self.ui_dispatcher.post('alert', (f"📊 TEST PERFORMANȚĂ: {server['ID']} - Scor: {overall_score:.1f}/100 ({rating.split()[1]})", "info"))
 
                         update_results_display(f"⏰ Timp finalizare: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                         update_results_display("✅ Test completat cu succes!")
@@ -2124,7 +6347,7 @@ class ServerDashboard:
                     start_button.config(text="🔄 Rulează Test Din Nou")
 
                 except Exception as e:
-                    print(f"❌ Eroare în testul de performanță: {e}")
+                    log.error(f"❌ Eroare în testul de performanță: {e}")
                     update_results_display(f"❌ EROARE: {str(e)}")
                     status_var.set("Test întrerupt din cauza unei erori")
                     test_running.set(False)
@@ -2166,7 +6389,7 @@ class ServerDashboard:
             update_results_display("\n💡 Apăsați 'Începe Test Performanță' pentru a începe testarea.")
 
         except Exception as e:
-            print(f"❌ Eroare la testul de performanță: {e}")
+            log.error(f"❌ Eroare la testul de performanță: {e}")
             messagebox.showerror("Eroare", f"Eroare la testul de performanță: {str(e)}")
 
     def refresh_status(self):
@@ -2176,65 +6399,89 @@ class ServerDashboard:
             return
 
         try:
-            print(f"🔄 Refresh status pentru {self.current_selected}")
-            server_idx = self.servers[self.servers['ID'] == self.current_selected].index[0]
+            server_id = self.current_selected
+            log.info(f"🔄 Refresh status pentru {server_id}")
+            server_idx = self.require_server_position(server_id)
+
+            if self.real_probes:
+                # Verificarea reală poate dura până la timeout - rulează în afara firului Tk
+                address = self.servers.at[server_idx, 'IP']
+
+                def probe_process():
+                    try:
+                        latency = self.probe_engine.probe_all([address])[0]
+                        self.apply_status_refresh(server_id, 'up' if latency is not None else 'down')
+                    except Exception as e:
+                        log.error(f"❌ Eroare la refresh status: {e}")
+                        self.ui_dispatcher.post('alert', (f"❌ Refresh status eșuat pentru {server_id}: {e}",
+                                                          "critical"))
+
+                threading.Thread(target=probe_process, name="refresh-status", daemon=True).start()
+                return
 
             # Simulare verificare status
             old_status = self.servers.at[server_idx, 'Status']
-
             # 90% șansă să rămână online dacă era online
             if old_status == 'up':
                 new_status = 'up' if random.random() < 0.9 else 'down'
             else:
                 new_status = 'up' if random.random() < 0.3 else 'down'  # 30% șansă să revină online
+            self.apply_status_refresh(server_id, new_status)
+
+        except Exception as e:
+            log.error(f"❌ Eroare la refresh status: {e}")
+            messagebox.showerror("Eroare", f"Eroare la actualizarea statusului: {str(e)}")
 
-            # Actualizare date
-            self.servers.at[server_idx, 'Status'] = new_status
-            self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+    def apply_status_refresh(self, server_id, new_status):
+        """Aplică rezultatul unui refresh de status (din orice fir - UI-ul prin dispatcher)"""
+        with self.servers_update() as servers:
+            server_idx = self.get_server_position(server_id, servers)
+            if server_idx is None:
+                return  # Server șters între timp
+            old_status = servers.at[server_idx, 'Status']
+            server_name = servers.at[server_idx, 'Nume']
+            aggregate_before = self.snapshot_row_aggregate(server_idx, servers)
+            self.changes.mark([server_id])
+            servers.at[server_idx, 'Status'] = new_status
+            servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
 
             # Dacă serverul a revenit online, simulează metrici noi
             if new_status == 'up':
-                self.servers.at[server_idx, 'CPU_Usage'] = random.uniform(10, 95)
-                self.servers.at[server_idx, 'RAM_Usage'] = random.uniform(20, 90)
-                if 'Disk_Usage' not in self.servers.columns:
-                    self.servers['Disk_Usage'] = 0
-                self.servers.at[server_idx, 'Disk_Usage'] = random.uniform(30, 95)
-                self.servers.at[server_idx, 'Network_In'] = random.randint(100, 5000)
-                self.servers.at[server_idx, 'Network_Out'] = random.randint(100, 5000)
+                servers.at[server_idx, 'CPU_Usage'] = random.uniform(10, 95)
+                servers.at[server_idx, 'RAM_Usage'] = random.uniform(20, 90)
+                if 'Disk_Usage' not in servers.columns:
+                    servers['Disk_Usage'] = 0
+                servers.at[server_idx, 'Disk_Usage'] = random.uniform(30, 95)
+                servers.at[server_idx, 'Network_In'] = random.randint(100, 5000)
+                servers.at[server_idx, 'Network_Out'] = random.randint(100, 5000)
 
                 # Calculare performance score
-                cpu = self.servers.at[server_idx, 'CPU_Usage']
-                ram = self.servers.at[server_idx, 'RAM_Usage']
-                disk = self.servers.at[server_idx, 'Disk_Usage']
+                cpu = servers.at[server_idx, 'CPU_Usage']
+                ram = servers.at[server_idx, 'RAM_Usage']
+                disk = servers.at[server_idx, 'Disk_Usage']
                 performance = 100 - ((cpu + ram + disk) / 3 * 0.5)  # Scor inversat
-                self.servers.at[server_idx, 'Performance_Score'] = max(0, min(100, performance))
+                servers.at[server_idx, 'Performance_Score'] = max(0, min(100, performance))
             else:
                 # Server offline - resetează metrici
                 for metric in ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out', 'Performance_Score']:
-                    if metric in self.servers.columns:
-                        self.servers.at[server_idx, metric] = 0
-
-            # Alertă dacă statusul s-a schimbat
-            if new_status != old_status:
-                server_name = self.servers.at[server_idx, 'Nume']
-                if new_status == 'down':
-                    alert_msg = f"🚨 ALERTĂ: {self.current_selected} ({server_name}) este OFFLINE!"
-                    self.add_alert(alert_msg, "critical")
-                else:
-                    alert_msg = f"✅ RECUPERARE: {self.current_selected} ({server_name}) este ONLINE!"
-                    self.add_alert(alert_msg, "info")
+                    if metric in servers.columns:
+                        servers.at[server_idx, metric] = 0
+            self.update_row_aggregate(server_idx, aggregate_before, servers)
+
+        # Alertă dacă statusul s-a schimbat
+        if new_status != old_status:
+            if new_status == 'down':
+                self.ui_dispatcher.post('alert', (f"🚨 ALERTĂ: {server_id} ({server_name}) este OFFLINE!", "critical"))
+            else:
+                self.ui_dispatcher.post('alert', (f"✅ RECUPERARE: {server_id} ({server_name}) este ONLINE!", "info"))
 
-            # Salvare și actualizare
-            self.save_data()
-            self.show_server_details(self.current_selected)
-            self.draw_tab_topology(self.current_tab)
-            self.update_header_stats()
+        # Salvare și actualizare
+        self.ui_dispatcher.post('save', False)
+        self.ui_dispatcher.post('details', server_id)
+        self.ui_dispatcher.post('view')
+        self.ui_dispatcher.post('stats')
 
-            print(f"✅ Status actualizat: {old_status} → {new_status}")
-
-        except Exception as e:
-            print(f"❌ Eroare la refresh status: {e}")
-            messagebox.showerror("Eroare", f"Eroare la actualizarea statusului: {str(e)}")
+        log.info(f"✅ Status actualizat: {old_status} → {new_status}")
 
     def restart_selected_server(self):
         """Restart serverul selectat"""
@@ -2247,7 +6494,7 @@ class ServerDashboard:
     def simulate_server_restart(self, server_id):
         """Simulează restart-ul unui server"""
         try:
-            server_idx = self.servers[self.servers['ID'] == server_id].index[0]
+            server_idx = self.require_server_position(server_id)
             server_name = self.servers.at[server_idx, 'Nume']
 
             # Confirmăre restart
@@ -2260,7 +6507,7 @@ class ServerDashboard:
             if not confirm:
                 return
 
-            print(f"🔄 Simulez restart pentru {server_id}")
+            log.info(f"🔄 Simulez restart pentru {server_id}")
 
             # Adaugă alertă restart
             self.add_alert(f"🔄 RESTART: {server_id} ({server_name}) - Restart inițiat", "warning")
@@ -2268,74 +6515,85 @@ class ServerDashboard:
             # Thread pentru simularea restart-ului
             def restart_process():
                 # Faza 1: Server offline
-                self.servers.at[server_idx, 'Status'] = 'down'
-                self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+                with self.servers_update() as servers:
+                    server_idx = self.get_server_position(server_id, servers)
+                    if server_idx is None:
+                        return  # Server șters între timp
+                    aggregate_before = self.snapshot_row_aggregate(server_idx, servers)
+                    servers.at[server_idx, 'Status'] = 'down'
+                    servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+                    self.changes.mark([server_id], ['Status', 'UltimaVerificare'])
+                    self.update_row_aggregate(server_idx, aggregate_before, servers)
 
                 # Actualizare UI
-                self.root.after(0, lambda: self.show_server_details(server_id))
-                self.root.after(0, lambda: self.draw_tab_topology(self.current_tab))
+                self.ui_dispatcher.post('details', server_id)
+                self.ui_dispatcher.post('view')
 
                 # Simulare timp restart (3-8 secunde)
                 restart_time = random.uniform(3, 8)
                 time.sleep(restart_time)
 
                 # Faza 2: Server online cu metrici resetate
-                self.servers.at[server_idx, 'Status'] = 'up'
-                self.servers.at[server_idx, 'CPU_Usage'] = random.uniform(5, 30)  # CPU mai mic după restart
-                self.servers.at[server_idx, 'RAM_Usage'] = random.uniform(15, 50)  # RAM mai mic după restart
-                self.servers.at[server_idx, 'Network_In'] = random.randint(50, 1000)
-                self.servers.at[server_idx, 'Network_Out'] = random.randint(50, 1000)
-                if 'Uptime_Hours' in self.servers.columns:
-                    self.servers.at[server_idx, 'Uptime_Hours'] = 0  # Reset uptime
-                self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
-
-                # Recalculare performance score
-                cpu = self.servers.at[server_idx, 'CPU_Usage']
-                ram = self.servers.at[server_idx, 'RAM_Usage']
-                if 'Disk_Usage' in self.servers.columns:
-                    disk = self.servers.at[server_idx, 'Disk_Usage']
-                else:
-                    disk = random.uniform(30, 70)
-                    self.servers.at[server_idx, 'Disk_Usage'] = disk
+                with self.servers_update() as servers:
+                    server_idx = self.get_server_position(server_id, servers)
+                    if server_idx is None:
+                        return  # Server șters în timpul restart-ului
+                    aggregate_before = self.snapshot_row_aggregate(server_idx, servers)
+                    self.changes.mark([server_id])
+                    servers.at[server_idx, 'Status'] = 'up'
+                    servers.at[server_idx, 'CPU_Usage'] = random.uniform(5, 30)  # CPU mai mic după restart
+                    servers.at[server_idx, 'RAM_Usage'] = random.uniform(15, 50)  # RAM mai mic după restart
+                    servers.at[server_idx, 'Network_In'] = random.randint(50, 1000)
+                    servers.at[server_idx, 'Network_Out'] = random.randint(50, 1000)
+                    if 'Uptime_Hours' in servers.columns:
+                        servers.at[server_idx, 'Uptime_Hours'] = 0  # Reset uptime
+                    servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+
+                    # Recalculare performance score
+                    cpu = servers.at[server_idx, 'CPU_Usage']
+                    ram = servers.at[server_idx, 'RAM_Usage']
+                    if 'Disk_Usage' in servers.columns:
+                        disk = servers.at[server_idx, 'Disk_Usage']
+                    else:
+                        disk = random.uniform(30, 70)
+                        servers.at[server_idx, 'Disk_Usage'] = disk
 
-                performance = 100 - ((cpu + ram + disk) / 3 * 0.5)
-                self.servers.at[server_idx, 'Performance_Score'] = max(70, min(100, performance))  # Minim 70% după restart
+                    performance = 100 - ((cpu + ram + disk) / 3 * 0.5)
+                    servers.at[server_idx, 'Performance_Score'] = max(70, min(100, performance))  # Minim 70% după restart
+                    self.update_row_aggregate(server_idx, aggregate_before, servers)
 
                 # Update logs
-                if 'Loguri' in self.servers.columns:
-                    current_logs = self.servers.at[server_idx, 'Loguri']
-                    restart_log = f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] System restart completed\nServices reloaded\nMemory cleared\nPerformance optimized"
-                    self.servers.at[server_idx, 'Loguri'] = current_logs + restart_log
+                self.add_log(server_id, "System restart completed\nServices reloaded\nMemory cleared\nPerformance optimized")
 
                 # Salvare și actualizare UI
-                self.root.after(0, self.save_data)
-                self.root.after(0, lambda: self.show_server_details(server_id))
-                self.root.after(0, lambda: self.draw_tab_topology(self.current_tab))
-                self.root.after(0, self.update_header_stats)
+                self.ui_dispatcher.post('save', False)
+                self.ui_dispatcher.post('details', server_id)
+                self.ui_dispatcher.post('view')
+                self.ui_dispatcher.post('stats')
 
                 # Alertă finalizare
-                self.root.after(0, lambda: self.add_alert(f"✅ RESTART COMPLET: {server_id} ({server_name}) - Online și optimizat", "success"))
+                self.ui_dispatcher.post('alert', (f"✅ RESTART COMPLET: {server_id} ({server_name}) - Online și optimizat", "success"))
 
-                print(f"✅ Restart completat pentru {server_id}")
+                log.info(f"✅ Restart completat pentru {server_id}")
 
             # Start restart în thread separat
             restart_thread = threading.Thread(target=restart_process, daemon=True)
             restart_thread.start()
 
         except Exception as e:
-            print(f"❌ Eroare la restart server: {e}")
+            log.error(f"❌ Eroare la restart server: {e}")
             messagebox.showerror("Eroare", f"Eroare la restart server: {str(e)}")
 
     def edit_logs(self):
-        """Editează logurile serverului selectat cu salvare în Excel"""
+        """Editează logurile serverului selectat cu salvare în baza de date"""
         if not self.current_selected:
             messagebox.showwarning("Avertisment", "Selectați un server pentru editarea logurilor")
             return
 
         try:
-            server_idx = self.servers[self.servers['ID'] == self.current_selected].index[0]
+            server_idx = self.require_server_position(self.current_selected)
 
-            print(f"✏️ Editare loguri pentru {self.current_selected}")
+            log.info(f"✏️ Editare loguri pentru {self.current_selected}")
 
             # Fereastră de editare loguri
             log_win = tk.Toplevel(self.root)
@@ -2365,9 +6623,14 @@ class ServerDashboard:
             log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             log_text.config(yscrollcommand=log_scrollbar.set)
 
-            # Încarcă logurile existente
-            existing_logs = self.servers.at[server_idx, 'Loguri'] if 'Loguri' in self.servers.columns else "No logs available"
-            log_text.insert(tk.END, existing_logs)
+            # Încarcă doar ultimele intrări; cele mai vechi rămân neatinse în jurnal
+            server_id = self.current_selected
+            edit_start, records = self.log_store.tail(server_id, self.log_edit_entries)
+            log_text.insert(tk.END, "\n".join(LogStore.format_record(record) for record in records))
+            if edit_start > 0:
+                tk.Label(log_win, text=f"ℹ️ Se editează ultimele {len(records)} intrări; "
+                                       f"cele {edit_start} mai vechi se păstrează neschimbate",
+                        font=('Segoe UI', 9), fg='#f1c40f', bg='#34495e').pack(before=text_frame)
 
             # Buttons frame
             btn_frame = tk.Frame(log_win, bg='#34495e', height=60)
@@ -2378,29 +6641,27 @@ class ServerDashboard:
                 try:
                     new_logs = log_text.get("1.0", tk.END).strip()
 
-                    # Adaugă timestamp pentru modificare
-                    timestamp_log = f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Loguri modificate manual"
-                    final_logs = new_logs + timestamp_log
-
-                    # Salvare în baza de date
-                    if 'Loguri' not in self.servers.columns:
-                        self.servers['Loguri'] = ""
-                    self.servers.at[server_idx, 'Loguri'] = final_logs
-                    self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+                    # Înlocuiește intrările editate cu textul nou + marcajul modificării
+                    self.log_store.truncate(server_id, edit_start)
+                    if new_logs:
+                        self.log_store.append(server_id, new_logs, raw=True)
+                    self.add_log(server_id, "Loguri modificate manual")
+                    self.touch_server(server_id)
 
                     # Salvare și actualizare
                     self.save_data()
                     self.show_server_details(self.current_selected)
+                    self.show_server_logs(self.current_selected, force=True)
 
                     # Alertă modificare
                     self.add_alert(f"📜 LOGURI MODIFICATE: {self.current_selected} - Loguri actualizate manual", "info")
 
                     log_win.destroy()
-                    print(f"✅ Loguri salvate pentru {self.current_selected}")
-                    messagebox.showinfo("Succes", f"Logurile pentru {self.current_selected} au fost actualizate în Excel!", parent=self.root)
+                    log.info(f"✅ Loguri salvate pentru {self.current_selected}")
+                    messagebox.showinfo("Succes", f"Logurile pentru {self.current_selected} au fost actualizate în baza de date!", parent=self.root)
 
                 except Exception as e:
-                    print(f"❌ Eroare la salvarea logurilor: {e}")
+                    log.error(f"❌ Eroare la salvarea logurilor: {e}")
                     messagebox.showerror("Eroare", f"Eroare la salvarea logurilor: {str(e)}", parent=log_win)
 
             def add_timestamp():
@@ -2424,7 +6685,7 @@ class ServerDashboard:
                      font=('Segoe UI', 9), bg='#e67e22', fg='white',
                      relief='flat', padx=10).pack(side=tk.LEFT, padx=5)
 
-            tk.Button(btn_frame, text="💾 Salvează în Excel", command=save_logs,
+            tk.Button(btn_frame, text="💾 Salvează", command=save_logs,
                      font=('Segoe UI', 11, 'bold'), bg='#27ae60', fg='white',
                      relief='flat', padx=20, pady=5).pack(side=tk.RIGHT, padx=(10, 0))
 
@@ -2433,7 +6694,7 @@ class ServerDashboard:
                      relief='flat', padx=20, pady=5).pack(side=tk.RIGHT, padx=(5, 10))
 
         except Exception as e:
-            print(f"❌ Eroare la editarea logurilor: {e}")
+            log.error(f"❌ Eroare la editarea logurilor: {e}")
             messagebox.showerror("Eroare", f"Eroare la editarea logurilor: {str(e)}")
 
     def refresh_logs(self):
@@ -2443,9 +6704,9 @@ class ServerDashboard:
             return
 
         try:
-            print(f"🔄 Refresh loguri pentru {self.current_selected}")
+            log.debug("🔄 Refresh loguri pentru %s", self.current_selected)
 
-            server_idx = self.servers[self.servers['ID'] == self.current_selected].index[0]
+            self.require_server_position(self.current_selected)  # KeyError dacă serverul nu mai există
 
             # Generare loguri simulate
             log_entries = [
@@ -2460,24 +6721,17 @@ class ServerDashboard:
             ]
 
             # Adaugă log entries simulate
-            if 'Loguri' in self.servers.columns:
-                current_logs = self.servers.at[server_idx, 'Loguri']
-            else:
-                self.servers['Loguri'] = ""
-                current_logs = ""
-
-            new_log = f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {random.choice(log_entries)}"
-            self.servers.at[server_idx, 'Loguri'] = current_logs + new_log
-            self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+            self.add_log(self.current_selected, random.choice(log_entries))
+            self.touch_server(self.current_selected)
 
             # Salvare și actualizare
             self.save_data()
             self.show_server_details(self.current_selected)
 
-            print(f"✅ Loguri refresh pentru {self.current_selected}")
+            log.debug("✅ Loguri refresh pentru %s", self.current_selected)
 
         except Exception as e:
-            print(f"❌ Eroare la refresh loguri: {e}")
+            log.error(f"❌ Eroare la refresh loguri: {e}")
             messagebox.showerror("Eroare", f"Eroare la refresh loguri: {str(e)}")
 
     def clear_logs(self):
@@ -2496,17 +6750,14 @@ class ServerDashboard:
             if not confirm:
                 return
 
-            print(f"🗑️ Șterg loguri pentru {self.current_selected}")
+            log.info(f"🗑️ Șterg loguri pentru {self.current_selected}")
 
-            server_idx = self.servers[self.servers['ID'] == self.current_selected].index[0]
+            self.require_server_position(self.current_selected)  # KeyError dacă serverul nu mai există
 
             # Clear logs cu timestamp
-            clear_log = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Loguri șterse - sistem resetat"
-
-            if 'Loguri' not in self.servers.columns:
-                self.servers['Loguri'] = ""
-            self.servers.at[server_idx, 'Loguri'] = clear_log
-            self.servers.at[server_idx, 'UltimaVerificare'] = datetime.now()
+            self.log_store.clear(self.current_selected)
+            self.add_log(self.current_selected, "Loguri șterse - sistem resetat")
+            self.touch_server(self.current_selected)
 
             # Salvare și actualizare
             self.save_data()
@@ -2515,14 +6766,14 @@ class ServerDashboard:
             # Alertă
             self.add_alert(f"🗑️ LOGURI ȘTERSE: {self.current_selected} - Loguri resetate", "info")
 
-            print(f"✅ Loguri șterse pentru {self.current_selected}")
+            log.info(f"✅ Loguri șterse pentru {self.current_selected}")
 
         except Exception as e:
-            print(f"❌ Eroare la ștergerea logurilor: {e}")
+            log.error(f"❌ Eroare la ștergerea logurilor: {e}")
             messagebox.showerror("Eroare", f"Eroare la ștergerea logurilor: {str(e)}")
 
     def add_alert(self, message, alert_type="info"):
-        """Adaugă o alertă în sistem"""
+        """Adaugă o alertă în ring buffer; lista se actualizează o singură dată per cadru"""
         try:
             timestamp = datetime.now().strftime("%H:%M:%S")
 
@@ -2537,58 +6788,70 @@ class ServerDashboard:
             icon = icons.get(alert_type, "ℹ️")
             alert_text = f"[{timestamp}] {icon} {message}"
 
-            # Adaugă la lista de alerte
-            self.alerts.append({
+            # Ring buffer cu capacitate fixă - cele mai vechi alerte ies automat
+            alert = {
                 'timestamp': timestamp,
                 'message': message,
                 'type': alert_type,
                 'full_text': alert_text
-            })
+            }
+            self.alerts.append(alert)
+            self.pending_alerts.append(alert)
 
-            # Limitează la ultimele 50 de alerte
-            if len(self.alerts) > 50:
-                self.alerts = self.alerts[-50:]
+            # Coalescență: o rafală de alerte produce un singur update de UI
+            if self.alert_flush_job is None:
+                self.alert_flush_job = self.root.after(16, self.flush_alerts)
 
-            # Actualizare UI
-            self.update_alerts_list()
+            log.debug("🚨 Alertă %s: %s", alert_type, message)
 
-            # Efecte vizuale pentru alerte critice
-            if alert_type == "critical":
-                try:
-                    self.root.bell()  # Sunet sistem
-                    # Flash effect
-                    original_bg = self.root.cget('bg')
-                    self.root.configure(bg='#e74c3c')
-                    self.root.after(200, lambda: self.root.configure(bg=original_bg))
-                except:
-                    pass  # Ignore errors for visual effects
+        except Exception as e:
+            log.error(f"❌ Eroare la adăugarea alertei: {e}")
+
+    def flush_alerts(self):
+        """Inserează în listbox doar alertele noi (cele mai noi sus) și taie surplusul de jos"""
+        self.alert_flush_job = None
+        batch = list(self.pending_alerts)[-self.alerts.maxlen:]
+        self.pending_alerts.clear()
+        if not batch:
+            return
 
-            print(f"🚨 Alertă {alert_type}: {message}")
+        try:
+            for alert in batch:
+                self.alert_listbox.insert(0, alert['full_text'])
+                self.alert_listbox.itemconfig(0, self.alert_colors.get(alert['type'], self.alert_colors['info']))
+            self.alert_listbox.delete(self.alerts.maxlen, tk.END)
 
+            if any(alert['type'] == 'critical' for alert in batch):
+                self.critical_alert_effects()
         except Exception as e:
-            print(f"❌ Eroare la adăugarea alertei: {e}")
+            log.error(f"❌ Eroare la actualizarea listei de alerte: {e}")
+
+    def critical_alert_effects(self):
+        """Sunet și flash pentru alerte critice, limitate ca frecvență"""
+        now = time.monotonic()
+        try:
+            if now - self.last_alert_bell >= self.alert_bell_interval:
+                self.last_alert_bell = now
+                self.root.bell()  # Sunet sistem
+
+            if now - self.last_alert_flash >= self.alert_flash_interval:
+                self.last_alert_flash = now
+                original_bg = self.root.cget('bg')
+                self.root.configure(bg='#e74c3c')
+                self.root.after(200, lambda: self.root.configure(bg=original_bg))
+        except:
+            pass  # Ignore errors for visual effects
 
     def update_alerts_list(self):
-        """Actualizează lista de alerte"""
+        """Resincronizează complet lista de alerte cu ring buffer-ul (după ștergere)"""
         try:
+            self.pending_alerts.clear()
             self.alert_listbox.delete(0, tk.END)
-
-            # Adaugă ultimele alerte (inversă pentru a avea cele mai noi sus)
-            for alert in reversed(self.alerts[-20:]):  # Ultimele 20 alerte
+            for alert in self.alerts:
                 self.alert_listbox.insert(0, alert['full_text'])
-
-                # Colorare în funcție de tip
-                index = 0
-                if alert['type'] == 'critical':
-                    self.alert_listbox.itemconfig(index, {'fg': '#e74c3c', 'selectbackground': '#c0392b'})
-                elif alert['type'] == 'warning':
-                    self.alert_listbox.itemconfig(index, {'fg': '#f39c12', 'selectbackground': '#e67e22'})
-                elif alert['type'] == 'success':
-                    self.alert_listbox.itemconfig(index, {'fg': '#27ae60', 'selectbackground': '#229954'})
-                else:
-                    self.alert_listbox.itemconfig(index, {'fg': '#3498db', 'selectbackground': '#2980b9'})
+                self.alert_listbox.itemconfig(0, self.alert_colors.get(alert['type'], self.alert_colors['info']))
         except Exception as e:
-            print(f"❌ Eroare la actualizarea listei de alerte: {e}")
+            log.error(f"❌ Eroare la actualizarea listei de alerte: {e}")
 
     def clear_alerts(self):
         """Șterge toate alertele"""
@@ -2596,14 +6859,14 @@ class ServerDashboard:
             confirm = messagebox.askyesno("Confirmare", "Sigur doriți să ștergeți toate alertele?")
 
             if confirm:
-                print("🗑️ Șterg toate alertele")
-                self.alerts = []
+                log.info("🗑️ Șterg toate alertele")
+                self.alerts.clear()
                 self.update_alerts_list()
 
                 # Adaugă alertă de confirmare
                 self.add_alert("🗑️ Toate alertele au fost șterse", "info")
         except Exception as e:
-            print(f"❌ Eroare la ștergerea alertelor: {e}")
+            log.error(f"❌ Eroare la ștergerea alertelor: {e}")
 
     def delete_server(self):
         """Șterge serverul selectat"""
@@ -2612,7 +6875,8 @@ class ServerDashboard:
             return
 
         try:
-            server = self.servers[self.servers['ID'] == self.current_selected].iloc[0]
+            server_idx = self.require_server_position(self.current_selected)
+            server = self.servers.iloc[server_idx]
 
             # Confirmare ștergere
             confirm = messagebox.askyesno(
@@ -2628,13 +6892,19 @@ class ServerDashboard:
             if not confirm:
                 return
 
-            print(f"🗑️ Șterg serverul {self.current_selected}")
+            log.info(f"🗑️ Șterg serverul {self.current_selected}")
 
             # Alertă ștergere
             self.add_alert(f"🗑️ SERVER ȘTERS: {self.current_selected} ({server.get('Nume', 'Unknown')}) - Eliminat din sistem", "warning")
 
-            # Ștergere din DataFrame
-            self.servers = self.servers[self.servers['ID'] != self.current_selected]
+            # Ștergere din DataFrame (poziția vine din index, fără scanare)
+            self.log_store.clear(self.current_selected)
+            with self.state_lock:
+                server_idx = self.require_server_position(self.current_selected)
+                removed = self.aggregator.delta(self.snapshot_row_aggregate(server_idx), None)
+                self.publish_servers(self.servers.drop(index=server_idx).reset_index(drop=True), [removed])
+                self.changes.mark_delete(self.current_selected)
+                self.rebuild_id_index()
 
             # Salvare și actualizare
             self.save_data()
@@ -2642,166 +6912,371 @@ class ServerDashboard:
             self.clear_server_details()
             self.refresh_topology()
 
-            print(f"✅ Server șters: {self.current_selected}")
+            log.info(f"✅ Server șters: {self.current_selected}")
             messagebox.showinfo("Succes", f"Serverul a fost șters cu succes!")
 
         except Exception as e:
-            print(f"❌ Eroare la ștergerea serverului: {e}")
+            log.error(f"❌ Eroare la ștergerea serverului: {e}")
             messagebox.showerror("Eroare", f"Eroare la ștergerea serverului: {str(e)}")
 
     def refresh_topology(self):
-        """Reîmprospătează topologia completă"""
-        try:
-            print("🔄 Reîmprospătare topologie completă...")
+        """Reîmprospătează topologia completă din snapshot-ul din memorie.
 
-            # Reîncărcare date
-            self.load_data()
+        Baza nu se recitește: adăugările/editările/ștergerile pot fi încă
+        în coada firului de persistență, iar o recitire le-ar anula.
+        """
+        try:
+            log.info("🔄 Reîmprospătare topologie completă...")
 
-            # Recreere tab-uri
-            self.create_tabs()
+            # Recreere tab-uri (în vederea globală se amână până la comutare)
+            if self.view_mode == 'overview':
+                self.tabs_stale = True
+                self.overview.schedule_render()
+            else:
+                self.create_tabs()
 
             # Actualizare header
             self.update_header_stats()
 
             # Verifică dacă serverul selectat mai există
             if (self.current_selected and
-                self.current_selected in self.servers['ID'].values):
+                self.get_server_position(self.current_selected) is not None):
                 self.show_server_details(self.current_selected)
             else:
                 self.current_selected = None
                 self.clear_server_details()
 
-            print("✅ Topologie actualizată")
+            log.info("✅ Topologie actualizată")
 
         except Exception as e:
-            print(f"❌ Eroare la actualizarea topologiei: {e}")
+            log.error(f"❌ Eroare la actualizarea topologiei: {e}")
             messagebox.showerror("Eroare", f"Eroare la actualizarea topologiei: {str(e)}")
 
-    def monitor_servers(self):
-        """Monitor continuu pentru servere - rulează în background"""
-        while True:
-            try:
-                print("🔍 Monitorizare servere în curs...")
-
-                changes_made = False
-
-                # Verificare fiecare server
-                for idx, server in self.servers.iterrows():
-                    status = server.get('Status', 'down')
-
-                    if status == 'up':
-                        # Simulare schimbări de metrici pentru servere online
-                        if random.random() < 0.3:  # 30% șansă de schimbare
-                            changes_made = True
-
-                            # Verifică dacă coloanele există, dacă nu le creează
-                            required_cols = ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out', 'Performance_Score', 'Uptime_Hours']
-                            for col in required_cols:
-                                if col not in self.servers.columns:
-                                    self.servers[col] = 0.0
-
-                            # Schimbări graduale pentru realism
-                            cpu_change = random.uniform(-5, 5)
-                            ram_change = random.uniform(-3, 3)
-                            disk_change = random.uniform(-1, 1)
-
-                            current_cpu = server.get('CPU_Usage', 20)
-                            current_ram = server.get('RAM_Usage', 30)
-                            current_disk = server.get('Disk_Usage', 50)
-
-                            new_cpu = max(5, min(98, current_cpu + cpu_change))
-                            new_ram = max(10, min(95, current_ram + ram_change))
-                            new_disk = max(20, min(99, current_disk + disk_change))
-
-                            self.servers.at[idx, 'CPU_Usage'] = new_cpu
-                            self.servers.at[idx, 'RAM_Usage'] = new_ram
-                            self.servers.at[idx, 'Disk_Usage'] = new_disk
-
-                            # Actualizare uptime
-                            current_uptime = server.get('Uptime_Hours', 0)
-                            self.servers.at[idx, 'Uptime_Hours'] = current_uptime + 0.167  # +10 minute
-
-                            # Actualizare performance score
-                            performance = 100 - ((new_cpu + new_ram + new_disk) / 3 * 0.5)
-                            self.servers.at[idx, 'Performance_Score'] = max(0, min(100, performance))
-
-                            # Network traffic simulation
-                            self.servers.at[idx, 'Network_In'] = random.randint(100, 3000)
-                            self.servers.at[idx, 'Network_Out'] = random.randint(100, 2500)
-
-                            # Verificare threshold-uri pentru alerte
-                            if new_cpu > 90:
-                                alert_msg = f"🚨 CPU CRITIC: {server['ID']} ({server.get('Nume', 'Unknown')}) - CPU la {new_cpu:.1f}%"
-                                self.root.after(0, lambda msg=alert_msg: self.add_alert(msg, "critical"))
-
-                            if new_ram > 85:
-                                alert_msg = f"⚠️ RAM RIDICAT: {server['ID']} ({server.get('Nume', 'Unknown')}) - RAM la {new_ram:.1f}%"
-                                self.root.after(0, lambda msg=alert_msg: self.add_alert(msg, "warning"))
-
-                            if new_disk > 90:
-                                alert_msg = f"💾 DISK PLIN: {server['ID']} ({server.get('Nume', 'Unknown')}) - Disk la {new_disk:.1f}%"
-                                self.root.after(0, lambda msg=alert_msg: self.add_alert(msg, "critical"))
-
-                        # Mică șansă de cădere pentru servere online (1%)
-                        if random.random() < 0.01:
-                            changes_made = True
-                            self.servers.at[idx, 'Status'] = 'down'
-
-                            # Reset metrici
-                            for metric in ['CPU_Usage', 'RAM_Usage', 'Network_In', 'Network_Out', 'Performance_Score']:
-                                if metric in self.servers.columns:
-                                    self.servers.at[idx, metric] = 0
-
-                            alert_msg = f"🚨 SERVER DOWN: {server['ID']} ({server.get('Nume', 'Unknown')}) - A căzut neașteptat!"
-                            self.root.after(0, lambda msg=alert_msg: self.add_alert(msg, "critical"))
-
-                    else:  # Server offline
-                        # Mică șansă de recuperare (5%)
-                        if random.random() < 0.05:
-                            changes_made = True
-                            self.servers.at[idx, 'Status'] = 'up'
-
-                            # Verifică și creează coloanele dacă nu există
-                            required_cols = ['CPU_Usage', 'RAM_Usage', 'Disk_Usage', 'Network_In', 'Network_Out', 'Performance_Score', 'Uptime_Hours']
-                            for col in required_cols:
-                                if col not in self.servers.columns:
-                                    self.servers[col] = 0.0
-
-                            # Restore metrici
-                            self.servers.at[idx, 'CPU_Usage'] = random.uniform(10, 40)
-                            self.servers.at[idx, 'RAM_Usage'] = random.uniform(20, 60)
-                            self.servers.at[idx, 'Network_In'] = random.randint(100, 1000)
-                            self.servers.at[idx, 'Network_Out'] = random.randint(100, 800)
-                            self.servers.at[idx, 'Performance_Score'] = random.uniform(70, 95)
-                            self.servers.at[idx, 'Uptime_Hours'] = 0  # Reset uptime
-
-                            alert_msg = f"✅ RECUPERARE: {server['ID']} ({server.get('Nume', 'Unknown')}) - Server revenit online!"
-                            self.root.after(0, lambda msg=alert_msg: self.add_alert(msg, "success"))
-
-                    # Actualizare timestamp verificare
-                    self.servers.at[idx, 'UltimaVerificare'] = datetime.now()
-
-                # Salvare și actualizare UI dacă au fost schimbări
-                if changes_made:
-                    self.root.after(0, lambda: self.save_data(silent=True))
-                    self.root.after(0, self.update_header_stats)
+    def import_excel(self):
+        """Importă servere dintr-un fișier Excel ales de utilizator"""
+        try:
+            excel_path = filedialog.askopenfilename(
+                title="Import servere din Excel",
+                initialfile=self.excel_file,
+                filetypes=[("Excel", "*.xlsx *.xls"), ("Toate fișierele", "*.*")])
+            if not excel_path:
+                return
 
-                    # Actualizare detalii dacă un server este selectat
-                    if (self.current_selected and
-                        self.current_selected in self.servers['ID'].values):
-                        self.root.after(0, lambda: self.show_server_details(self.current_selected))
+            confirm = messagebox.askyesno(
+                "Confirmare Import",
+                f"Importul din {os.path.basename(excel_path)} va înlocui serverele curente.\n\nContinuați?",
+                icon='warning')
+            if not confirm:
+                return
 
-                    # Redraw topologie pentru tab-ul curent
-                    self.root.after(0, lambda: self.draw_tab_topology(self.current_tab))
+            # Fără scrieri ale firului de persistență între snapshot-ul importat și
+            # publicarea lui - altfel diferențele stării vechi ar ajunge peste import
+            with self.persistence_lock:
+                imported = self.import_from_excel(excel_path)
+                self.load_data(imported)
+            self.refresh_topology()
+            self.add_alert(f"📥 IMPORT EXCEL: {len(imported)} servere importate din {os.path.basename(excel_path)}", "success")
 
-                # Așteptare între verificări (15 secunde)
-                time.sleep(15)
+        except Exception as e:
+            log.error(f"❌ Eroare la importul din Excel: {e}")
+            messagebox.showerror("Eroare", f"Eroare la importul din Excel: {str(e)}")
+
+    def export_excel(self):
+        """Exportă serverele curente în fișierul Excel"""
+        try:
+            # Verifică dacă fișierul este în uz (deschis în Excel)
+            def is_file_in_use(filepath):
+                try:
+                    # Încearcă să deschidă fișierul pentru scriere
+                    with open(filepath, 'r+b'):
+                        pass
+                    return False
+                except (IOError, OSError):
+                    return True
+
+            if os.path.exists(self.excel_file) and is_file_in_use(self.excel_file):
+                messagebox.showwarning("Fișier în uz",
+                    f"Fișierul {self.excel_file} este deschis în Excel.\n\n"
+                    f"💡 Închideți Excel și încercați din nou exportul.")
+                log.warning(f"⚠️ Fișier în uz: {self.excel_file} - export amânat")
+                return
+
+            self.export_to_excel(self.excel_file)
+            self.add_alert(f"📤 EXPORT EXCEL: {len(self.servers)} servere exportate în {self.excel_file}", "success")
+
+        except Exception as e:
+            log.error(f"❌ Eroare la exportul în Excel: {e}")
+            messagebox.showerror("Eroare", f"Eroare la exportul în Excel: {str(e)}")
+
+    def show_backups(self):
+        """Fereastra cu generațiile de backup: backup manual și restaurare"""
+        try:
+            backup_win = tk.Toplevel(self.root)
+            backup_win.title("🗄️ Backup-uri bază de date")
+            backup_win.geometry("560x380")
+            backup_win.configure(bg='#2c3e50')
+            backup_win.transient(self.root)
+
+            tk.Label(backup_win, text=f"🗄️ Generații în {os.path.abspath(self.backup_dir)}",
+                    font=('Segoe UI', 11, 'bold'), fg='#ecf0f1', bg='#2c3e50').pack(pady=(10, 5))
+
+            listbox = tk.Listbox(backup_win, font=('Consolas', 9), bg='#34495e', fg='#ecf0f1',
+                                 selectbackground='#3498db', relief='flat')
+            listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+            def refresh_list():
+                listbox.delete(0, tk.END)
+                for entry in reversed(self.backups.generations):
+                    created = datetime.fromtimestamp(entry['created']).strftime('%d/%m/%Y %H:%M:%S')
+                    kind = "link" if entry.get('deduplicated') else f"{entry['size'] / 1024 / 1024:.1f} MB"
+                    listbox.insert(tk.END, f"{created}  •  {kind:>8}  •  {entry.get('reason', '')}")
+
+            def selected_name():
+                selection = listbox.curselection()
+                if not selection:
+                    messagebox.showwarning("Avertisment", "Selectați un backup", parent=backup_win)
+                    return None
+                return list(reversed(self.backups.generations))[selection[0]]['name']
+
+            self.backup_list_refresh = refresh_list
+            backup_win.bind('<Destroy>', lambda event: setattr(self, 'backup_list_refresh', None)
+                            if event.widget is backup_win else None)
+
+            def backup_now():
+                # Salvarea și copierea pot dura - rulează în afara firului Tk, rezultatul vine prin dispatcher
+                def backup_process():
+                    try:
+                        self.write_servers(silent=True)  # Backup-ul include ultimele modificări
+                        with self.persistence_lock:
+                            entry = self.backups.create(f"{self.state_session}:{self.state_version}",
+                                                        reason="manual")
+                        self.ui_dispatcher.post('backup', entry)
+                    except Exception as e:
+                        log.error(f"❌ Eroare la backup-ul manual: {e}")
+                        self.ui_dispatcher.post('alert', (f"❌ Backup manual eșuat: {e}", "critical"))
+
+                threading.Thread(target=backup_process, name="backup-now", daemon=True).start()
+
+            def restore_selected():
+                name = selected_name()
+                if name and messagebox.askyesno(
+                        "Confirmare Restaurare",
+                        f"Restaurați baza de date din {name}?\n\n"
+                        f"Starea curentă este salvată întâi ca backup separat.",
+                        icon='warning', parent=backup_win):
+                    self.restore_backup(name)
+                    refresh_list()
+
+            btn_frame = tk.Frame(backup_win, bg='#2c3e50')
+            btn_frame.pack(fill=tk.X, padx=10, pady=10)
+            tk.Button(btn_frame, text="💾 Backup acum", command=backup_now,
+                     font=('Segoe UI', 9), bg='#27ae60', fg='white', relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+            tk.Button(btn_frame, text="♻️ Restaurează", command=restore_selected,
+                     font=('Segoe UI', 9), bg='#e67e22', fg='white', relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+            tk.Button(btn_frame, text="❌ Închide", command=backup_win.destroy,
+                     font=('Segoe UI', 9), bg='#7f8c8d', fg='white', relief='flat', padx=10).pack(side=tk.RIGHT, padx=2)
+            refresh_list()
+
+        except Exception as e:
+            log.error(f"❌ Eroare la afișarea backup-urilor: {e}")
+            messagebox.showerror("Eroare", f"Eroare la afișarea backup-urilor: {str(e)}")
+
+    def restore_backup(self, name):
+        """Restaurează o generație de backup și reîncarcă serverele din ea"""
+        try:
+            with self.persistence_lock:
+                self.backups.restore(name)
+                servers = self.storage.load()
+                with self.state_lock:
+                    self.publish_servers(servers)
+                    self.last_saved_servers = servers
+                    self.changes = ChangeSet()
+                    self.rebuild_id_index()
+                    self.aggregator.rebuild(servers)
+                    # Tabela de alerte a fost și ea înlocuită - starea din memorie e veche
+                    self.alert_engine.reload()
+
+            self.current_selected = None
+            self.clear_server_details()
+            self.refresh_performance_metrics()
+            self.update_header_stats()
+            self.refresh_topology()
+            self.add_alert(f"♻️ RESTAURARE: {len(servers)} servere restaurate din {name}", "success")
+
+        except Exception as e:
+            log.error(f"❌ Eroare la restaurarea backup-ului: {e}")
+            messagebox.showerror("Eroare", f"Eroare la restaurarea backup-ului: {str(e)}")
+
+    def show_statistics(self):
+        """Panoul de statistici: timerele și contoarele instrumentației, reîmprospătate la 1 s,
+        plus profilare la cerere (eșantionare pe toate firele sau cProfile pe firul Tk)"""
+        try:
+            stats_win = tk.Toplevel(self.root)
+            stats_win.title("📈 Statistici și profilare")
+            stats_win.geometry("760x560")
+            stats_win.configure(bg='#2c3e50')
+            stats_win.transient(self.root)
+            instruments = self.instruments
+            profile = {'thread': None, 'report': None}
+
+            controls = tk.Frame(stats_win, bg='#2c3e50')
+            controls.pack(fill=tk.X, padx=10, pady=(10, 5))
+            enabled_var = tk.BooleanVar(value=instruments.enabled)
+            tk.Checkbutton(controls, text="📈 Instrumentare activă", variable=enabled_var,
+                          command=lambda: instruments.set_enabled(enabled_var.get()),
+                          font=('Segoe UI', 9), fg='#ecf0f1', bg='#2c3e50',
+                          selectcolor='#34495e', activebackground='#2c3e50').pack(side=tk.LEFT, padx=2)
+
+            stats_text = tk.Text(stats_win, font=('Consolas', 9), bg='#34495e', fg='#ecf0f1',
+                                 relief='flat', wrap=tk.NONE)
+            stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+            status_var = tk.StringVar(value="")
+            tk.Label(stats_win, textvariable=status_var, font=('Segoe UI', 9),
+                    fg='#95a5a6', bg='#2c3e50', anchor='w').pack(fill=tk.X, padx=10)
+
+            def show_report(title, report):
+                path = os.path.abspath(f"profile-{datetime.now():%Y%m%d-%H%M%S}.txt")
+                with open(path, 'w', encoding='utf-8') as handle:
+                    handle.write(report)
+                stats_text.delete('1.0', tk.END)
+                stats_text.insert('1.0', report)
+                status_var.set(f"{title} - salvat în {path}")
+                log.info(f"📈 {title} salvat în {path}")
+
+            def refresh():
+                if not stats_win.winfo_exists():
+                    return
+                if profile['report'] is not None:
+                    show_report("Profil prin eșantionare", profile['report'])
+                    profile['report'] = None
+                elif not status_var.get():
+                    # Cât timp e afișat un profil (sau rulează unul), statisticile nu îl suprascriu
+                    stats_text.delete('1.0', tk.END)
+                    stats_text.insert('1.0', instruments.format_report())
+                stats_win.after(1000, refresh)
+
+            def sample_profile():
+                if profile['thread'] is not None:
+                    return
+                status_var.set("⏳ Eșantionare 5 s pe toate firele...")
+
+                def run():
+                    try:
+                        profile['report'] = instruments.sample_profile(duration=5.0)
+                    except Exception as e:
+                        profile['report'] = f"Eroare la profilare: {e}"
+                    finally:
+                        profile['thread'] = None
+
+                profile['thread'] = threading.Thread(target=run, daemon=True)
+                profile['thread'].start()
+
+            def toggle_cprofile():
+                if instruments.profiler is None:
+                    instruments.start_cprofile()
+                    cprofile_button.config(text="⏹️ Oprește cProfile")
+                    status_var.set("⏺️ cProfile activ pe firul UI - folosiți dashboard-ul, apoi opriți")
+                else:
+                    cprofile_button.config(text="⏺️ cProfile UI")
+                    show_report("cProfile fir UI", instruments.stop_cprofile())
+
+            def reset():
+                instruments.reset()
+                status_var.set("")
+
+            tk.Button(controls, text="🔬 Profil 5 s", command=sample_profile,
+                     font=('Segoe UI', 9), bg='#8e44ad', fg='white', relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+            cprofile_button = tk.Button(controls, text="⏺️ cProfile UI", command=toggle_cprofile,
+                                        font=('Segoe UI', 9), bg='#2980b9', fg='white', relief='flat', padx=10)
+            cprofile_button.pack(side=tk.LEFT, padx=2)
+            tk.Button(controls, text="🔄 Reset / statistici", command=reset,
+                     font=('Segoe UI', 9), bg='#e67e22', fg='white', relief='flat', padx=10).pack(side=tk.LEFT, padx=2)
+            tk.Button(controls, text="❌ Închide", command=stats_win.destroy,
+                     font=('Segoe UI', 9), bg='#7f8c8d', fg='white', relief='flat', padx=10).pack(side=tk.RIGHT, padx=2)
+            refresh()
+
+        except Exception as e:
+            log.error(f"❌ Eroare la afișarea statisticilor: {e}")
+            messagebox.showerror("Eroare", f"Eroare la afișarea statisticilor: {str(e)}")
 
-            except Exception as e:
-                print(f"❌ Eroare în monitorizare: {str(e)}")
-                time.sleep(30)  # Așteptare mai lungă în caz de eroare
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Dashboard IT Professional - Server Monitoring System")
+    parser.add_argument('--list-backups', action='store_true', help="afișează generațiile de backup și iese")
+    parser.add_argument('--restore', metavar='BACKUP', help="restaurează baza de date din generația dată și iese")
+    parser.add_argument('--headless', action='store_true',
+                        help="rulează doar motorul de monitorizare, fără interfață grafică (Ctrl+C / SIGTERM oprește)")
+    parser.add_argument('--api-port', type=int, metavar='PORT',
+                        help="pornește API-ul HTTP local (doar citire) pe 127.0.0.1:PORT")
+    parser.add_argument('--interval', type=float, default=15.0, metavar='SECUNDE',
+                        help="intervalul dintre tick-urile de monitorizare în modul --headless și pasul --storm-trace (implicit 15)")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="nivelul diagnosticelor (DEBUG include tick-urile, desenările și click-urile)")
+    parser.add_argument('--instrument', action='store_true',
+                        help="pornește cu instrumentarea activă (timere/contoare în 📈 Statistici și /api/stats)")
+    parser.add_argument('--generate', type=int, metavar='N',
+                        help="înlocuiește flota din baza de date cu N servere sintetice (după un backup) și iese")
+    parser.add_argument('--storm-trace', metavar='FIȘIER',
+                        help="scrie o înregistrare sintetică cu furtuni de avarii pentru flota din baza de date și iese")
+    parser.add_argument('--duration', type=float, default=900.0, metavar='SECUNDE',
+                        help="durata înregistrării scrise de --storm-trace (implicit 900; un cadru la --interval)")
+    parser.add_argument('--seed', type=int, help="seed pentru --generate și --storm-trace (rezultate reproductibile)")
+    parser.add_argument('--replay', metavar='FIȘIER', help="redă înregistrarea în locul simulării de monitorizare")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="viteza redării (10 = de zece ori mai repede, 0 = cât de repede se poate)")
+    parser.add_argument('--record-trace', metavar='FIȘIER',
+                        help="înregistrează evoluția flotei (.jsonl sau .jsonl.gz), pentru --replay")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format="%(message)s")
+    engine_options = {'api_port': args.api_port, 'instrument': args.instrument, 'replay': args.replay,
+                      'replay_speed': args.speed, 'record_trace': args.record_trace}
+
+    if args.list_backups or args.restore:
+        backups = BackupManager(SQLiteStorage(MonitoringEngine.DB_FILE), MonitoringEngine.BACKUP_DIR)
+        if args.restore:
+            backups.restore(args.restore)
+        for entry in backups.generations:
+            created = datetime.fromtimestamp(entry['created']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"   • {entry['name']}  ({created}, {entry['size'] / 1024 / 1024:.1f} MB"
+                  f"{', link' if entry.get('deduplicated') else ''})")
+        backups.storage.close()
+        exit(0)
+
+    if args.generate is not None or args.storm_trace:
+        storage = SQLiteStorage(MonitoringEngine.DB_FILE)
+        generator = FleetGenerator(seed=args.seed)
+        if args.generate is not None:
+            if storage.exists():
+                BackupManager(storage, MonitoringEngine.BACKUP_DIR).create(reason="înainte de --generate")
+            storage.save(generator.generate(args.generate))
+            # ID-urile generate le pot repeta pe cele vechi - istoricul lor nu trebuie moștenit
+            for path in MonitoringEngine.archive_fleet_stores(f"{datetime.now():%Y%m%d-%H%M%S}"):
+                print(f"🗄️ Arhivat {path}")
+            print(f"🏭 {args.generate} servere sintetice scrise în {MonitoringEngine.DB_FILE}")
+        if args.storm_trace:
+            summary = generator.storm_trace(storage.load(), args.storm_trace,
+                                            duration=args.duration, tick=args.interval)
+            print(f"🌩️ Înregistrare scrisă în {args.storm_trace}: {summary['frames']} cadre, "
+                  f"{summary['rows']} rânduri, {summary['outages']} căderi")
+        storage.close()
+        exit(0)
+
+    if args.headless:
+        import signal
+        print(f"🚀 Motor de monitorizare fără interfață (interval {args.interval:g} s)...")
+        engine = MonitoringEngine(monitor_interval=args.interval, **engine_options)
+        engine.subscribe(lambda kind, payload: print(f"🔔 [{payload[1]}] {payload[0]}") if kind == 'alert' else None)
+        signal.signal(signal.SIGTERM, lambda signum, frame: engine.stopping.set())
+        engine.start()
+        try:
+            while engine.monitor_thread.is_alive():
+                engine.monitor_thread.join(timeout=1.0)
+        except KeyboardInterrupt:
+            print("\n👋 Motor oprit de utilizator")
+        engine.shutdown()
+        exit(0)
+
     # Verificare dependințe
     try:
         import pandas as pd
@@ -2825,7 +7300,7 @@ if __name__ == "__main__":
         pass  # Continue cu tema default dacă nu e disponibilă
 
     # Start aplicație
-    app = ServerDashboard(root)
+    app = ServerDashboard(root, **engine_options)
 
     print("✅ Dashboard IT Professional gata!")
     print("🎯 Funcționalități disponibile:")
@@ -2835,7 +7310,7 @@ if __name__ == "__main__":
     print("   • Layout vertical pentru topologie")
     print("   • Click dreapta pentru meniu contextual")
     print("   • Maxim 6 servere per tab")
-    print("   • Editare și salvare în Excel")
+    print("   • Stocare rapidă SQLite cu import/export Excel")
     print("   • Monitorizare real-time")
     print("   • Sistem alerting avansat")
     print("   • Metrici de performanță")
@@ -2852,4 +7327,7 @@ if __name__ == "__main__":
         print(f"❌ Eroare fatală: {e}")
         messagebox.showerror("Eroare Fatală", f"Aplicația s-a închis din cauza unei erori:\n{str(e)}")
 
+    # Persistă ultimele modificări și compactează jurnalul
+    app.shutdown()
+
     print("👋 Dashboard IT Professional închis")
\ No newline at end of file
@@ -0,0 +1,361 @@
+"""Benchmark pentru căile critice ale dashboard-ului pe flote sintetice.
+
+Măsoară tick-ul de monitorizare, metricile, salvarea/încărcarea, desenarea
+topologiei, vederea globală, panoul de detalii și redarea unui cadru cu furtuni
+de avarii pentru flote de 10 până la 50.000 de servere (generate cu FleetGenerator),
+și scrie rezultatele în JSON ca să poată fi comparate între
+commit-uri:
+
+    python benchmark.py                                  # toate dimensiunile
+    python benchmark.py --sizes 100 10000 --output nou.json
+    python benchmark.py --compare vechi.json --output nou.json
+    xvfb-run python benchmark.py --tk                    # canvas-uri Tk reale
+    python benchmark.py --probe-selftest 500             # ProbeEngine pe ascultători 127.0.0.x
+
+Fără --tk, căile Tk rulează pe un canvas simulat (MockCanvas), deci benchmark-ul
+merge și pe servere fără afișaj; se măsoară logica de desenare, nu randarea Tk.
+"""
+import argparse
+import importlib.util
+import itertools
+import json
+import logging
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Aplicatie Complexa FINAL.py")
+DEFAULT_SIZES = (10, 100, 1000, 10000, 50000)
+
+
+def load_app():
+    """Încarcă scriptul principal ca modul (numele fișierului conține spații)"""
+    spec = importlib.util.spec_from_file_location("dashboard_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class MockCanvas:
+    """Canvas fără afișaj: numără elementele create, ca desenarea să ruleze fără Tk"""
+
+    def __init__(self, width=1000, height=700):
+        self.width = width
+        self.height = height
+        self.items = 0
+        self.updates = 0
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def cget(self, option):
+        return {'width': self.width, 'height': self.height}[option]
+
+    def create_item(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_line = create_rectangle = create_oval = create_text = create_polygon = create_item
+
+    def itemconfig(self, item, **options):
+        self.updates += 1
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None  # delete, coords, tag_raise etc.
+
+
+class MockVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class UIWidgets:
+    """Widget-urile folosite de căile Tk măsurate: simulate sau reale (--tk, necesită afișaj)"""
+
+    def __init__(self, real_tk):
+        self.real_tk = real_tk
+        self.root = None
+        if real_tk:
+            import tkinter as tk
+            self.tk = tk
+            self.root = tk.Tk()
+            self.root.geometry("1200x900")
+
+    def canvas(self, width, height):
+        if not self.real_tk:
+            return MockCanvas(width, height)
+        canvas = self.tk.Canvas(self.root, width=width, height=height, highlightthickness=0)
+        canvas.pack()
+        self.root.update()
+        return canvas
+
+    def var(self, value=""):
+        return self.tk.StringVar(self.root, value) if self.real_tk else MockVar(value)
+
+    def text(self):
+        if not self.real_tk:
+            return MockCanvas()
+        widget = self.tk.Text(self.root, height=10)
+        widget.pack()
+        return widget
+
+    def close(self):
+        if self.root is not None:
+            self.root.destroy()
+
+
+def attach_ui(app, dashboard, widgets):
+    """Completează un ServerDashboard fără fereastră cu starea UI necesară căilor măsurate"""
+    dashboard.root = widgets.root
+    dashboard.max_servers_per_tab = 6
+    dashboard.server_icons = {}
+    dashboard.tooltip = None
+    dashboard.current_selected = None
+    dashboard.overview = None
+    dashboard.log_tail_entries = 200
+    dashboard.log_view = {'server_id': None, 'start': 0, 'count': 0}
+    dashboard.history_ranges = {"1h": 3600, "6h": 6 * 3600, "24h": 24 * 3600}
+    dashboard.history_range = widgets.var("1h")
+    dashboard.history_canvas = widgets.canvas(400, 80)
+    dashboard.log_text = widgets.text()
+    dashboard.older_logs_button = widgets.text()
+    dashboard.info_vars = {key: widgets.var() for key in
+                           ('id', 'nume', 'ip', 'locatie', 'status', 'uptime', 'ultima_verificare')}
+    dashboard.metrics_vars = {key: widgets.var() for key in
+                              ('cpu', 'ram', 'disk', 'network_in', 'network_out', 'performance')}
+    dashboard.progress_bars = {key: {'value': 0} for key in ('cpu', 'ram', 'disk', 'performance')}
+    dashboard.tabs = [{'frame': None, 'start': 0, 'end': min(6, len(dashboard.servers)),
+                       'canvas': widgets.canvas(1000, 700), 'scene': None, 'hit_index': None,
+                       'redraw_job': None}]
+
+    overview = app.FleetOverview.__new__(app.FleetOverview)
+    overview.__dict__.update(dashboard=dashboard, canvas=widgets.canvas(1200, 800), zoom=1.0,
+                             offset_x=0.0, offset_y=0.0, cols=1, selected=None, render_job=None,
+                             drag_start=None, dragged=False, needs_fit=True)
+    return overview
+
+
+def measure(function, runs, setup=None):
+    """Timpii unei funcții (ms) după o rulare de încălzire; setup rulează nemăsurat înaintea fiecărei rulări"""
+    if setup:
+        setup()
+    function()
+    timings = []
+    for _ in range(runs):
+        if setup:
+            setup()
+        start_time = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return {'runs': runs, 'min_ms': min(timings), 'median_ms': statistics.median(timings),
+            'mean_ms': statistics.fmean(timings), 'max_ms': max(timings)}
+
+
+def bench_fleet(app, num_servers, widgets, seed):
+    """Rulează toate căile pentru o flotă de num_servers, într-un director temporar"""
+    runs = max(3, min(30, 20000 // num_servers))
+    results = {}
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            storage = app.SQLiteStorage(app.MonitoringEngine.DB_FILE)
+            generator = app.FleetGenerator(seed)
+            storage.save(generator.generate(num_servers))
+            storage.close()
+
+            dashboard = app.ServerDashboard.__new__(app.ServerDashboard)
+            app.MonitoringEngine.__init__(dashboard)
+            dashboard.rng = np.random.default_rng(seed)
+            overview = attach_ui(app, dashboard, widgets)
+            api = app.FleetAPI(dashboard, port=0)
+            sample_ids = dashboard.servers['ID'].sample(n=min(50, num_servers), random_state=seed).tolist()
+
+            def tick():
+                dashboard.simulate_monitoring_tick()
+                dashboard.metrics_history.record(time.time(), dashboard.servers)
+
+            def show_details():
+                dashboard.show_server_details(sample_ids[int(dashboard.rng.integers(len(sample_ids)))])
+
+            # Cadre dintr-o înregistrare cu furtuni (primul cadru, flota completă, e starea curentă)
+            generator.storm_trace(dashboard.servers, "storm.jsonl", duration=15.0 * (runs + 1), tick=15.0)
+            trace_frames = list(app.FleetTrace("storm.jsonl").frames())
+            replay_frames = itertools.cycle(trace_frames[1:] or trace_frames)
+            replay_start = time.time()
+
+            def replay_frame():
+                offset, ids, values = next(replay_frames)
+                dashboard.apply_trace_frame(ids, values, now=replay_start + offset)
+
+            def api_fleet():
+                api.fleet_cache = (None, b'')
+                api.fleet_body()
+
+            results['load_data'] = measure(dashboard.load_data, runs)
+            results['monitor_tick'] = measure(tick, runs)
+            results['calculate_performance_metrics'] = measure(dashboard.calculate_performance_metrics, runs)
+            results['refresh_performance_metrics'] = measure(dashboard.refresh_performance_metrics, runs)
+            results['save_incremental'] = measure(lambda: dashboard.write_servers(silent=True), runs, setup=tick)
+            results['save_snapshot'] = measure(dashboard.compact_storage, runs)
+            results['draw_tab_full'] = measure(lambda: dashboard.draw_tab_topology(0, force=True), runs)
+            results['draw_tab_incremental'] = measure(lambda: dashboard.draw_tab_topology(0), runs, setup=tick)
+            results['overview_render'] = measure(overview.render, runs, setup=overview.fit)
+            results['show_server_details'] = measure(show_details, runs)
+            results['api_fleet_json'] = measure(api_fleet, runs)
+            results['replay_storm_frame'] = measure(replay_frame, runs)
+
+            dashboard.storage.close()
+            dashboard.log_store.close()
+            dashboard.alert_engine.close()
+        finally:
+            os.chdir(previous_dir)
+    return results
+
+
+def open_listeners(count):
+    """Ascultători TCP locali pe 127.0.0.1..254 (porturi efemere); revine la 127.0.0.1
+    unde adresele suplimentare din 127.0.0.0/8 nu sunt disponibile (ex. macOS)"""
+    listeners = []
+    for i in range(count):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind((f"127.0.0.{i % 254 + 1}", 0))
+        except OSError:
+            sock.bind(("127.0.0.1", 0))
+        sock.listen(16)
+        listeners.append(sock)
+    return listeners
+
+
+def probe_selftest(app, count):
+    """Verifică ProbeEngine pe ascultători locali: toți trebuie raportați accesibili,
+    iar porturile închise inaccesibile. Returnează True dacă rezultatele sunt corecte."""
+    listeners = open_listeners(count)
+    try:
+        open_targets = ["%s:%d" % sock.getsockname() for sock in listeners]
+        # Porturi închise: ascultători eliberați imediat - connect-ul primește RST
+        closed_targets = []
+        for sock in open_listeners(max(1, count // 10)):
+            closed_targets.append("%s:%d" % sock.getsockname())
+            sock.close()
+        engine = app.ProbeEngine(timeout=2.0, jitter=0.5)
+        latencies = engine.probe_all(open_targets + closed_targets)
+    finally:
+        for sock in listeners:
+            sock.close()
+
+    reached = sum(latency is not None for latency in latencies[:len(open_targets)])
+    false_positives = sum(latency is not None for latency in latencies[len(open_targets):])
+    stats = engine.last_run
+    median = stats['median_latency_ms']
+    print(f"🔌 Probe: {reached}/{len(open_targets)} ascultători accesibili, "
+          f"{false_positives}/{len(closed_targets)} porturi închise raportate greșit, "
+          f"{stats['elapsed_s']:.2f} s, latență mediană {median if median is None else f'{median:.2f} ms'}")
+    return reached == len(open_targets) and not false_positives
+
+
+def run_metadata(real_tk):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(APP_PATH), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'commit': commit, 'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(), 'pandas': pd.__version__, 'numpy': np.__version__,
+            'platform': platform.platform(), 'tk': 'real' if real_tk else 'mock'}
+
+
+def compare(baseline, current, threshold, min_delta_ms):
+    """Afișează raportul median nou/vechi; returnează numărul de regresii peste prag.
+
+    O cale e regresie doar dacă depășește și pragul relativ, și min_delta_ms absolut
+    (căile sub-milisecundă sunt dominate de zgomot).
+    """
+    regressions = 0
+    print(f"\n📊 Comparație cu {baseline['meta'].get('commit')} (prag regresie {threshold:.2f}x):")
+    for size, paths in current['results'].items():
+        for path, stats in paths.items():
+            old = baseline['results'].get(size, {}).get(path)
+            if not old:
+                continue
+            ratio = stats['median_ms'] / max(old['median_ms'], 1e-6)
+            significant = abs(stats['median_ms'] - old['median_ms']) >= min_delta_ms
+            regressed = significant and ratio > threshold
+            marker = "❌" if regressed else ("✅" if significant and ratio < 1 / threshold else "  ")
+            regressions += regressed
+            print(f"   {marker} {size:>6} {path:<30} {old['median_ms']:9.2f} → {stats['median_ms']:9.2f} ms "
+                  f"({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pentru căile critice ale dashboard-ului")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="dimensiunile flotelor")
+    parser.add_argument('--output', default="benchmark_results.json", help="fișierul JSON cu rezultate")
+    parser.add_argument('--compare', metavar='JSON', help="rezultate anterioare pentru comparație")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="raportul median peste care o cale e raportată ca regresie")
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help="diferența absolută minimă (ms) pentru a raporta o regresie")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tk', action='store_true', help="canvas-uri Tk reale (necesită afișaj, ex. xvfb-run)")
+    parser.add_argument('--probe-selftest', type=int, metavar='N',
+                        help="verifică ProbeEngine pe N ascultători locali 127.0.0.x și iese")
+    args = parser.parse_args()
+
+    app = load_app()
+    if args.probe_selftest:
+        sys.exit(0 if probe_selftest(app, args.probe_selftest) else 1)
+    widgets = UIWidgets(args.tk)
+    report = {'meta': run_metadata(args.tk), 'results': {}}
+    # Mesajele informative ale aplicației se filtrează la sursă (avertismentele rămân vizibile)
+    app_log = logging.getLogger("dashboard")
+    previous_level = app_log.level
+    app_log.setLevel(logging.WARNING)
+    try:
+        for num_servers in args.sizes:
+            print(f"⏱️ Flotă de {num_servers} servere...", flush=True)
+            start_time = time.perf_counter()
+            results = bench_fleet(app, num_servers, widgets, args.seed)
+            report['results'][str(num_servers)] = results
+            for path, stats in results.items():
+                print(f"   • {path:<30} median {stats['median_ms']:9.2f} ms  (min {stats['min_ms']:.2f}, "
+                      f"{stats['runs']} rulări)")
+            print(f"   ({time.perf_counter() - start_time:.1f} s)")
+    finally:
+        app_log.setLevel(previous_level)
+        widgets.close()
+
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=1)
+    print(f"💾 Rezultate salvate în {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressions = compare(json.load(handle), report, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"❌ {regressions} regresii peste prag")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""Fixture comun: aplicația este un singur script, încărcat ca modul pentru teste."""
+import importlib.util
+import os
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Aplicatie Complexa FINAL.py")
+
+
+@pytest.fixture(scope="module")
+def app():
+    spec = importlib.util.spec_from_file_location("dashboard_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
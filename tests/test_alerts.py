@@ -0,0 +1,86 @@
+"""Teste pentru AlertEngine: mai multe tick-uri sintetice trecute prin RuleSet.evaluate
+(histerezis, deduplicare, flapping, pauză manuală)."""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+IDS = np.array(['SRV-001', 'SRV-002'], dtype=object)
+NAMES = np.array(['Web', 'DB'], dtype=object)
+POSITIONS = {server_id: pos for pos, server_id in enumerate(IDS)}
+
+
+@pytest.fixture
+def engine(app, tmp_path):
+    engines = []
+
+    def make(**options):
+        alert_engine = app.AlertEngine(str(tmp_path / "alerts.sqlite"), **options)
+        engines.append(alert_engine)
+        return alert_engine
+
+    yield make
+    for alert_engine in engines:
+        alert_engine.close()
+
+
+def tick(rules, alert_engine, cpu, now):
+    """Un pas: CPU per server (RAM/Disk sub praguri), toate serverele online"""
+    cpu = np.asarray(cpu, dtype='float64')
+    servers = pd.DataFrame({'ID': IDS, 'Nume': NAMES, 'CPU_Usage': cpu,
+                            'RAM_Usage': 10.0, 'Disk_Usage': 10.0})
+    evaluations = rules.evaluate(servers, IDS, {'CPU_Usage': cpu}, np.ones(len(IDS), dtype=bool))
+    return [message for message, _ in alert_engine.evaluate(IDS, NAMES, evaluations, POSITIONS, now)]
+
+
+def test_hysteresis_band_and_dedup(app, engine):
+    rules = app.RuleSet()  # cpu_critical: raise 90, clear 85
+    alerts = engine(suppression_window=0)
+
+    opened = tick(rules, alerts, [95, 10], now=0)
+    assert len(opened) == 1 and 'SRV-001' in opened[0]
+    assert tick(rules, alerts, [97, 10], now=10) == []  # Deduplicare - alerta e deja deschisă
+    assert tick(rules, alerts, [88, 10], now=20) == []  # În banda de histerezis: rămâne deschisă
+    assert ('SRV-001', 'cpu_critical') in alerts.active
+
+    cleared = tick(rules, alerts, [80, 10], now=30)
+    assert len(cleared) == 1 and 'NORMAL' in cleared[0]
+    assert alerts.active == {}
+    assert alerts.stats['opened'] == 1 and alerts.stats['cleared'] == 1
+
+    rows = alerts.connect().execute("SELECT server_id, rule, opened_at, cleared_at FROM alerts").fetchall()
+    assert rows == [('SRV-001', 'cpu_critical', 0, 30)]
+
+
+def test_flapping_key_is_silenced_until_window_passes(app, engine):
+    rules = app.RuleSet()
+    alerts = engine(flap_window=600, flap_threshold=3, suppression_window=0)
+
+    assert len(tick(rules, alerts, [95, 10], now=0)) == 1
+    assert len(tick(rules, alerts, [80, 10], now=10)) == 1
+    flapping = tick(rules, alerts, [95, 10], now=20)  # A treia schimbare în fereastră
+    assert len(flapping) == 1 and 'FLAPPING' in flapping[0]
+
+    assert tick(rules, alerts, [80, 10], now=30) == []
+    assert tick(rules, alerts, [95, 10], now=40) == []
+    assert alerts.stats['suppressed'] == 1
+
+    assert tick(rules, alerts, [80, 10], now=50) == []
+    reopened = tick(rules, alerts, [95, 10], now=1000)  # Fereastra a expirat
+    assert len(reopened) == 1 and 'CPU CRITIC' in reopened[0]
+
+
+def test_manual_suppression_expires(app, engine):
+    rules = app.RuleSet()
+    alerts = engine(suppression_window=0)
+    start = time.time()
+    alerts.suppress('SRV-002', 60)
+
+    assert tick(rules, alerts, [10, 95], now=start + 1) == []  # Pe pauză: deschisă, dar tăcută
+    assert ('SRV-002', 'cpu_critical') in alerts.active
+    assert tick(rules, alerts, [10, 50], now=start + 2) == []
+    assert alerts.stats['suppressed'] == 1
+
+    expired = tick(rules, alerts, [10, 95], now=start + 120)
+    assert len(expired) == 1 and 'SRV-002' in expired[0]
@@ -0,0 +1,57 @@
+"""Teste pentru FleetAPI pe un port efemer, peste un MonitoringEngine fără UI."""
+import http.client
+import json
+
+import pytest
+
+
+@pytest.fixture
+def api(app, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Baza de date, logurile și backup-urile motorului ajung în tmp_path
+    storage = app.SQLiteStorage(app.MonitoringEngine.DB_FILE)
+    storage.save(app.FleetGenerator(seed=7).generate(20))
+    storage.close()
+
+    engine = app.MonitoringEngine()
+    fleet_api = app.FleetAPI(engine, port=0)
+    fleet_api.start()
+    yield fleet_api
+    fleet_api.stop()
+    engine.shutdown()
+
+
+def get(api, path, etag=None):
+    connection = http.client.HTTPConnection(api.host, api.port, timeout=5)
+    try:
+        connection.request('GET', path, headers={'If-None-Match': etag} if etag else {})
+        response = connection.getresponse()
+        return response.status, response.getheader('ETag'), response.read()
+    finally:
+        connection.close()
+
+
+def test_matching_etag_returns_304(api):
+    status, etag, body = get(api, '/api/fleet')
+    assert status == 200 and etag == api.etag(api.engine.state_version)
+    assert len(json.loads(body)['servers']) == 20
+
+    status, same_etag, body = get(api, '/api/fleet', etag)
+    assert status == 304 and same_etag == etag and body == b''
+
+
+def test_version_bump_changes_etag(api):
+    _, etag, _ = get(api, '/api/fleet')
+    api.engine.touch_server(api.engine.servers['ID'].iloc[0])
+
+    status, new_etag, body = get(api, '/api/fleet', etag)
+    assert status == 200 and new_etag != etag
+    assert json.loads(body)['version'] == api.engine.state_version
+
+
+def test_server_route_known_and_unknown_id(api):
+    server_id = api.engine.servers['ID'].iloc[3]
+    status, _, body = get(api, f'/api/servers/{server_id}')
+    assert status == 200 and json.loads(body)['server']['ID'] == server_id
+
+    status, _, body = get(api, '/api/servers/NU-EXISTA')
+    assert status == 404 and 'NU-EXISTA' in json.loads(body)['error']
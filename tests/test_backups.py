@@ -0,0 +1,53 @@
+"""Teste pentru BackupManager cu ceas fals (momentele se dau explicit prin `now`):
+retenția orară/zilnică/săptămânală și hard link-urile pentru conținut neschimbat."""
+import os
+
+import pandas as pd
+
+WEEK = 7 * 86400
+START = 1_700_000_000 - 1_700_000_000 % WEEK  # Început de săptămână (și de zi, oră) epoch
+
+
+def make_storage(app, tmp_path, cpu=10.0):
+    storage = app.SQLiteStorage(str(tmp_path / "servers.sqlite"))
+    storage.save(pd.DataFrame({'ID': ['SRV-001', 'SRV-002'], 'CPU_Usage': [cpu, cpu + 1]}))
+    return storage
+
+
+def test_retention_keeps_latest_per_hour_day_and_week(app, tmp_path):
+    storage = make_storage(app, tmp_path)
+    backups = app.BackupManager(storage, str(tmp_path / "backups"),
+                                retention=(('orar', 3600, 3), ('zilnic', 86400, 2), ('săptămânal', WEEK, 2)))
+    created = {}
+    for hour in range(0, 21 * 24, 6):  # O generație la 6 ore, timp de 3 săptămâni
+        entry = backups.create(data_version=1, now=START + hour * 3600)
+        created[hour] = entry['name']
+
+    # Orar: ultimele 3; zilnic: ultima din zilele 20 și 19; săptămânal: ultima din săptămânile 2 și 1
+    expected = {created[hour] for hour in (498, 492, 486, 474, 330)}
+    assert {entry['name'] for entry in backups.generations} == expected
+    assert set(os.listdir(backups.directory)) == expected | {"manifest.json"}
+    assert {entry['name'] for entry in app.BackupManager(storage, backups.directory).generations} == expected
+
+    assert backups.maybe_backup(data_version=1, now=START + 498 * 3600 + 1800) is None  # Sub interval
+    storage.close()
+
+
+def test_unchanged_content_is_hard_linked(app, tmp_path):
+    storage = make_storage(app, tmp_path)
+    backups = app.BackupManager(storage, str(tmp_path / "backups"))
+
+    first = backups.create(data_version=1, now=START)
+    same_version = backups.create(data_version=1, now=START + 3600)
+    same_content = backups.create(data_version=2, now=START + 7200)  # Versiune nouă, aceleași date
+    storage.save(pd.DataFrame({'ID': ['SRV-001', 'SRV-002'], 'CPU_Usage': [50.0, 60.0]}))
+    changed = backups.create(data_version=3, now=START + 10800)
+
+    inode = os.stat(backups.path_of(first)).st_ino
+    assert not first['deduplicated']
+    assert same_version['deduplicated'] and os.stat(backups.path_of(same_version)).st_ino == inode
+    assert same_content['deduplicated'] and os.stat(backups.path_of(same_content)).st_ino == inode
+    assert os.stat(backups.path_of(first)).st_nlink == 3
+    assert not changed['deduplicated'] and os.stat(backups.path_of(changed)).st_ino != inode
+    assert changed['sha256'] != first['sha256']
+    storage.close()
@@ -0,0 +1,74 @@
+"""Teste pentru MetricsHistory: alegerea nivelului, mediile rollup, rotirea
+ring buffer-ului și salvarea/încărcarea .npz fără pickle."""
+import numpy as np
+import pandas as pd
+
+START = 1_700_000_000 - 1_700_000_000 % (4 * 3600)  # Aliniat la toate gălețile
+
+
+def fleet(cpu, status=('up', 'up')):
+    return pd.DataFrame({'ID': ['SRV-001', 'SRV-002'], 'Status': list(status),
+                         'CPU_Usage': cpu, 'RAM_Usage': [50.0, 60.0]})
+
+
+def test_rollup_means_per_bucket(app):
+    history = app.MetricsHistory(initial_servers=4)
+    for offset, cpu in ((0, 10.0), (20, 20.0), (40, 30.0), (60, 40.0), (900, 0.0)):
+        history.record(START + offset, fleet([cpu, 2 * cpu]))
+
+    times, values, tier = history.query('SRV-001', 'CPU_Usage', tier='1m')
+    assert tier == '1m'
+    assert times.tolist() == [START, START + 60]
+    assert values.tolist() == [20.0, 40.0]  # Media găleții [0, 60) și găleata [60, 120)
+
+    times, values, _ = history.query('SRV-002', 'CPU_Usage', tier='15m')
+    assert times.tolist() == [START]
+    assert values.tolist() == [50.0]  # (20 + 40 + 60 + 80) / 4
+    _, online, _ = history.query('SRV-001', 'Online', tier='15m')
+    assert online.tolist() == [1.0]
+
+
+def test_raw_ring_wraps_around(app):
+    history = app.MetricsHistory(initial_servers=4)
+    size = history.tiers['raw']['size']
+    for step in range(size + 10):
+        history.record(START + step, fleet([float(step), 0.0]))
+
+    times, values, _ = history.query('SRV-001', 'CPU_Usage', tier='raw')
+    assert len(values) == size
+    assert values[0] == 10.0 and values[-1] == float(size + 9)  # Cele mai vechi 10 au fost suprascrise
+    assert np.all(np.diff(times) > 0)
+
+
+def test_tier_selection_per_range(app):
+    history = app.MetricsHistory(initial_servers=4)
+    end = START + 26 * 3600
+    for timestamp in range(START, end + 1, 60):
+        history.record(timestamp, fleet([50.0, 50.0]))
+
+    assert history.pick_tier(end - 3600) == 'raw'  # 120 eșantioane la 60 s = 2 h
+    assert history.pick_tier(end - 3 * 3600) == '1m'  # 240 de minute
+    assert history.pick_tier(end - 12 * 3600) == '15m'  # 96 × 15 min = 24 h
+    assert history.pick_tier(end - 25 * 3600) == '4h'
+    _, _, tier = history.query('SRV-001', 'CPU_Usage', start_ts=end - 3 * 3600)
+    assert tier == '1m'
+
+
+def test_npz_round_trip_without_pickle(app, tmp_path):
+    history = app.MetricsHistory(initial_servers=4)
+    for offset in range(0, 1900, 30):
+        history.record(START + offset, fleet([offset / 10, 5.0], status=('up', 'down')))
+    path = str(tmp_path / "metrics_history.npz")
+    history.save(path)
+
+    with np.load(path, allow_pickle=False) as data:
+        assert data['ids'].dtype.kind == 'U'
+    loaded = app.MetricsHistory.load(path)
+    assert loaded.slots == history.slots
+    for tier in ('raw', '1m', '15m'):
+        for server_id in ('SRV-001', 'SRV-002'):
+            for metric in ('CPU_Usage', 'Online'):
+                expected = history.query(server_id, metric, tier=tier)
+                actual = loaded.query(server_id, metric, tier=tier)
+                np.testing.assert_array_equal(actual[0], expected[0])
+                np.testing.assert_array_equal(actual[1], expected[1])
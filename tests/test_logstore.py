@@ -0,0 +1,48 @@
+"""Teste pentru LogStore: recuperarea după scrieri întrerupte și marcajele de trunchiere."""
+
+
+def messages(store, server_id):
+    return [record['m'] for record in store.entries(server_id, 0, store.count(server_id))]
+
+
+def test_torn_last_line_is_truncated(app, tmp_path):
+    directory = str(tmp_path / "logs")
+    store = app.LogStore(directory)
+    store.append("SRV-001", "unu")
+    store.append("SRV-001", "doi")
+    store.close()
+    with open(store.segment_path(1), 'ab') as segment:
+        segment.write(b'{"t": 1, "s": "SRV-0')  # Scriere întreruptă
+
+    store = app.LogStore(directory)
+    assert messages(store, "SRV-001") == ["unu", "doi"]
+    store.append("SRV-001", "trei")
+    store.append("SRV-001", "patru")
+    store.close()
+
+    store = app.LogStore(directory)
+    assert messages(store, "SRV-001") == ["unu", "doi", "trei", "patru"]
+    store.close()
+
+
+def test_truncate_marker_survives_retention(app, tmp_path):
+    directory = str(tmp_path / "logs")
+    store = app.LogStore(directory, segment_max_bytes=200)
+    for i in range(12):
+        store.append("SRV-001", f"vechi {i}")
+    kept = store.count("SRV-001") - 2
+    store.truncate("SRV-001", kept)  # Editorul elimină ultimele două intrări
+    store.append("SRV-001", "nou")
+    expected = messages(store, "SRV-001")
+    assert expected[-2:] == [f"vechi {kept - 1}", "nou"]
+
+    # Retenția șterge segmentele vechi; marcajul nu trebuie să se aplice pe o listă mai scurtă
+    store.max_total_bytes = 400
+    store.apply_retention()
+    retained = messages(store, "SRV-001")
+    assert retained == expected[len(expected) - len(retained):]
+    store.close()
+
+    store = app.LogStore(directory, segment_max_bytes=200)
+    assert messages(store, "SRV-001") == retained
+    store.close()
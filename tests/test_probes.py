@@ -0,0 +1,31 @@
+"""Teste pentru ProbeEngine pe ascultători locali din 127.0.0.0/8."""
+import socket
+
+
+def listen(host):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind((host, 0))
+    except OSError:
+        sock.bind(("127.0.0.1", 0))  # Fără alias-uri 127.0.0.x (ex. macOS)
+    sock.listen(8)
+    return sock
+
+
+def test_probe_local_listeners(app):
+    listeners = [listen(f"127.0.0.{i}") for i in range(1, 6)]
+    closed = listen("127.0.0.1")
+    closed_target = "%s:%d" % closed.getsockname()
+    closed.close()
+    try:
+        engine = app.ProbeEngine(timeout=1.0, jitter=0.1)
+        targets = ["%s:%d" % sock.getsockname() for sock in listeners] + [closed_target]
+        latencies = engine.probe_all(targets)
+    finally:
+        for sock in listeners:
+            sock.close()
+
+    assert all(latency is not None for latency in latencies[:-1])
+    assert latencies[-1] is None
+    assert engine.last_run['hosts'] == 6
+    assert engine.last_run['reachable'] == 5
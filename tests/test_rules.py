@@ -0,0 +1,27 @@
+"""Teste pentru RuleSet: pragurile override-urilor se calculează o dată și se
+refolosesc până când flota sau regulile se schimbă."""
+import numpy as np
+import pandas as pd
+
+
+def test_override_limits_cached_until_invalidated(app):
+    rules = app.RuleSet()
+    rules.rules = rules.compile([{'name': 'cpu', 'metric': 'CPU_Usage', 'raise': 90, 'clear': 85,
+                                  'overrides': [{'match': {'Locatie': ['Rack A*']}, 'raise': 95}]}])
+    rule = rules.rules[0]
+    servers = pd.DataFrame({'ID': ['a', 'b', 'c'], 'Locatie': ['Rack A1', 'Rack B1', 'Rack A2'],
+                            'CPU_Usage': [93.0, 93.0, 96.0]})
+
+    limits = rules.thresholds(rule, servers)
+    assert limits['raise'].tolist() == [95.0, 90.0, 95.0]
+    assert rules.thresholds(rule, servers)['raise'] is limits['raise']  # Fără recalculare la tick
+    assert rules.thresholds(rule, servers, np.array([1, 2]))['raise'].tolist() == [90.0, 95.0]
+
+    servers.loc[1, 'Locatie'] = 'Rack A3'
+    assert rules.thresholds(rule, servers)['raise'].tolist() == [95.0, 90.0, 95.0]  # Încă din cache
+    rules.invalidate_masks()
+    assert rules.thresholds(rule, servers)['raise'].tolist() == [95.0, 95.0, 95.0]
+
+    online = np.ones(3, dtype=bool)
+    (_, breached, _, _), = rules.evaluate(servers, servers['ID'].to_numpy(), {}, online)
+    assert breached.tolist() == [False, False, True]
@@ -0,0 +1,136 @@
+"""Teste pentru stocarea SQLite: jurnalul de modificări trebuie să reconstruiască exact
+tabelul după o oprire înainte de compactare."""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+def make_servers(count):
+    return pd.DataFrame({
+        'ID': [f"SRV-{i:03d}" for i in range(1, count + 1)],
+        'Nume': [f"Server {i}" for i in range(1, count + 1)],
+        'Status': ['up'] * count,
+        'CPU_Usage': [10.0 * i for i in range(1, count + 1)],
+        'UltimaVerificare': [datetime(2024, 1, 1, 12) + timedelta(seconds=i) for i in range(count)],
+    })
+
+
+def test_replay_journal_insert(app, tmp_path):
+    path = str(tmp_path / "servers.sqlite")
+    storage = app.SQLiteStorage(path)
+    base = make_servers(3)
+    storage.save(base)
+
+    added = pd.concat([base, make_servers(5).iloc[3:]], ignore_index=True)
+    added.loc[0, 'CPU_Usage'] = 99.5
+    storage.save_changes(base, added)
+    assert storage.journal_size() > 0
+    storage.close()  # „Oprire” înainte de compactare: rândurile noi există doar în jurnal
+
+    reopened = app.SQLiteStorage(path)
+    loaded = reopened.load()
+    reopened.close()
+    assert loaded['ID'].tolist() == ['SRV-001', 'SRV-002', 'SRV-003', 'SRV-004', 'SRV-005']
+    assert loaded['CPU_Usage'].tolist() == [99.5, 20.0, 30.0, 40.0, 50.0]
+    assert loaded['Nume'].iloc[4] == "Server 5"
+
+
+def test_replay_journal_delete_and_reinsert(app, tmp_path):
+    path = str(tmp_path / "servers.sqlite")
+    storage = app.SQLiteStorage(path)
+    base = make_servers(4)
+    storage.save(base)
+
+    without = base.drop(index=1).reset_index(drop=True)
+    storage.save_changes(base, without)
+    readded = pd.concat([without, base.iloc[[1]]], ignore_index=True)
+    storage.save_changes(without, readded)
+    storage.close()
+
+    reopened = app.SQLiteStorage(path)
+    loaded = reopened.load()
+    reopened.close()
+    assert loaded['ID'].tolist() == ['SRV-001', 'SRV-003', 'SRV-004', 'SRV-002']
+
+
+def test_save_changes_falls_back_to_snapshot(app, tmp_path):
+    path = str(tmp_path / "servers.sqlite")
+    storage = app.SQLiteStorage(path)
+    base = make_servers(2000)
+    storage.save(base)
+
+    few = base.copy()
+    few.loc[:9, 'CPU_Usage'] = 1.5
+    assert storage.save_changes(base, few) == 10
+
+    many = few.copy()
+    many['CPU_Usage'] = many['CPU_Usage'] + 0.5  # Toate rândurile - snapshot-ul e mai ieftin
+    assert storage.save_changes(few, many) is None
+    assert storage.journal_size() == 0
+    loaded = storage.load()
+    storage.close()
+    assert loaded['CPU_Usage'].tolist() == many['CPU_Usage'].tolist()
+
+
+def test_save_marked_journals_only_marked_cells(app, tmp_path):
+    path = str(tmp_path / "servers.sqlite")
+    storage = app.SQLiteStorage(path)
+    base = make_servers(2000)
+    storage.save(base)
+
+    current = base.copy()
+    current.loc[[3, 7], 'CPU_Usage'] = [1.25, float('nan')]
+    current.loc[5, 'Nume'] = "Server redenumit"  # Nemarcată - nu trebuie jurnalizată
+    current['UltimaVerificare'] = datetime(2024, 2, 1)
+    changes = app.ChangeSet()
+    changes.mark(['SRV-004', 'SRV-008'], ['CPU_Usage'])
+    changes.mark_column('UltimaVerificare')
+    assert storage.save_marked(current, changes) == 3  # Două celule + o coloană uniformă
+
+    current = current.drop(index=0).reset_index(drop=True)
+    current = pd.concat([current, make_servers(2001).iloc[[2000]]], ignore_index=True)
+    changes = app.ChangeSet()
+    changes.mark_delete('SRV-001')
+    changes.mark_insert('SRV-2001')
+    storage.save_marked(current, changes)
+    storage.close()
+
+    reopened = app.SQLiteStorage(path)
+    loaded = reopened.load()
+    reopened.close()
+    expected = current.astype({'ID': object, 'Nume': object, 'Status': object,
+                               'UltimaVerificare': 'datetime64[ns]'})
+    expected.loc[4, 'Nume'] = "Server 6"
+    pd.testing.assert_frame_equal(loaded, expected)
+
+
+def test_load_converts_legacy_row_snapshot(app, tmp_path):
+    path = str(tmp_path / "servers.sqlite")
+    base = make_servers(3)
+    # Format vechi: snapshot pe rânduri în tabela `servers`
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE _columns (position INTEGER PRIMARY KEY, name TEXT, kind TEXT)")
+    conn.executemany("INSERT INTO _columns VALUES (?, ?, ?)",
+                     [(0, 'ID', 'text'), (1, 'Nume', 'text'), (2, 'Status', 'text'),
+                      (3, 'CPU_Usage', 'float'), (4, 'UltimaVerificare', 'datetime')])
+    conn.execute('CREATE TABLE servers ("ID" TEXT, "Nume" TEXT, "Status" TEXT, '
+                 '"CPU_Usage" REAL, "UltimaVerificare" INTEGER)')
+    conn.executemany("INSERT INTO servers VALUES (?, ?, ?, ?, ?)",
+                     [(row.ID, row.Nume, row.Status, row.CPU_Usage, row.UltimaVerificare.value)
+                      for row in base.itertuples()])
+    conn.commit()
+    conn.close()
+
+    storage = app.SQLiteStorage(path)
+    assert storage.exists()
+    loaded = storage.load()
+    assert loaded['ID'].tolist() == base['ID'].tolist()
+    assert loaded['CPU_Usage'].tolist() == base['CPU_Usage'].tolist()
+    assert loaded['UltimaVerificare'].tolist() == base['UltimaVerificare'].tolist()
+
+    storage.save(loaded)  # Compactarea trece snapshot-ul pe coloane
+    tables = {name for name, in storage.conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert 'servers' not in tables
+    pd.testing.assert_frame_equal(storage.load(), loaded)
+    storage.close()
@@ -0,0 +1,57 @@
+"""Teste pentru înregistrare și redare: TraceRecorder scrie cadrele unei flote
+generate (FleetGenerator), FleetTrace le recitește, iar aplicarea lor pe o copie a
+flotei inițiale trebuie să refacă exact fiecare pas înregistrat."""
+import shutil
+
+import numpy as np
+import pandas as pd
+
+
+def trace_columns(app, servers):
+    """Coloanele înregistrate, cu float-urile rotunjite ca în FleetTrace.encode"""
+    frame = servers[list(app.FleetTrace.COLUMNS)].copy()
+    for column in frame.columns:
+        if frame[column].dtype.kind == 'f':
+            frame[column] = np.round(frame[column].to_numpy(), 2)
+    return frame.reset_index(drop=True)
+
+
+def test_record_save_load_replay_round_trip(app, tmp_path, monkeypatch):
+    recorded_dir = tmp_path / "record"
+    replay_dir = tmp_path / "replay"
+    recorded_dir.mkdir()
+    replay_dir.mkdir()
+    storage = app.SQLiteStorage(str(recorded_dir / app.MonitoringEngine.DB_FILE))
+    storage.save(app.FleetGenerator(seed=11).generate(40))
+    storage.close()
+    shutil.copy(recorded_dir / app.MonitoringEngine.DB_FILE, replay_dir / app.MonitoringEngine.DB_FILE)
+    trace_path = str(tmp_path / "fleet.jsonl.gz")
+
+    # Înregistrare: câteva tick-uri simulate, fiecare urmat de un cadru
+    monkeypatch.chdir(recorded_dir)
+    recorder_engine = app.MonitoringEngine(record_trace=trace_path)
+    recorder_engine.rng = np.random.default_rng(5)
+    expected = [trace_columns(app, recorder_engine.servers)]
+    for _ in range(6):
+        recorder_engine.simulate_monitoring_tick()
+        recorder_engine.recorder.record()
+        expected.append(trace_columns(app, recorder_engine.servers))
+    frame_count = recorder_engine.recorder.frames
+    recorder_engine.shutdown()
+
+    trace = app.FleetTrace(trace_path)
+    frames = list(trace.frames())
+    assert trace.header['servers'] == 40
+    assert len(frames) == frame_count == len(expected)
+    assert len(frames[0][1]) == 40  # Primul cadru conține toată flota
+    assert all(len(ids) < 40 for _, ids, _ in frames[1:])  # Restul doar rândurile schimbate
+    assert [offset for offset, _, _ in frames] == sorted(offset for offset, _, _ in frames)
+
+    # Redare cadru cu cadru pe flota inițială, într-un alt director
+    monkeypatch.chdir(replay_dir)
+    replay_engine = app.MonitoringEngine(replay=trace_path, replay_speed=0)
+    for (_, ids, values), state in zip(frames, expected):
+        applied, _ = replay_engine.apply_trace_frame(ids, values)
+        assert applied == len(ids)
+        pd.testing.assert_frame_equal(trace_columns(app, replay_engine.servers), state, check_dtype=False)
+    replay_engine.shutdown()